@@ -287,6 +287,10 @@ project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
 if __name__ == "__main__":
+    # Required for the parser's process pool in frozen (PyInstaller) builds
+    import multiprocessing
+    multiprocessing.freeze_support()
+
     print("="*60)
     print("RenLocalizer V2 Starting...")
     print("="*60)
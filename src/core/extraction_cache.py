@@ -0,0 +1,558 @@
+"""
+Persistent per-file extraction cache for RenLocalizer.
+
+Parsing a large game from scratch takes minutes, yet most runs (a second
+target language, a small patch to the game, re-opening the same project in
+the GUI) touch files that did not change since the previous scan. Results of
+``RenPyParser.extract_text_entries``, ``RenPyParser.deep_scan_strings`` and
+``rpyc_reader.extract_texts_from_rpyc`` are therefore stored on disk, in one
+SQLite database per project, so the GUI scan and the translation pipeline
+read what the other one extracted.
+
+A record is valid for a file when:
+- size and mtime still match (fast path, no read), or
+- the SHA-1 of the content still matches (file was touched but not changed).
+
+Records also keep the encoding a legacy (non UTF-8) file was decoded with,
+so a changed file tries it before running chardet again.
+
+Every cached result is additionally keyed by the extractor kind, the parser
+version and a fingerprint of the ``TranslationSettings`` type filters, so
+toggling e.g. ``translate_ui`` never returns stale entries. Text, type and
+line number are columns of their own, so reports are queries over the store
+(see ``iter_project_texts``) rather than a rewrite of in-memory lists.
+
+Extractors whose output depends only on the file content (compiled .rpyc
+scripts) can also use the shared content store (``lookup_content`` /
+``store_content``). It is keyed by a hash of the content, not by path, so
+byte-identical files (``renpy/common`` copies, bundled UI frameworks, an
+updated game with mostly unchanged scripts) are decoded once per machine.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import sys
+import threading
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
+
+from .parser import _project_key, settings_fingerprint
+
+try:
+    from ..version import VERSION as _APP_VERSION
+except ImportError:  # Loaded outside the src package (tools/ scripts)
+    _APP_VERSION = "0"
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever the output of an extractor changes for the same input so old
+# records are ignored instead of being served.
+EXTRACTION_CACHE_VERSION = 3
+PARSER_VERSION = f"{_APP_VERSION}+{EXTRACTION_CACHE_VERSION}"
+
+# Result sets kept per file (different filter fingerprints / extractor kinds).
+MAX_RESULTS_PER_FILE = 8
+
+# Entry fields that carry the path of the source file; rewritten on a hit so
+# callers get the path in the same form they passed it.
+_PATH_FIELDS = ('file_path', 'source_file')
+
+# Proje veritabanları cache klasörünün altında (oyun klasörüne hiçbir şey yazılmaz)
+STORE_SUBDIR = "projects"
+# Another process (parser worker, GUI + pipeline) may hold the write lock briefly
+STORE_BUSY_TIMEOUT = 30.0
+
+# İçerik adresli, tüm projelerin paylaştığı veritabanı (cache klasörünün kökünde)
+SHARED_STORE_NAME = "shared.sqlite"
+# Content records kept in the shared store; the oldest are dropped first
+MAX_SHARED_RESULTS = 20000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    version TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    sha1 TEXT NOT NULL,
+    encoding TEXT
+);
+CREATE TABLE IF NOT EXISTS results (
+    path TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    stored INTEGER NOT NULL,
+    PRIMARY KEY (path, kind, fingerprint)
+);
+CREATE TABLE IF NOT EXISTS entries (
+    path TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    text TEXT,
+    text_type TEXT,
+    line_number INTEGER,
+    data TEXT NOT NULL,
+    PRIMARY KEY (path, kind, fingerprint, position)
+);
+"""
+
+
+_SHARED_SCHEMA = """
+CREATE TABLE IF NOT EXISTS content (
+    kind TEXT NOT NULL,
+    digest TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    version TEXT NOT NULL,
+    stored INTEGER NOT NULL,
+    data BLOB NOT NULL,
+    PRIMARY KEY (kind, digest, fingerprint)
+);
+CREATE INDEX IF NOT EXISTS content_stored ON content (stored);
+"""
+
+
+def default_cache_dir() -> Path:
+    """Return the per-user folder used for extraction records."""
+    if os.name == "nt":
+        base = Path(os.getenv("LOCALAPPDATA", Path.home()))
+    elif sys.platform == "darwin":
+        base = Path.home() / "Library" / "Application Support"
+    else:
+        base = Path(os.getenv("XDG_CACHE_HOME", Path.home() / ".cache"))
+    return base / "RenLocalizer" / "extraction_cache"
+
+
+def kind_fingerprints(config_manager=None) -> Dict[str, str]:
+    """
+    Fingerprint each extractor kind stores its results under.
+
+    .rpy results depend on the type filters; RPYC results are read from the
+    AST and always use the default fingerprint (see ``rpyc_reader._rpyc_records``).
+    """
+    fingerprint = settings_fingerprint(config_manager)
+    return {'entries': fingerprint, 'deep_scan': fingerprint, 'rpyc': settings_fingerprint(None)}
+
+
+def _hash_file(path: Path) -> str:
+    digest = hashlib.sha1()
+    with open(path, 'rb') as handle:
+        for chunk in iter(lambda: handle.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ExtractionCache:
+    """
+    On-disk store of extraction results, one SQLite database per project.
+
+    A file belongs to the project that holds its ``game/`` folder (its own
+    folder otherwise). Every ``store`` is one transaction, so parser worker
+    processes and the GUI can share the databases.
+    """
+
+    def __init__(self, cache_dir: Optional[Union[str, Path]] = None):
+        self.cache_dir = Path(cache_dir) if cache_dir else default_cache_dir()
+        self.hits = 0
+        self.misses = 0
+        self.shared_hits = 0  # Project-store misses answered by the shared content store
+        # path -> (size, mtime_ns, sha1) validated during this process
+        self._validated: Dict[str, tuple] = {}
+        # path -> legacy encoding detected while parsing, saved with the next record
+        self._encodings: Dict[str, str] = {}
+        # project key -> open connection (owned by the process in _owner_pid)
+        self._connections: Dict[str, sqlite3.Connection] = {}
+        self._owner_pid = os.getpid()
+        # Connections inherited through fork; kept referenced so they are never closed here
+        self._inherited: List[sqlite3.Connection] = []
+        self._lock = threading.RLock()
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+    def lookup(self, file_path: Union[str, Path], kind: str, fingerprint: str) -> Optional[List[Dict[str, Any]]]:
+        """Return cached entries for ``file_path`` or ``None`` when it must be re-parsed."""
+        key = self._path_key(file_path)
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+
+        with self._lock:
+            db = self._store(key)
+            if db is None:
+                return None
+            try:
+                record = db.execute(
+                    "SELECT version, size, mtime_ns, sha1 FROM files WHERE path = ?", (key,)
+                ).fetchone()
+                has_result = record is not None and db.execute(
+                    "SELECT 1 FROM results WHERE path = ? AND kind = ? AND fingerprint = ?",
+                    (key, kind, fingerprint),
+                ).fetchone() is not None
+            except sqlite3.Error as exc:
+                logger.debug("Extraction store lookup failed for %s: %s", file_path, exc)
+                return None
+        if record is None or record[0] != PARSER_VERSION or not has_result:
+            self._count(hit=False)
+            return None
+
+        _, size, mtime_ns, sha1 = record
+        if size != stat.st_size or mtime_ns != stat.st_mtime_ns:
+            # Touched but maybe not changed: fall back to the content hash
+            if size != stat.st_size:
+                self._count(hit=False)
+                return None
+            try:
+                content_hash = _hash_file(Path(file_path))
+            except OSError:
+                return None
+            if content_hash != sha1:
+                self._count(hit=False)
+                return None
+            self._execute(key, "UPDATE files SET mtime_ns = ? WHERE path = ?", (stat.st_mtime_ns, key))
+
+        with self._lock:
+            try:
+                rows = db.execute(
+                    "SELECT data FROM entries WHERE path = ? AND kind = ? AND fingerprint = ? ORDER BY position",
+                    (key, kind, fingerprint),
+                ).fetchall()
+            except sqlite3.Error as exc:
+                logger.debug("Extraction store lookup failed for %s: %s", file_path, exc)
+                return None
+            self._validated[key] = (stat.st_size, stat.st_mtime_ns, sha1)
+        self._count(hit=True)
+        entries = [json.loads(data) for (data,) in rows]
+        path_str = str(file_path)
+        for entry in entries:
+            for field in _PATH_FIELDS:
+                if field in entry:
+                    entry[field] = path_str
+        return entries
+
+    def store(self, file_path: Union[str, Path], kind: str, fingerprint: str, entries: List[Dict[str, Any]]) -> None:
+        """Save freshly extracted entries for ``file_path``."""
+        key = self._path_key(file_path)
+        try:
+            stat = os.stat(file_path)
+            with self._lock:
+                known = self._validated.get(key)
+            if known and known[0] == stat.st_size and known[1] == stat.st_mtime_ns:
+                content_hash = known[2]
+            else:
+                content_hash = _hash_file(Path(file_path))
+        except OSError as exc:
+            logger.debug("Extraction cache skipped %s: %s", file_path, exc)
+            return
+
+        # Entries may be TextEntry mappings; rows hold plain JSON objects
+        rows = []
+        for position, entry in enumerate(entries):
+            entry = dict(entry)
+            rows.append((
+                key, kind, fingerprint, position,
+                entry.get('text'), entry.get('text_type'), entry.get('line_number'),
+                json.dumps(entry, ensure_ascii=False),
+            ))
+
+        with self._lock:
+            encoding = self._encodings.pop(key, None)
+            db = self._store(key)
+            if db is None:
+                return
+            try:
+                with db:
+                    record = db.execute(
+                        "SELECT version, sha1, encoding FROM files WHERE path = ?", (key,)
+                    ).fetchone()
+                    if record is None or record[0] != PARSER_VERSION or record[1] != content_hash:
+                        # Content or parser changed: every older result set is stale
+                        db.execute("DELETE FROM results WHERE path = ?", (key,))
+                        db.execute("DELETE FROM entries WHERE path = ?", (key,))
+                    if not encoding and record is not None:
+                        encoding = record[2]
+                    db.execute(
+                        "INSERT OR REPLACE INTO files (path, version, size, mtime_ns, sha1, encoding) "
+                        "VALUES (?, ?, ?, ?, ?, ?)",
+                        (key, PARSER_VERSION, stat.st_size, stat.st_mtime_ns, content_hash, encoding),
+                    )
+                    db.execute(
+                        "DELETE FROM entries WHERE path = ? AND kind = ? AND fingerprint = ?",
+                        (key, kind, fingerprint),
+                    )
+                    stored = db.execute(
+                        "SELECT COALESCE(MAX(stored), 0) + 1 FROM results WHERE path = ?", (key,)
+                    ).fetchone()[0]
+                    db.execute(
+                        "INSERT OR REPLACE INTO results (path, kind, fingerprint, stored) VALUES (?, ?, ?, ?)",
+                        (key, kind, fingerprint, stored),
+                    )
+                    db.executemany(
+                        "INSERT INTO entries (path, kind, fingerprint, position, text, text_type, line_number, data) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                        rows,
+                    )
+                    self._prune_results(db, key)
+            except sqlite3.Error as exc:
+                logger.debug("Could not write cache record for %s: %s", key, exc)
+                return
+            self._validated[key] = (stat.st_size, stat.st_mtime_ns, content_hash)
+
+    def lookup_content(self, kind: str, digest: str, fingerprint: str) -> Optional[List[Any]]:
+        """Rows stored for content ``digest`` by any project, or ``None``."""
+        with self._lock:
+            db = self._shared_store()
+            if db is None:
+                return None
+            try:
+                row = db.execute(
+                    "SELECT version, data FROM content WHERE kind = ? AND digest = ? AND fingerprint = ?",
+                    (kind, digest, fingerprint),
+                ).fetchone()
+            except sqlite3.Error as exc:
+                logger.debug("Shared store lookup failed for %s: %s", digest, exc)
+                return None
+        if row is None or row[0] != PARSER_VERSION:
+            return None
+        try:
+            rows = json.loads(zlib.decompress(row[1]))
+        except (zlib.error, ValueError) as exc:
+            logger.debug("Shared store record %s unreadable: %s", digest, exc)
+            return None
+        with self._lock:
+            self.shared_hits += 1
+        return rows
+
+    def store_content(self, kind: str, digest: str, fingerprint: str, rows: List[Any]) -> None:
+        """Save JSON-serializable ``rows`` for content ``digest`` in the shared store."""
+        data = zlib.compress(json.dumps(rows, ensure_ascii=False, separators=(',', ':')).encode('utf-8'))
+        with self._lock:
+            db = self._shared_store()
+            if db is None:
+                return
+            try:
+                with db:
+                    stored = db.execute("SELECT COALESCE(MAX(stored), 0) + 1 FROM content").fetchone()[0]
+                    db.execute(
+                        "INSERT OR REPLACE INTO content (kind, digest, fingerprint, version, stored, data) "
+                        "VALUES (?, ?, ?, ?, ?, ?)",
+                        (kind, digest, fingerprint, PARSER_VERSION, stored, sqlite3.Binary(data)),
+                    )
+                    db.execute("DELETE FROM content WHERE stored <= ?", (stored - MAX_SHARED_RESULTS,))
+            except sqlite3.Error as exc:
+                logger.debug("Could not write shared record %s: %s", digest, exc)
+
+    def encoding_hint(self, file_path: Union[str, Path]) -> Optional[str]:
+        """Encoding the file was decoded with last time, even if it changed since."""
+        key = self._path_key(file_path)
+        with self._lock:
+            encoding = self._encodings.get(key)
+            if encoding:
+                return encoding
+            db = self._store(key)
+            if db is None:
+                return None
+            try:
+                row = db.execute("SELECT encoding FROM files WHERE path = ?", (key,)).fetchone()
+            except sqlite3.Error:
+                return None
+        return row[0] if row else None
+
+    def note_encoding(self, file_path: Union[str, Path], encoding: str) -> None:
+        """Remember a detected legacy encoding; written with the next ``store``."""
+        with self._lock:
+            self._encodings[self._path_key(file_path)] = encoding
+
+    def iter_project_texts(
+        self,
+        root: Union[str, Path],
+        fingerprint: Union[str, Mapping[str, str]],
+        kinds: Iterable[str] = ('entries', 'deep_scan', 'rpyc'),
+    ) -> Iterator[Tuple[str, Optional[int], Optional[str], Optional[str]]]:
+        """
+        ``(file_path, line_number, text_type, text)`` of the stored results under ``root``.
+
+        ``fingerprint`` is one settings fingerprint for every kind, or a
+        ``kind -> fingerprint`` mapping (see ``kind_fingerprints``); kinds
+        missing from the mapping are skipped.
+
+        Only results that are still valid are returned: current parser version
+        and a file whose size and mtime match the record. Rows come file by file
+        (sorted by path), then in ``kinds`` order, then in extraction order.
+        """
+        prefix = self._path_key(root).rstrip(os.sep) + os.sep
+        if isinstance(fingerprint, str):
+            queries = [(kind, fingerprint) for kind in kinds]
+        else:
+            queries = [(kind, fingerprint[kind]) for kind in kinds if kind in fingerprint]
+        key = self._path_key(os.path.join(str(root), 'x'))
+        with self._lock:
+            db = self._store(key)
+            if db is None:
+                return
+            try:
+                files = db.execute(
+                    "SELECT path, size, mtime_ns FROM files WHERE version = ? AND substr(path, 1, ?) = ? "
+                    "ORDER BY path",
+                    (PARSER_VERSION, len(prefix), prefix),
+                ).fetchall()
+            except sqlite3.Error as exc:
+                logger.debug("Extraction store query failed for %s: %s", root, exc)
+                return
+
+        for path, size, mtime_ns in files:
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            if stat.st_size != size or stat.st_mtime_ns != mtime_ns:
+                continue
+            for kind, kind_fingerprint in queries:
+                with self._lock:
+                    try:
+                        rows = db.execute(
+                            "SELECT line_number, text_type, text FROM entries "
+                            "WHERE path = ? AND kind = ? AND fingerprint = ? ORDER BY position",
+                            (path, kind, kind_fingerprint),
+                        ).fetchall()
+                    except sqlite3.Error as exc:
+                        # Kilitli/meşgul depo: bu dosyanın bu türü atlanır, rapor kalanla devam eder
+                        logger.debug("Extraction store query failed for %s (%s): %s", path, kind, exc)
+                        continue
+                for line_number, text_type, text in rows:
+                    yield path, line_number, text_type, text
+
+    def clear(self) -> int:
+        """Delete every stored project; returns the number of removed databases."""
+        removed = 0
+        with self._lock:
+            for db in self._connections.values():
+                try:
+                    db.close()
+                except sqlite3.Error:
+                    pass
+            self._connections.clear()
+            self._validated.clear()
+            self._encodings.clear()
+        if not self.cache_dir.is_dir():
+            return 0
+        # JSON records of earlier versions are removed as well
+        store_files = (
+            list(self.cache_dir.glob(f'{STORE_SUBDIR}/*.sqlite*'))
+            + list(self.cache_dir.glob(f'{SHARED_STORE_NAME}*'))
+            + list(self.cache_dir.glob('*/*.json'))
+        )
+        for store_file in store_files:
+            try:
+                store_file.unlink()
+                if store_file.suffix in ('.sqlite', '.json'):
+                    removed += 1
+            except OSError:
+                continue
+        return removed
+
+    def stats(self) -> Dict[str, int]:
+        return {'hits': self.hits, 'misses': self.misses}
+
+    # ------------------------------------------------------------------
+    # Storage helpers
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _path_key(file_path: Union[str, Path]) -> str:
+        return os.path.normcase(os.path.abspath(str(file_path)))
+
+    def _store_path(self, project: str) -> Path:
+        digest = hashlib.sha1(project.encode('utf-8', 'surrogatepass')).hexdigest()
+        return self.cache_dir / STORE_SUBDIR / f"{digest}.sqlite"
+
+    def _store(self, key: str) -> Optional[sqlite3.Connection]:
+        """Connection to the database of the project ``key`` belongs to (caller holds _lock)."""
+        project = _project_key(key)
+        return self._connection(project, self._store_path(project), _SCHEMA)
+
+    def _shared_store(self) -> Optional[sqlite3.Connection]:
+        """Connection to the content-addressed store shared by all projects (caller holds _lock)."""
+        # Boş anahtar hiçbir proje yoluyla çakışmaz
+        return self._connection('', self.cache_dir / SHARED_STORE_NAME, _SHARED_SCHEMA)
+
+    def _connection(self, name: str, store_path: Path, schema: str) -> Optional[sqlite3.Connection]:
+        if os.getpid() != self._owner_pid:
+            # Forked worker: connections of the parent must not be used (or closed) here
+            self._inherited.extend(self._connections.values())
+            self._connections = {}
+            self._owner_pid = os.getpid()
+        db = self._connections.get(name)
+        if db is not None:
+            return db
+        try:
+            store_path.parent.mkdir(parents=True, exist_ok=True)
+            db = sqlite3.connect(str(store_path), timeout=STORE_BUSY_TIMEOUT, check_same_thread=False)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            db.executescript(schema)
+        except (OSError, sqlite3.Error) as exc:
+            logger.debug("Cannot open extraction store %s: %s", store_path, exc)
+            return None
+        self._connections[name] = db
+        return db
+
+    def _execute(self, key: str, sql: str, params: tuple) -> None:
+        with self._lock:
+            db = self._store(key)
+            if db is None:
+                return
+            try:
+                with db:
+                    db.execute(sql, params)
+            except sqlite3.Error as exc:
+                logger.debug("Extraction store update failed for %s: %s", key, exc)
+
+    @staticmethod
+    def _prune_results(db: sqlite3.Connection, key: str) -> None:
+        stale = db.execute(
+            "SELECT kind, fingerprint FROM results WHERE path = ? ORDER BY stored DESC LIMIT -1 OFFSET ?",
+            (key, MAX_RESULTS_PER_FILE),
+        ).fetchall()
+        for kind, fingerprint in stale:
+            db.execute("DELETE FROM results WHERE path = ? AND kind = ? AND fingerprint = ?", (key, kind, fingerprint))
+            db.execute("DELETE FROM entries WHERE path = ? AND kind = ? AND fingerprint = ?", (key, kind, fingerprint))
+
+    def _count(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+
+_CACHES: Dict[str, ExtractionCache] = {}
+_CACHES_LOCK = threading.Lock()
+
+
+def get_extraction_cache(config_manager=None) -> Optional[ExtractionCache]:
+    """
+    Return the shared cache configured in ``app_settings`` or ``None``.
+
+    Parsers created without a config manager (library use, tests) do not
+    touch the disk.
+    """
+    if config_manager is None:
+        return None
+    app_settings = getattr(config_manager, 'app_settings', None)
+    if app_settings is None or not getattr(app_settings, 'extraction_cache_enabled', True):
+        return None
+    custom_dir = (getattr(app_settings, 'extraction_cache_dir', '') or '').strip()
+    cache_dir = Path(custom_dir) if custom_dir else default_cache_dir()
+    cache_key = os.path.normcase(os.path.abspath(str(cache_dir)))
+    with _CACHES_LOCK:
+        cache = _CACHES.get(cache_key)
+        if cache is None:
+            cache = ExtractionCache(cache_dir)
+            _CACHES[cache_key] = cache
+        return cache
@@ -252,89 +252,10 @@ class RenPyOutputFormatter:
         Check if a text should be skipped from translation output.
         Returns True if the text is a technical term, file path, or identifier.
         This is a SAFETY NET - parser should have already filtered most of these.
-        Uses pre-compiled regex patterns for performance.
+        The rules use the tables above and are memoized in parser.is_output_technical.
         """
-        text_strip = text.strip()
-        text_lower = text_strip.lower()
-        
-        # Skip empty text
-        if not text_strip:
-            return True
-        
-        # Skip Python format strings like {:,}, {:3d}, {}, {}Attitude:{} {}
-        # These are used for number/string formatting and should not be translated
-        if '{' in text_strip:
-            # Count format placeholders using cached regex
-            format_count = len(self._FORMAT_PLACEHOLDER_RE.findall(text_strip))
-            if format_count >= 1:
-                # Remove format placeholders and check remaining content
-                remaining = self._FORMAT_PLACEHOLDER_RE.sub('', text_strip).strip()
-                # If remaining has no meaningful letters, skip
-                if not re.search(r'[a-zA-ZçğıöşüÇĞIİÖŞÜа-яА-Яа-яА-Я]{3,}', remaining):
-                    return True
-                # If format placeholders dominate the string, skip
-                if format_count >= 2 and len(remaining) < 10:
-                    return True
-        
-        # Skip file names/paths (fonts, images, audio, etc.)
-        if any(text_lower.endswith(ext) for ext in self.SKIP_FILE_EXTENSIONS):
-            return True
-        
-        # Skip paths starting with common folder names
-        if text_strip.startswith(('fonts/', 'images/', 'audio/', 'music/', 'sounds/', 
-                                   'gui/', 'screens/', 'script/', 'game/', 'tl/')):
-            return True
-        
-        # Skip paths with slashes (file paths like "fonts/something.otf")
-        if '/' in text_strip and ' ' not in text_strip:
-            if self._FILE_PATH_SLASH_RE.match(text_strip):
-                return True
-        
-        # Skip backslash paths (Windows style)
-        if '\\' in text_strip and ' ' not in text_strip:
-            if self._FILE_PATH_BACKSLASH_RE.match(text_strip):
-                return True
-        
-        # Skip URLs (using cached pattern)
-        if self._URL_RE.match(text_lower):
-            return True
-        
-        # Skip hex color codes (using cached pattern)
-        if self._HEX_COLOR_RE.match(text_strip):
-            return True
-        
-        # Skip pure numbers (using cached pattern)
-        if self._NUMBER_RE.match(text_strip):
-            return True
-        
-        # Skip Ren'Py technical terms - ONLY exact lowercase match
-        # "history" -> skip, "History" -> translate (UI label)
-        if text_strip in self.RENPY_TECHNICAL_TERMS:
-            return True
-        
-        # Skip snake_case identifiers (using cached pattern)
-        if self._SNAKE_CASE_RE.match(text_strip):
-            return True
-        
-        # Skip SCREAMING_SNAKE_CASE constants (using cached pattern)
-        if self._SCREAMING_SNAKE_RE.match(text_strip):
-            return True
-        
-        # Skip save identifiers like "GameName-1234567890" (using cached pattern)
-        if self._GAME_SAVE_ID_RE.match(text_strip):
-            return True
-        
-        # Skip version strings (using cached pattern)
-        if self._VERSION_RE.match(text_lower):
-            return True
-        
-        # Skip if it's just Ren'Py tags/variables with no actual text
-        stripped_of_tags = self._TAG_RE.sub('', text_strip)
-        stripped_of_vars = self._VARIABLE_RE.sub('', stripped_of_tags)
-        if not stripped_of_vars.strip():
-            return True
-        
-        return False
+        from .parser import is_output_technical
+        return is_output_technical(text)
     
     def sanitize_translation_id(self, text: str) -> str:
         """Create a valid Ren'Py translation ID from text."""
@@ -560,7 +481,9 @@ class RenPyOutputFormatter:
             translated_text = result.translated_text
             
             # CRITICAL: Skip technical content that should not be translated
-            if self._should_skip_translation(original_text):
+            # (unless the parser already classified this entry as translatable)
+            metadata = getattr(result, 'metadata', None) or {}
+            if not metadata.get('translatable') and self._should_skip_translation(original_text):
                 self.logger.debug(f"Skipping technical content: {original_text[:50]}...")
                 continue
             
@@ -8,16 +8,28 @@ which strings should be translated and which ones belong to technical code.
 from __future__ import annotations
 
 import asyncio
+import bisect
+import functools
+import hashlib
 import json
 import logging
+import os
 import re
+import sys
+import threading
 import xml.etree.ElementTree as ET
+from collections.abc import MutableMapping
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple, Union
+from types import MappingProxyType
+from typing import Any, Collection, Dict, Iterable, Iterator, List, Mapping, Optional, Set, Tuple, Union
 
 import chardet
+import codecs
 import configparser
+import fnmatch
 import yaml
 
 # Module-level defaults for datasets / whitelist for rpyc reader import
@@ -34,6 +46,642 @@ DATA_KEY_WHITELIST = {
 }
 
 
+# ========== LINE DISPATCH ==========
+# Every registry pattern is anchored at the start of the line, so the first word
+# (after indentation and an optional "$ ") decides which patterns can match.
+# Pattern 'lead' sets use these markers besides plain words ("$renpy" = after "$ ").
+LEAD_ANY_WORD = '*'   # any identifier: character names, variables, ...
+LEAD_QUOTE = '"'      # line starts with a string literal (' or ")
+STRING_PREFIXES = 'rRuUbBfF'
+_LINE_HEAD_RE = re.compile(r'\s*(?P<dollar>\$\s+)?(?:(?P<word>[A-Za-z_]\w*)|(?P<quote>["\']))?')
+
+# ========== DEEP SCAN PATTERNS ==========
+# Tüm string literal'leri yakalayan regex (tek/çift tırnak, escape, r/u/b/f prefix)
+_DEEP_STRING_LITERAL_RE = re.compile(
+    r'''(?P<quote>(?:[rRuUbBfF]{,2})?(?:"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*'))'''
+)
+# Triple-quoted stringler (çok satırlı - tüm dosyada aranır)
+_DEEP_TRIPLE_QUOTE_RE = re.compile(
+    r'''(?P<triple>(?:[rRuUbBfF]{,2})?(?:"""[\s\S]*?"""|\'\'\'[\s\S]*?\'\'\'))'''
+)
+# Key-value eşleştirmesi
+_DEEP_KEY_CAPTURE_RE = re.compile(r'(?:["\']?(\w+)["\']?\s*[:=]\s*)$')
+# Assignment detection (var = value)
+_DEEP_ASSIGNMENT_RE = re.compile(r'([a-zA-Z_]\w*)\s*=\s*')
+# join call detection ("delimiter".join([...]) )
+_DEEP_JOIN_CALL_RE = re.compile(r'(?P<delim>"[^"]*"|\'[^\']*\')\s*\.\s*join\s*\(')
+# List/tuple/dict context: items = [ / items += ( / items.append(
+_DEEP_LIST_CONTEXT_RE = re.compile(
+    r'([a-zA-Z_]\w*)\s*(?:=\s*[\[\(\{]|\+=\s*[\[\(]|\.(?:append|extend|insert)\s*\()'
+)
+
+# ========== LONG LINE GUARD ==========
+# "(?:[^"\\]|\\.)*" kalıpları, kapanmayan bir tırnaktan başlayınca satır sonuna
+# kadar tarar; \([^)]* ve finditer her tırnağı yeniden denediği için minify
+# edilmiş / üretilmiş uzun satırlarda süre karesel büyür. Eşiği aşan satırlarda
+# hiçbir string'i kapatamayacak tırnaklar önce doğrusal bir taramayla maskelenir;
+# eşleşmeler aynı kalır, grup değerleri orijinal satırdan alınır.
+LONG_LINE_THRESHOLD = 2000
+_QUOTE_MASK = '\x00'
+# Tırnak + önündeki ters bölü dizisi (lookbehind: dizinin ortasından başlamaz)
+_QUOTE_RUN_RE = re.compile(r'(?<!\\)(\\*)(["\'])')
+
+
+def mask_dangling_quotes(line: str) -> str:
+    """
+    Replace quotes that can never close a string literal with ``_QUOTE_MASK``.
+
+    A quote is escaped when an odd number of backslashes precede it. A string
+    opened at any quote closes at the next unescaped quote of the same kind,
+    so only escaped quotes after the last unescaped one of their kind are
+    dangling. Those are exactly the starts the quoted-string patterns retry
+    to the end of the line; every other character keeps its position, so
+    match spans are valid for the original line. Returns ``line`` itself when
+    nothing needs masking.
+    """
+    last_unescaped = {'"': -1, "'": -1}
+    quotes: List[Tuple[int, str]] = []
+    for match in _QUOTE_RUN_RE.finditer(line):
+        quote = match.group(2)
+        position = match.start(2)
+        if len(match.group(1)) % 2 == 0:
+            last_unescaped[quote] = position
+        quotes.append((position, quote))
+
+    dangling = [position for position, quote in quotes if position > last_unescaped[quote]]
+    if not dangling:
+        return line
+    chars = list(line)
+    for position in dangling:
+        chars[position] = _QUOTE_MASK
+    return ''.join(chars)
+
+
+class _UnmaskedMatch:
+    """Match on a masked line whose groups are read from the original line."""
+
+    __slots__ = ('_match', '_line')
+
+    def __init__(self, match: re.Match, line: str):
+        self._match = match
+        self._line = line
+
+    def group(self, name: Union[int, str] = 0) -> Optional[str]:
+        start, end = self._match.span(name)
+        return None if start < 0 else self._line[start:end]
+
+    def groupdict(self) -> Dict[str, Optional[str]]:
+        return {name: self.group(name) for name in self._match.re.groupindex}
+
+    def start(self, name: Union[int, str] = 0) -> int:
+        return self._match.start(name)
+
+    def end(self, name: Union[int, str] = 0) -> int:
+        return self._match.end(name)
+
+
+# _DEEP_KEY_CAPTURE_RE ters çevrilmiş satırda, sondan başa
+_DEEP_KEY_CAPTURE_REVERSED_RE = re.compile(r'\s*[:=]\s*["\']?(\w+)')
+
+
+def key_before(reversed_line: str, end: int) -> Optional[str]:
+    """
+    ``_DEEP_KEY_CAPTURE_RE.search(line[:end]).group(1)`` given ``line[::-1]``.
+
+    The key pattern is anchored at ``$``, so a forward search retries every
+    position of the prefix; on the reversed line it is a single anchored match.
+    """
+    start = max(len(reversed_line) - end, 0)
+    match = _DEEP_KEY_CAPTURE_REVERSED_RE.match(reversed_line, start)
+    return match.group(1)[::-1] if match else None
+
+
+def guarded_match(regex: re.Pattern, line: str, scan_line: str):
+    """``regex.match`` on ``scan_line`` (see mask_dangling_quotes) with groups from ``line``."""
+    match = regex.match(scan_line)
+    if match is None or scan_line is line:
+        return match
+    return _UnmaskedMatch(match, line)
+
+
+class _DeepLineContext:
+    """
+    Deep scan context of the string literals on one line: list/dict owner,
+    assignment target and ``"x".join(`` before the literal, searched in the
+    line prefix and then in up to 9 previous lines.
+    """
+
+    def __init__(self, lines: List[str], line_num: int):
+        self.line = lines[line_num - 1]
+        self._lines = lines
+        self._line_num = line_num
+        self._lookback: Optional[str] = None
+        self.open_paren = '(' in self.line and ')' not in self.line
+        self._rstripped = self.line.rstrip()
+
+    @property
+    def lookback_block(self) -> Optional[str]:
+        if self._lookback is None and self._line_num > 1:
+            self._lookback = "\n".join(self._lines[max(0, self._line_num - 10):self._line_num - 1])
+        return self._lookback
+
+    def list_match(self, start: int):
+        before = self.line[:start]
+        list_match = _DEEP_LIST_CONTEXT_RE.search(before)
+        if not list_match and self.lookback_block is not None:
+            matches = list(_DEEP_LIST_CONTEXT_RE.finditer(self.lookback_block + "\n" + before))
+            if matches:
+                list_match = matches[-1]  # Take the closest one
+        return list_match
+
+    def assignment_key(self, start: int) -> Optional[str]:
+        # Aynı satırdaki atama anahtar vermez; yalnızca önceki satırlardaki atama
+        before = self.line[:start]
+        if _DEEP_ASSIGNMENT_RE.search(before) or self.lookback_block is None:
+            return None
+        assign_matches = list(_DEEP_ASSIGNMENT_RE.finditer(self.lookback_block + "\n" + before))
+        return assign_matches[-1].group(1) if assign_matches else None
+
+    def join_before(self, start: int) -> bool:
+        return bool(_DEEP_JOIN_CALL_RE.search(self.line[:start]))
+
+    def backslash_after(self, end: int) -> bool:
+        """``line[end:].rstrip().endswith('\\\\')`` without slicing."""
+        return len(self._rstripped) > end and self._rstripped.endswith('\\')
+
+
+class _LongDeepLineContext(_DeepLineContext):
+    """
+    _DeepLineContext for lines above LONG_LINE_THRESHOLD.
+
+    The prefix searches are answered from match tables built once per line:
+    list/assignment matches never contain a quote, so none straddles a literal
+    start and "match in line[:start]" is "line match ending by start".
+    """
+
+    def __init__(self, lines: List[str], line_num: int, last_start: int):
+        super().__init__(lines, line_num)
+        line = self.line
+        self._list_line = _DEEP_LIST_CONTEXT_RE.search(line, 0, last_start)
+        self._assign_line = _DEEP_ASSIGNMENT_RE.search(line, 0, last_start)
+        self._list_block: List[re.Match] = []
+        self._assign_block: List[re.Match] = []
+        self._offset = 0
+        if self.lookback_block is not None:
+            combined = self.lookback_block + "\n" + line
+            self._offset = len(self.lookback_block) + 1
+            limit = self._offset + last_start
+            self._list_block = list(_DEEP_LIST_CONTEXT_RE.finditer(combined, 0, limit))
+            self._assign_block = list(_DEEP_ASSIGNMENT_RE.finditer(combined, 0, limit))
+        self._list_ends = [match.end() for match in self._list_block]
+        self._assign_ends = [match.end() for match in self._assign_block]
+
+        # "x".join( eşleşmeleri tırnak başına tek yoldan ilerler; en erken biten yeter
+        self._join_end = len(line) + 1
+        for quote in _QUOTE_RUN_RE.finditer(line, 0, last_start):
+            join_match = _DEEP_JOIN_CALL_RE.match(line, quote.start(2))
+            if join_match and join_match.end() < self._join_end:
+                self._join_end = join_match.end()
+
+    def _last_block_match(self, matches: List[re.Match], ends: List[int], start: int):
+        index = bisect.bisect_right(ends, self._offset + start)
+        return matches[index - 1] if index else None
+
+    def list_match(self, start: int):
+        if self._list_line is not None and self._list_line.start() < start:
+            return self._list_line
+        return self._last_block_match(self._list_block, self._list_ends, start)
+
+    def assignment_key(self, start: int) -> Optional[str]:
+        if self._assign_line is not None and self._assign_line.start() < start:
+            return None
+        assign_match = self._last_block_match(self._assign_block, self._assign_ends, start)
+        return assign_match.group(1) if assign_match else None
+
+    def join_before(self, start: int) -> bool:
+        return self._join_end <= start
+
+
+# ========== SCRIPT SOURCE SELECTION ==========
+# Oyunların çoğu aynı script'i hem .rpy hem .rpyc olarak dağıtır. İkisini de
+# okumak AST pickle'ını boşuna çözer; sonuç zaten metin setiyle tekilleştiriliyordu.
+# Her çiftten tek kaynak seçilir: .rpy, .rpyc onu derlemiş olduğu sürece
+# (Ren'Py .rpyc sonuna kaynağın MD5'ini yazar) ya da .rpyc daha eski olduğunda.
+SOURCE_MODE_AUTO = 'auto'  # one file per script
+SOURCE_MODE_BOTH = 'both'  # .rpy and .rpyc (coverage audits)
+SOURCE_MODES = (SOURCE_MODE_AUTO, SOURCE_MODE_BOTH)
+COMPILED_SUFFIXES = {'.rpy': '.rpyc', '.rpym': '.rpymc'}
+
+
+@dataclass(frozen=True)
+class ScriptSourcePlan:
+    """Script files a scan leaves out because the other file of its .rpy/.rpyc pair is read."""
+    mode: str
+    skipped: frozenset = frozenset()
+    pairs: int = 0  # scripts present both as source and compiled
+    compiled: int = 0  # pairs read from the .rpyc (stale .rpy)
+
+
+def plan_script_sources(index: ProjectFileIndex, mode: str = SOURCE_MODE_AUTO) -> ScriptSourcePlan:
+    """
+    Pair every ``foo.rpy`` with ``foo.rpyc`` (and .rpym with .rpymc) in ``index``.
+
+    In ``SOURCE_MODE_AUTO`` each pair is read once: from the .rpy, unless the
+    .rpyc is newer and was compiled from a different source (see
+    ``_prefers_compiled``). ``SOURCE_MODE_BOTH`` keeps every file.
+    """
+    if mode == SOURCE_MODE_BOTH:
+        return ScriptSourcePlan(mode)
+
+    compiled_files = {
+        os.path.normcase(str(path)): path for path in index.files(*COMPILED_SUFFIXES.values())
+    }
+    skipped: Set[Path] = set()
+    pairs = compiled = 0
+    for source in index.files(*COMPILED_SUFFIXES):
+        stem = str(source)[:-len(source.suffix)]
+        compiled_path = compiled_files.get(os.path.normcase(stem + COMPILED_SUFFIXES[source.suffix.lower()]))
+        if compiled_path is None:
+            continue
+        pairs += 1
+        if _prefers_compiled(source, compiled_path):
+            skipped.add(source)
+            compiled += 1
+        else:
+            skipped.add(compiled_path)
+    return ScriptSourcePlan(mode, frozenset(skipped), pairs, compiled)
+
+
+def _prefers_compiled(source: Path, compiled: Path) -> bool:
+    """True when ``compiled`` is newer than ``source`` and was built from another version of it."""
+    try:
+        if compiled.stat().st_mtime <= source.stat().st_mtime:
+            return False
+        from .rpyc_reader import read_rpyc_source_digest
+    except (OSError, ImportError):
+        return False
+    digest = read_rpyc_source_digest(compiled)
+    if digest is None:
+        # Eski .rpyc biçimi: .rpy'nin eskimiş olduğuna dair kanıt yok
+        return False
+    try:
+        return hashlib.md5(source.read_bytes()).digest() != digest
+    except OSError:
+        return False
+
+
+# ========== SINGLE-PASS PROJECT WALKER ==========
+# Ren'Py games often ship tens of thousands of images, audio and movie files
+# next to a few hundred scripts. Globbing the tree once per extension walks all
+# of them again and again, so the project is listed exactly once with
+# os.scandir and the files are bucketed by suffix. tl/ and engine folders are
+# pruned on the way down instead of being filtered afterwards.
+
+# Suffixes any extraction entry point may ask for. Everything else (images,
+# audio, archives, ...) is skipped without building a Path object.
+DEFAULT_SUFFIXES = frozenset({
+    '.rpy', '.rpym', '.rpyc', '.rpymc',
+    '.json', '.csv', '.txt', '.yaml', '.xml', '.ini',
+})
+
+
+class ProjectFileIndex:
+    """
+    Files of a project grouped by lower-case suffix, listed in one walk.
+
+    Exclusion rules match ``RenPyParser._is_excluded_rpy``:
+    - ``tl/`` at the root of the walk is never entered (translations are not source)
+    - ``renpy/`` at the root is engine code; only ``renpy/common`` is entered
+    """
+
+    def __init__(
+        self,
+        root: Union[str, Path],
+        recursive: bool = True,
+        suffixes: Optional[Iterable[str]] = None,
+        exclude_tl: bool = True,
+        exclude_engine: bool = True,
+    ):
+        self.root = Path(root)
+        self.recursive = recursive
+        self.suffixes = frozenset(s.lower() for s in (suffixes or DEFAULT_SUFFIXES))
+        self.exclude_tl = exclude_tl
+        self.exclude_engine = exclude_engine
+        self._by_suffix: Dict[str, List[Path]] = {}
+        self._source_plans: Dict[str, ScriptSourcePlan] = {}
+        self._walk()
+
+    def _walk(self) -> None:
+        # Explicit stack of (directory, depth, inside_root_renpy)
+        stack = [(str(self.root), 0, False)]
+        while stack:
+            current, depth, in_engine = stack.pop()
+            try:
+                with os.scandir(current) as it:
+                    entries = sorted(it, key=lambda e: e.name)
+            except OSError as exc:
+                logging.getLogger(__name__).debug("Cannot list %s: %s", current, exc)
+                continue
+
+            subdirs = []
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                except OSError:
+                    continue
+
+                if is_dir:
+                    if not self.recursive:
+                        continue
+                    name = entry.name.lower()
+                    if depth == 0:
+                        if self.exclude_tl and name == 'tl':
+                            continue
+                        if self.exclude_engine and name == 'renpy':
+                            subdirs.append((entry.path, depth + 1, True))
+                            continue
+                    if in_engine and depth == 1 and name != 'common':
+                        continue
+                    subdirs.append((entry.path, depth + 1, False))
+                    continue
+
+                if in_engine and depth == 1:
+                    # Files directly inside root-level renpy/ are engine modules
+                    continue
+
+                dot = entry.name.rfind('.')
+                if dot <= 0:
+                    continue
+                suffix = entry.name[dot:].lower()
+                if suffix in self.suffixes:
+                    self._by_suffix.setdefault(suffix, []).append(Path(entry.path))
+
+            # Reverse so directories are visited in sorted order (stack is LIFO)
+            stack.extend(reversed(subdirs))
+
+    def files(self, *suffixes: str) -> List[Path]:
+        """Return files with any of the given suffixes, grouped in argument order."""
+        result: List[Path] = []
+        for suffix in suffixes:
+            result.extend(self._by_suffix.get(suffix.lower(), ()))
+        return result
+
+    def has(self, *suffixes: str) -> bool:
+        return any(self._by_suffix.get(s.lower()) for s in suffixes)
+
+    def count(self, *suffixes: str) -> int:
+        return sum(len(self._by_suffix.get(s.lower(), ())) for s in suffixes)
+
+    def script_sources(self, mode: str = SOURCE_MODE_AUTO) -> ScriptSourcePlan:
+        """.rpy/.rpyc pairing of this listing (see plan_script_sources), computed once per mode."""
+        plan = self._source_plans.get(mode)
+        if plan is None:
+            plan = self._source_plans[mode] = plan_script_sources(self, mode)
+        return plan
+
+    def __iter__(self) -> Iterator[Path]:
+        for paths in self._by_suffix.values():
+            yield from paths
+
+    def __len__(self) -> int:
+        return sum(len(paths) for paths in self._by_suffix.values())
+
+
+def get_file_index(
+    root: Union[str, Path],
+    file_index: Optional[ProjectFileIndex] = None,
+    recursive: bool = True,
+) -> ProjectFileIndex:
+    """Reuse ``file_index`` when it was built for ``root``, otherwise walk ``root``."""
+    if file_index is not None and file_index.recursive == recursive:
+        try:
+            if os.path.normcase(os.path.abspath(file_index.root)) == os.path.normcase(os.path.abspath(root)):
+                return file_index
+        except (TypeError, ValueError):
+            pass
+    return ProjectFileIndex(root, recursive=recursive)
+
+
+# ========== DATA FILE ADMISSION ==========
+# parse_directory her .txt/.csv/.json/... dosyasını okuyordu; loglar, lisans
+# metinleri ve oyunun ürettiği dump'lar da dahil. 200 MB'lık tek bir .txt
+# taramayı kilitleyebiliyordu. Her veri dosyası önce ucuz bir kontrolden geçer:
+# isim kalıbı, boyut sınırı ve ilk birkaç KB'ın içeriği (binary mi, metin var mı).
+
+ADMIT_PARSE = 'parse'
+ADMIT_SAMPLE = 'sample'
+ADMIT_SKIP = 'skip'
+
+# Ren'Py / engine output and boilerplate that never holds game text
+DEFAULT_SKIP_PATTERNS = (
+    'traceback.txt', 'errors.txt', 'log.txt', 'lint.txt', 'dialogue.txt',
+    '*.log', '*.log.txt', '*_log.txt', 'log_*.txt',
+    'license*', 'licence*', '*_license*', '*_licence*', 'copying*',
+    'changelog*', '*.dump.*', '*_dump.*', 'dump_*',
+)
+# Line-oriented formats can be parsed from the head of the file
+SAMPLED_SUFFIXES = frozenset({'.txt', '.csv'})
+SNIFF_BYTES = 8 * 1024
+# Below this share of letters (whitespace ignored) a sample is numbers/markup only
+MIN_TEXT_DENSITY = 0.2
+_MB = 1024 * 1024
+_LETTER_BYTES = b'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz' + bytes(range(0x80, 0x100))
+_UNICODE_BOMS = (codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE, codecs.BOM_UTF32_LE, codecs.BOM_UTF32_BE)
+
+
+@dataclass(frozen=True)
+class AdmissionDecision:
+    action: str  # ADMIT_PARSE / ADMIT_SAMPLE / ADMIT_SKIP
+    reason: str = ""
+    limit: Optional[int] = None  # Bytes to read when sampling
+
+
+class FileAdmissionPolicy:
+    """
+    Decide per data file whether ``parse_directory`` parses, samples or skips it.
+
+    Scripts (.rpy/.rpyc) are never filtered; this only guards the optional
+    data files. Limits come from ``AppSettings`` (see ``from_config``).
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = 8 * _MB,
+        sample_bytes: int = 1 * _MB,
+        max_structured_bytes: int = 64 * _MB,
+        skip_patterns: Optional[Iterable[str]] = None,
+    ):
+        self.max_bytes = max_bytes
+        self.sample_bytes = sample_bytes
+        self.max_structured_bytes = max_structured_bytes
+        self.skip_patterns = tuple(
+            pattern.lower() for pattern in (DEFAULT_SKIP_PATTERNS if skip_patterns is None else skip_patterns)
+        )
+
+    @classmethod
+    def from_config(cls, config_manager=None) -> "FileAdmissionPolicy":
+        app_settings = getattr(config_manager, 'app_settings', None)
+        if app_settings is None:
+            return cls()
+
+        def megabytes(name: str, default: float) -> int:
+            try:
+                return int(float(getattr(app_settings, name, default)) * _MB)
+            except (TypeError, ValueError):
+                return int(default * _MB)
+
+        return cls(
+            max_bytes=megabytes('data_file_max_mb', 8.0),
+            sample_bytes=megabytes('data_file_sample_mb', 1.0),
+            max_structured_bytes=megabytes('structured_data_max_mb', 64.0),
+            skip_patterns=getattr(app_settings, 'data_file_skip_patterns', None),
+        )
+
+    def admit(self, file_path: Union[str, Path]) -> AdmissionDecision:
+        path = Path(file_path)
+        name = path.name.lower()
+        for pattern in self.skip_patterns:
+            if fnmatch.fnmatchcase(name, pattern):
+                return AdmissionDecision(ADMIT_SKIP, f"file name matches '{pattern}'")
+
+        try:
+            size = path.stat().st_size
+            with open(path, 'rb') as handle:
+                head = handle.read(SNIFF_BYTES)
+        except OSError as exc:
+            return AdmissionDecision(ADMIT_SKIP, f"unreadable: {exc}")
+
+        verdict = self._sniff(head, path.suffix.lower())
+        if verdict:
+            return AdmissionDecision(ADMIT_SKIP, verdict)
+
+        sampled = path.suffix.lower() in SAMPLED_SUFFIXES
+        ceiling = self.max_bytes if sampled else self.max_structured_bytes
+        if ceiling and size > ceiling:
+            if sampled and self.sample_bytes > 0:
+                return AdmissionDecision(
+                    ADMIT_SAMPLE,
+                    f"{size / _MB:.1f} MB > {ceiling / _MB:.1f} MB, first {self.sample_bytes / _MB:.1f} MB parsed",
+                    self.sample_bytes,
+                )
+            return AdmissionDecision(ADMIT_SKIP, f"{size / _MB:.1f} MB > {ceiling / _MB:.1f} MB")
+        return AdmissionDecision(ADMIT_PARSE)
+
+    @staticmethod
+    def _sniff(head: bytes, suffix: str) -> str:
+        """Reason to skip based on the first bytes, or an empty string."""
+        if not head or head.startswith(_UNICODE_BOMS):
+            return ""
+        if b'\x00' in head:
+            return "binary content"
+        visible = head.translate(None, b' \t\r\n')
+        letters = len(visible) - len(visible.translate(None, _LETTER_BYTES))
+        if visible and letters < len(visible) * MIN_TEXT_DENSITY:
+            return f"little text ({letters * 100 // len(visible)}% letters)"
+        if suffix == '.json' and len(head) >= 1024 and head.count(b'"') == 0:
+            return "no JSON strings"
+        return ""
+
+
+# ============================================================================
+# ENCODING DETECTION
+# ============================================================================
+# Eski çevirilerde (cp1252, cp1254, Shift-JIS ...) UTF-8 çözümü başarısız olunca
+# chardet tüm dosya üzerinde çalıştırılıyordu; çok MB'lık script'lerde bu tarama
+# süresinin çoğunu yiyordu. Artık yalnızca ASCII dışı satırlardan sınırlı bir
+# örnek verilir ve dedektör emin olduğu anda durur. Bulunan kodlama proje başına
+# hatırlanır, böylece aynı oyunun diğer dosyaları önce onu dener.
+
+# Upper bound of bytes fed to the detector per file
+ENCODING_SAMPLE_BYTES = 32 * 1024
+ENCODING_SAMPLE_CHUNK = 8 * 1024
+# Projects whose encoding is remembered (oldest is forgotten first)
+MAX_REMEMBERED_PROJECTS = 256
+
+_NON_ASCII_LINE_RE = re.compile(rb'[^\n]*[\x80-\xff][^\n]*\n?')
+_PROJECT_ENCODINGS: Dict[str, str] = {}
+_PROJECT_ENCODINGS_LOCK = threading.Lock()
+
+
+def _project_key(file_path: Union[str, Path]) -> str:
+    """Folder containing the game's ``game/`` directory, or the file's own folder."""
+    path = os.path.normcase(os.path.abspath(str(file_path)))
+    marker = os.sep + 'game' + os.sep
+    position = path.lower().rfind(marker)
+    if position >= 0:
+        return path[:position]
+    return os.path.dirname(path)
+
+
+def remembered_encoding(file_path: Union[str, Path]) -> Optional[str]:
+    """Legacy encoding last detected for the project of ``file_path``."""
+    with _PROJECT_ENCODINGS_LOCK:
+        return _PROJECT_ENCODINGS.get(_project_key(file_path))
+
+
+def remember_encoding(file_path: Union[str, Path], encoding: str) -> None:
+    key = _project_key(file_path)
+    with _PROJECT_ENCODINGS_LOCK:
+        _PROJECT_ENCODINGS.pop(key, None)
+        _PROJECT_ENCODINGS[key] = encoding
+        while len(_PROJECT_ENCODINGS) > MAX_REMEMBERED_PROJECTS:
+            _PROJECT_ENCODINGS.pop(next(iter(_PROJECT_ENCODINGS)))
+
+
+def detect_encoding(raw_bytes: bytes, start: int = 0) -> Optional[str]:
+    """
+    Guess the encoding of ``raw_bytes`` from a bounded sample.
+
+    Only lines with non-ASCII bytes (from ``start`` on) are sampled; pure
+    ASCII carries no evidence. At most ``ENCODING_SAMPLE_BYTES`` are fed to
+    chardet, chunk by chunk, stopping as soon as it is confident.
+    """
+    sample = []
+    size = 0
+    for match in _NON_ASCII_LINE_RE.finditer(raw_bytes, raw_bytes.rfind(b'\n', 0, start) + 1):
+        sample.append(match.group())
+        size += match.end() - match.start()
+        if size >= ENCODING_SAMPLE_BYTES:
+            break
+    sample_bytes = b''.join(sample)[:ENCODING_SAMPLE_BYTES]
+
+    detector = chardet.UniversalDetector()
+    for offset in range(0, len(sample_bytes), ENCODING_SAMPLE_CHUNK):
+        detector.feed(sample_bytes[offset:offset + ENCODING_SAMPLE_CHUNK])
+        if detector.done:
+            break
+    return detector.close().get('encoding')
+
+
+def decode_text(raw_bytes: bytes, hints: Iterable[Optional[str]] = ()) -> Tuple[str, str]:
+    """
+    Decode file content; returns ``(text, encoding)``.
+
+    Order: UTF-8 (with BOM), then each hint that decodes the whole buffer
+    strictly, then a bounded chardet sample. The final fallback decodes with
+    ``errors='ignore'`` like the old full-buffer detection did.
+    """
+    try:
+        return raw_bytes.decode('utf-8-sig'), 'utf-8'
+    except UnicodeDecodeError as exc:
+        first_error = exc.start
+
+    for hint in hints:
+        if not hint or hint == 'utf-8':
+            continue
+        try:
+            return raw_bytes.decode(hint), hint
+        except (UnicodeDecodeError, LookupError):
+            continue
+
+    try:
+        # Canonical codec name ("Windows-1254" -> "cp1254") for hints and the cache
+        encoding = codecs.lookup(detect_encoding(raw_bytes, first_error) or 'utf-8').name
+    except LookupError:
+        encoding = 'utf-8'
+    return raw_bytes.decode(encoding, errors='ignore'), encoding
+
+
 @dataclass
 class ContextNode:
     indent: int
@@ -41,156 +689,1250 @@ class ContextNode:
     name: str = ""
 
 
+# ============================================================================
+# COMPACT TEXT ENTRIES
+# ============================================================================
+# Büyük oyunlarda yüz binlerce entry bellekte tutuluyor. Her biri ayrı bir dict,
+# ayrı bir context_path listesi ve çoğunlukla boş bir placeholder_map dict'i
+# taşıdığında peak RSS gereksiz yere büyüyordu. TextEntry aynı bilgiyi slot'larda
+# saklar, tekrar eden değerleri paylaşır ve dict gibi davranmaya devam eder.
+
+class _EmptyPlaceholderMap(dict):
+    """Read-only empty dict shared by every entry without placeholders."""
+
+    __slots__ = ()
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("shared empty placeholder_map is read-only; copy it with dict() first")
+
+    __setitem__ = __delitem__ = _readonly
+    update = setdefault = pop = popitem = clear = _readonly
+
+    def __reduce__(self):
+        return (_empty_placeholder_map, ())
+
+
+EMPTY_PLACEHOLDER_MAP: Dict[str, str] = _EmptyPlaceholderMap()
+
+
+def _empty_placeholder_map() -> Dict[str, str]:
+    return EMPTY_PLACEHOLDER_MAP
+
+
+_CONTEXT_PATHS: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+
+
+def intern_context_path(context_path: Optional[Iterable[str]]) -> Tuple[str, ...]:
+    """Return one shared tuple per distinct context path."""
+    key = tuple(context_path or ())
+    shared = _CONTEXT_PATHS.get(key)
+    if shared is None:
+        shared = _CONTEXT_PATHS.setdefault(
+            tuple(sys.intern(part) if type(part) is str else part for part in key), key
+        )
+    return shared
+
+
+def _intern_str(value):
+    return sys.intern(value) if type(value) is str else value
+
+
+class TextEntry(MutableMapping):
+    """
+    Slotted replacement for the per-entry dicts returned by the extractors.
+
+    Supports the full mapping protocol (``entry['text']``, ``entry.get(...)``,
+    ``dict(entry)``, ``entry == {...}``), so existing callers keep working.
+    Differences to the old dicts:
+
+    - ``file_path``, ``source_file``, ``character`` and ``text_type`` are
+      interned, ``context_path`` is a shared tuple instead of a new list;
+    - entries without placeholders share ``EMPTY_PLACEHOLDER_MAP``, which is
+      read-only (use ``dict(entry['placeholder_map'])`` to modify).
+
+    Keys that are not known fields are kept in a small side dict.
+    """
+
+    FIELDS = (
+        'text', 'line_number', 'context_line', 'character', 'text_type',
+        'context_path', 'processed_text', 'placeholder_map', 'file_path',
+        'source_file', 'is_deep_scan', 'is_rpyc', 'is_engine_common',
+        'translatable',
+    )
+    __slots__ = FIELDS + ('_extra',)
+    _FIELD_SET = frozenset(FIELDS)
+
+    def __init__(self, _mapping=None, **fields):
+        self._extra = None
+        if _mapping:
+            fields = {**_mapping, **fields}
+        field_set = self._FIELD_SET
+        normalizers = _FIELD_NORMALIZERS
+        for key, value in fields.items():
+            if key in field_set:
+                if key in normalizers:
+                    value = normalizers[key](value)
+                setattr(self, key, value)
+            else:
+                self[key] = value
+
+    @classmethod
+    def create(
+        cls,
+        text: str,
+        line_number: int,
+        context_line: str,
+        character: str,
+        text_type: str,
+        context_path: Iterable[str],
+        processed_text: str,
+        placeholder_map: Dict[str, str],
+        file_path: str,
+    ) -> "TextEntry":
+        """Fast constructor for the fields every parser entry carries."""
+        entry = cls.__new__(cls)
+        entry._extra = None
+        entry.text = text
+        entry.line_number = line_number
+        entry.context_line = context_line
+        entry.character = sys.intern(character) if type(character) is str else character
+        entry.text_type = sys.intern(text_type) if type(text_type) is str else text_type
+        entry.context_path = intern_context_path(context_path)
+        entry.processed_text = processed_text
+        entry.placeholder_map = placeholder_map or EMPTY_PLACEHOLDER_MAP
+        entry.file_path = sys.intern(file_path) if type(file_path) is str else file_path
+        return entry
+
+    @classmethod
+    def from_mapping(cls, mapping) -> "TextEntry":
+        if isinstance(mapping, cls):
+            return mapping
+        return cls(mapping)
+
+    def __getitem__(self, key):
+        if key in self._FIELD_SET:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        if self._extra is None:
+            raise KeyError(key)
+        return self._extra[key]
+
+    def __setitem__(self, key, value) -> None:
+        if key in self._FIELD_SET:
+            normalize = _FIELD_NORMALIZERS.get(key)
+            setattr(self, key, normalize(value) if normalize else value)
+            return
+        if self._extra is None:
+            self._extra = {}
+        self._extra[key] = value
+
+    def __delitem__(self, key) -> None:
+        if key in self._FIELD_SET:
+            try:
+                delattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+            return
+        if self._extra is None:
+            raise KeyError(key)
+        del self._extra[key]
+
+    def __iter__(self) -> Iterator[str]:
+        for key in self.FIELDS:
+            if hasattr(self, key):
+                yield key
+        if self._extra:
+            yield from self._extra
+
+    def __len__(self) -> int:
+        size = sum(1 for key in self.FIELDS if hasattr(self, key))
+        return size + (len(self._extra) if self._extra else 0)
+
+    def __contains__(self, key) -> bool:
+        if key in self._FIELD_SET:
+            return hasattr(self, key)
+        return bool(self._extra) and key in self._extra
+
+    def copy(self) -> "TextEntry":
+        return TextEntry(self)
+
+    def __repr__(self) -> str:
+        return f"TextEntry({dict(self)!r})"
+
+    def __getstate__(self):
+        return dict(self)
+
+    def __setstate__(self, state) -> None:
+        self._extra = None
+        for key, value in state.items():
+            self[key] = value
+
+    def __reduce__(self):
+        return (TextEntry, (), self.__getstate__())
+
+
+def _shared_placeholder_map(value):
+    if not value and type(value) is dict:
+        return EMPTY_PLACEHOLDER_MAP
+    return value
+
+
+_FIELD_NORMALIZERS = {
+    'file_path': _intern_str,
+    'source_file': _intern_str,
+    'character': _intern_str,
+    'text_type': _intern_str,
+    'context_path': intern_context_path,
+    'placeholder_map': _shared_placeholder_map,
+}
+
+
+# ============================================================================
+# TEXT CLASSIFICATION
+# ============================================================================
+# Bir metnin çevrilebilir mi yoksa teknik mi olduğu eskiden dört yerde ayrı ayrı
+# karar veriliyordu (RenPyParser.is_meaningful_text/_should_translate_text,
+# ASTTextExtractor._is_technical_string, RenPyOutputFormatter._should_skip_translation,
+# TLParser.should_skip_text). Kurallar aynı kaldı; artık burada bir kez derleniyor
+# ve aynı metinler dosyalar arasında tekrarlandığı için memoize ediliyor.
+#
+# - Ayarlardan bağımsız kararlar (is_meaningful, is_technical_string,
+#   is_output_technical, is_trivial) modül seviyesinde ve paylaşımlı.
+# - should_translate translate_* filtrelerine ve never-translate kurallarına
+#   bağlı; TextClassifier her ayar parmak izi için bir kez derlenir.
+
+# Distinct strings remembered per verdict; a large game has ~100k unique texts
+MEMO_SIZE = 1 << 16
+
+_LETTER_RE = re.compile(r'[a-zA-ZçğıöşüÇĞIİÖŞÜ]')
+_WORD_RE = re.compile(r'[a-zA-ZçğıöşüÇĞIİÖŞÜ]{3,}')
+_BRACE_RE = re.compile(r'\{[^}]*\}')
+_BRACKET_RE = re.compile(r'\[[^\]]*\]')
+
+# ----------------------------------------------------------------------------
+# is_meaningful (parser candidate filter)
+# ----------------------------------------------------------------------------
+RENPY_TECHNICAL_TERMS = frozenset({
+    'left', 'right', 'center', 'top', 'bottom', 'gui', 'config',
+    'true', 'false', 'none', 'auto', 'png', 'jpg', 'mp3', 'ogg'
+})
+
+_ONLY_PLACEHOLDER_RE = re.compile(r"\s*(\[[^\]]+\]|\{[^}]+\}|%s|%\([^)]+\)[sdif])\s*")
+# Any match of these in the lowercased text marks it as technical
+_MEANINGFUL_TECHNICAL_RE = re.compile('|'.join(f'(?:{pattern})' for pattern in (
+    r'^#[0-9a-fA-F]+$',
+    r'\.ttf$',
+    r'^%s[%\s]*$',
+    r'fps|renderer|ms$',
+    r'^[0-9.]+$',
+    r'game_menu|sync|input|overlay',
+    r'vertical|horizontal|linear',
+    r'touch_keyboard|subtitle|empty',
+)))
+_MEDIA_EXTENSIONS = (
+    '.png', '.jpg', '.jpeg', '.gif', '.webp', '.mp3', '.ogg', '.wav', '.mp4', '.webm', '.ttf', '.otf'
+)
+_INTEGER_RE = re.compile(r'^[-+]?\d+$')
+_DOTTED_NUMBER_RE = re.compile(r'^\d+(?:\.\d+)+$')
+
+
+@functools.lru_cache(maxsize=MEMO_SIZE)
+def is_meaningful(text: str) -> bool:
+    """Heuristic used by the parser before a string becomes an entry."""
+    if not text or len(text.strip()) < 2:
+        return False
+
+    text_lower = text.lower().strip()
+    text_strip = text.strip()
+
+    if text_lower in RENPY_TECHNICAL_TERMS:
+        return False
+
+    if _ONLY_PLACEHOLDER_RE.fullmatch(text):
+        return False
+
+    # Python format strings like {:,}, {:3d}, {}, {}Attitude:{} {}
+    if '{' in text_strip:
+        format_count = len(_BRACE_RE.findall(text_strip))
+        if format_count >= 1:
+            remaining = _BRACE_RE.sub('', text_strip).strip()
+            if not _WORD_RE.search(remaining):
+                return False
+            if format_count >= 2 and len(remaining) < 10:
+                return False
+
+    if _MEANINGFUL_TECHNICAL_RE.search(text_lower):
+        return False
+
+    # File paths and media files
+    if any(ext in text_lower for ext in _MEDIA_EXTENSIONS):
+        return False
+    if '/' in text_strip and ' ' not in text_strip:
+        return False
+
+    if _INTEGER_RE.match(text_strip):
+        return False
+    if _DOTTED_NUMBER_RE.match(text_strip):
+        return True
+
+    # Büyük harfle başlayan ve boşluk içeren metinler neredeyse her zaman metindir
+    if text[0].isupper() and ' ' in text:
+        return True
+
+    # Küçük harf ve boşluksuz metinler düşük güven
+    if text.islower() and ' ' not in text:
+        return False
+
+    # Code wrappers captured by mistake, e.g. '_("Text")'
+    if (text.startswith('_("') and text.endswith('")')) or \
+       (text.startswith("_('") and text.endswith("')")):
+        return False
+
+    return bool(_LETTER_RE.search(text)) and len(text_strip) >= 2
+
+
+# ----------------------------------------------------------------------------
+# should_translate (technical safety checks + user filters)
+# ----------------------------------------------------------------------------
+_TRANSLATE_SKIP_EXTENSIONS = (
+    '.otf', '.ttf', '.woff', '.woff2', '.eot',  # Fonts
+    '.png', '.jpg', '.jpeg', '.gif', '.webp', '.bmp', '.ico', '.svg',  # Images
+    '.mp3', '.ogg', '.wav', '.flac', '.aac', '.m4a', '.opus',  # Audio
+    '.mp4', '.webm', '.avi', '.mkv', '.mov', '.ogv',  # Video
+    '.rpy', '.rpyc', '.rpa', '.rpym', '.rpymc',  # Ren'Py files
+    '.py', '.pyc', '.pyo',  # Python files
+    '.json', '.txt', '.xml', '.csv', '.yaml', '.yml',  # Data files
+    '.zip', '.rar', '.7z', '.tar', '.gz',  # Archives
+)
+_ASSET_PATH_PREFIXES = (
+    'fonts/', 'images/', 'audio/', 'music/', 'sounds/',
+    'gui/', 'screens/', 'script/', 'game/', 'tl/',
+    'video/', 'movies/', 'sfx/', 'voice/', 'bg/',
+    'cg/', 'sprites/', 'characters/', 'scenes/',
+)
+_ASSET_FOLDERS = (
+    '/images/', '/audio/', '/music/', '/sounds/', '/fonts/',
+    '/gui/', '/video/', '/movies/', '/sfx/', '/voice/',
+    '/frames/', '/scenes/', '/sprites/', '/cg/', '/bg/',
+)
+# IMPORTANT: only lowercase spellings - "history" is technical, "History" is a UI label
+_TECHNICAL_IDENTIFIERS = frozenset({
+    # Screen elements & style identifiers
+    'say', 'window', 'namebox', 'choice', 'quick', 'navigation',
+    'return_button', 'page_label', 'page_label_text', 'slot',
+    'slot_time_text', 'slot_name_text', 'save_delete', 'pref',
+    'radio', 'check', 'slider', 'tooltip_icon', 'tooltip_frame',
+    'dismiss', 'history_name', 'color',
+    'confirm_prompt', 'notify',
+    'nvl_window', 'nvl_button', 'medium', 'touch', 'small',
+    'replay_locked',
+    # Style & layout properties
+    'show', 'hide', 'unicode', 'left', 'right', 'center',
+    'top', 'bottom', 'true', 'false', 'none', 'null', 'auto',
+    # Common screen/action identifiers
+    'add_post', 'card', 'money_get', 'money_pay', 'mp',
+    'pass_time', 'rel_down', 'rel_up',
+    # Input/output
+    'input', 'output', 'default', 'value',
+    # Common variable/config names
+    'id', 'name', 'type', 'style', 'action', 'hovered', 'unhovered',
+    'selected', 'insensitive', 'activate', 'alternate',
+})
+_SLASH_PATH_RE = re.compile(r'^[a-zA-Z0-9_/.\-]+$')
+_BACKSLASH_PATH_RE = re.compile(r'^[a-zA-Z0-9_\\\.\-]+$')
+_URI_RE = re.compile(r'^(https?://|ftp://|mailto:|file://|www\.)')
+_HEX_COLOR_RE = re.compile(r'^#[0-9a-fA-F]{3,8}$')
+_NUMBER_RE = re.compile(r'^-?\d+\.?\d*$')
+_CSS_VALUE_RE = re.compile(r'^\d+(\.\d+)?(px|em|rem|%|pt|vh|vw)$')
+_SNAKE_CASE_RE = re.compile(r'^[a-z][a-z0-9]*(_[a-z0-9]+)+$')
+_SCREAMING_SNAKE_RE = re.compile(r'^[A-Z][A-Z0-9]*(_[A-Z0-9]+)+$')
+_CAMEL_CASE_RE = re.compile(r'^[a-z][a-zA-Z0-9]*[A-Z][a-zA-Z0-9]*$')
+_SAVE_ID_RE = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*-\d+$')
+_VERSION_RE = re.compile(r'^v?\d+\.\d+(\.\d+)?([a-z])?$')
+
+# text_type -> (setting, fallback setting); a type is dropped when the setting is off
+_TYPE_FILTERS: Dict[str, Tuple[str, Optional[str]]] = {
+    'dialogue': ('translate_dialogue', None),
+    'menu': ('translate_menu', None),
+    'ui': ('translate_ui', None),
+    'button': ('translate_buttons', 'translate_ui'),
+    'config': ('translate_config_strings', None),
+    'gui': ('translate_gui_strings', None),
+    'style': ('translate_style_strings', None),
+    'renpy_func': ('translate_renpy_functions', None),
+    'alt_text': ('translate_alt_text', 'translate_ui'),
+    'input': ('translate_input_text', 'translate_ui'),
+    'notify': ('translate_notifications', 'translate_dialogue'),
+    'confirm': ('translate_confirmations', 'translate_dialogue'),
+    'define': ('translate_define_strings', 'translate_config_strings'),
+    'paragraph': ('translate_dialogue', None),
+}
+# _() marked strings are always translated, even over never-translate rules
+_ALWAYS_TRANSLATED_TYPES = frozenset({'translatable_string'})
+
+# Context line keywords that turn a bare word into a label / font name
+_LABEL_CONTEXT_TYPES = frozenset({'renpy_func', 'python_string'})
+_LABEL_CONTEXT_KEYWORDS = ('jump', 'call', 'scene', 'show')
+_FONT_CONTEXT_TYPES = frozenset({'config', 'gui', 'style'})
+_FONT_CONTEXT_KEYWORDS = ('font', 'style')
+
+
+@functools.lru_cache(maxsize=MEMO_SIZE)
+def is_technical_content(text: str) -> bool:
+    """
+    Safety checks that run before any user setting: file names, asset paths,
+    URLs, colors, numbers, identifiers, tag-only strings.
+    """
+    text_strip = text.strip()
+    text_lower = text_strip.lower()
+
+    if not text_strip:
+        return True
+    if text_lower.endswith(_TRANSLATE_SKIP_EXTENSIONS):
+        return True
+    if text_strip.startswith(_ASSET_PATH_PREFIXES):
+        return True
+    if any(folder in text_lower for folder in _ASSET_FOLDERS):
+        return True
+    if '/' in text_strip and ' ' not in text_strip and _SLASH_PATH_RE.match(text_strip):
+        return True
+    if '\\' in text_strip and ' ' not in text_strip and _BACKSLASH_PATH_RE.match(text_strip):
+        return True
+    if _URI_RE.match(text_lower):
+        return True
+    if _HEX_COLOR_RE.match(text_strip):
+        return True
+    if _NUMBER_RE.match(text_strip):
+        return True
+    if _CSS_VALUE_RE.match(text_lower):
+        return True
+    if text_strip in _TECHNICAL_IDENTIFIERS:
+        return True
+    if _SNAKE_CASE_RE.match(text_strip):
+        return True
+    if _SCREAMING_SNAKE_RE.match(text_strip):
+        return True
+    if ' ' not in text_strip and _CAMEL_CASE_RE.match(text_strip):
+        return True
+    if _SAVE_ID_RE.match(text_strip):
+        return True
+    if _VERSION_RE.match(text_lower):
+        return True
+    # Single non-letter characters (separators, bullets)
+    if len(text_strip) == 1 and not text_strip.isalpha():
+        return True
+    # Only Ren'Py tags/variables, no human-readable text
+    if not _BRACKET_RE.sub('', _BRACE_RE.sub('', text_strip)).strip():
+        return True
+    return False
+
+
+class TextClassifier:
+    """
+    ``should_translate`` verdicts for one set of translation settings.
+
+    Built once per settings fingerprint; the memo is keyed by
+    ``(text, text_type)``. The label/font context rules depend on the
+    context line and are applied after the memoized verdict.
+    """
+
+    def __init__(self, config_manager=None, fingerprint: str = "default"):
+        self.fingerprint = fingerprint
+        self.enabled = config_manager is not None
+        self._allowed_types: Dict[str, bool] = {}
+        self._never_exact = frozenset()
+        self._never_contains: Tuple[str, ...] = ()
+        self._never_regex: List[re.Pattern] = []
+        if self.enabled:
+            self._compile(config_manager)
+        self._memo = functools.lru_cache(maxsize=MEMO_SIZE)(self._verdict)
+
+    # Shared, settings independent verdicts
+    is_meaningful = staticmethod(is_meaningful)
+    is_technical_content = staticmethod(is_technical_content)
+
+    def _compile(self, config_manager) -> None:
+        ts = config_manager.translation_settings
+        for text_type, (setting, fallback) in _TYPE_FILTERS.items():
+            default = getattr(ts, fallback) if fallback else None
+            self._allowed_types[text_type] = bool(getattr(ts, setting, default))
+
+        rules: Dict[str, Any] = getattr(config_manager, 'never_translate_rules', {}) or {}
+        try:
+            self._never_exact = frozenset(rules.get('exact', []) or [])
+            self._never_contains = tuple(val for val in rules.get('contains', []) or [] if val)
+            for pattern in rules.get('regex', []) or []:
+                try:
+                    self._never_regex.append(re.compile(pattern))
+                except re.error:
+                    continue
+        except Exception as exc:
+            logging.getLogger(__name__).warning("never_translate rules failed: %s", exc)
+
+    def _verdict(self, text: str, text_type: str) -> bool:
+        if is_technical_content(text):
+            return False
+        if not self._allowed_types.get(text_type, True):
+            return False
+        if text_type in _ALWAYS_TRANSLATED_TYPES:
+            return True
+
+        text_strip = text.strip()
+        if text_strip in self._never_exact:
+            return False
+        if any(val in text_strip for val in self._never_contains):
+            return False
+        if any(regex.search(text_strip) for regex in self._never_regex):
+            return False
+        return True
+
+    def should_translate(self, text: str, text_type: str, context_line: str = '') -> bool:
+        """Technical checks, ``translate_*`` filters and never-translate rules."""
+        if not self.enabled:
+            return True
+        if not self._memo(text, text_type):
+            return False
+        if text_type in _ALWAYS_TRANSLATED_TYPES or not context_line:
+            return True
+
+        text_strip = text.strip()
+        if text_type in _LABEL_CONTEXT_TYPES:
+            # "Start", "Forest" after jump/call/scene/show are label or image names
+            context_lower = context_line.lower()
+            if any(keyword in context_lower for keyword in _LABEL_CONTEXT_KEYWORDS):
+                if ' ' not in text_strip and text_strip[0].isupper():
+                    return False
+        elif text_type in _FONT_CONTEXT_TYPES:
+            # "Roboto-Regular", "GuiFont" in font/style settings are names
+            context_lower = context_line.lower()
+            if any(keyword in context_lower for keyword in _FONT_CONTEXT_KEYWORDS):
+                if ' ' not in text_strip:
+                    return False
+        return True
+
+    def classify_batch(self, items: Iterable[Tuple[str, str, str]]) -> List[bool]:
+        """
+        ``should_translate`` for many ``(text, text_type, context_line)`` triples.
+
+        Same verdicts as calling ``should_translate`` per entry (context rules
+        included); pass ``''`` as the context line when there is none.
+        """
+        if not self.enabled:
+            return [True for _ in items]
+        should_translate = self.should_translate
+        return [should_translate(text, text_type, context_line) for text, text_type, context_line in items]
+
+    def memo_info(self):
+        return self._memo.cache_info()
+
+
+# ----------------------------------------------------------------------------
+# RPYC reader / output formatter / TL parser profiles
+# ----------------------------------------------------------------------------
+_RPYC_SKIP_EXTENSIONS = (
+    '.png', '.jpg', '.jpeg', '.gif', '.webp', '.mp3', '.ogg',
+    '.wav', '.ttf', '.otf', '.rpy', '.rpyc', '.json'
+)
+_RPYC_PATH_PREFIXES = ('images/', 'audio/', 'gui/', 'fonts/')
+_RPYC_LETTER_RE = re.compile(r'[a-zA-Z\u00C0-\u024F\u0400-\u04FF]')
+
+
+@functools.lru_cache(maxsize=MEMO_SIZE)
+def is_technical_string(text: str, context: str = "", whitelist: Optional[frozenset] = None) -> bool:
+    """Filter used by the RPYC AST extractor; ``context`` is checked against ``whitelist``."""
+    text_strip = text.strip()
+    text_lower = text_strip.lower()
+
+    if len(text_strip) < 2:
+        return True
+    if text_lower.endswith(_RPYC_SKIP_EXTENSIONS):
+        return True
+    if text_strip.startswith(_RPYC_PATH_PREFIXES):
+        return True
+    if _HEX_COLOR_RE.match(text_strip):
+        return True
+    if _NUMBER_RE.match(text_strip):
+        return True
+    if _SNAKE_CASE_RE.match(text_strip):
+        return True
+    if not _RPYC_LETTER_RE.search(text):
+        return True
+    if context and whitelist is not None and not any(key in context for key in whitelist):
+        return True
+    return False
+
+
+_OUTPUT_LETTERS_RE = re.compile(r'[a-zA-ZçğıöşüÇĞIİÖŞÜа-яА-Яа-яА-Я]{3,}')
+_OUTPUT_PATH_PREFIXES = (
+    'fonts/', 'images/', 'audio/', 'music/', 'sounds/',
+    'gui/', 'screens/', 'script/', 'game/', 'tl/',
+)
+
+
+@functools.lru_cache(maxsize=MEMO_SIZE)
+def is_output_technical(text: str) -> bool:
+    """
+    Safety net of the output formatter. Its tables stay on
+    ``RenPyOutputFormatter`` (tools/ load that module on its own).
+    """
+    from .output_formatter import RenPyOutputFormatter as rules
+
+    text_strip = text.strip()
+    text_lower = text_strip.lower()
+
+    if not text_strip:
+        return True
+
+    if '{' in text_strip:
+        format_count = len(rules._FORMAT_PLACEHOLDER_RE.findall(text_strip))
+        if format_count >= 1:
+            remaining = rules._FORMAT_PLACEHOLDER_RE.sub('', text_strip).strip()
+            if not _OUTPUT_LETTERS_RE.search(remaining):
+                return True
+            if format_count >= 2 and len(remaining) < 10:
+                return True
+
+    if text_lower.endswith(tuple(rules.SKIP_FILE_EXTENSIONS)):
+        return True
+    if text_strip.startswith(_OUTPUT_PATH_PREFIXES):
+        return True
+    if '/' in text_strip and ' ' not in text_strip and rules._FILE_PATH_SLASH_RE.match(text_strip):
+        return True
+    if '\\' in text_strip and ' ' not in text_strip and rules._FILE_PATH_BACKSLASH_RE.match(text_strip):
+        return True
+    if rules._URL_RE.match(text_lower):
+        return True
+    if rules._HEX_COLOR_RE.match(text_strip):
+        return True
+    if rules._NUMBER_RE.match(text_strip):
+        return True
+    if text_strip in rules.RENPY_TECHNICAL_TERMS:
+        return True
+    if rules._SNAKE_CASE_RE.match(text_strip):
+        return True
+    if rules._SCREAMING_SNAKE_RE.match(text_strip):
+        return True
+    if rules._GAME_SAVE_ID_RE.match(text_strip):
+        return True
+    if rules._VERSION_RE.match(text_lower):
+        return True
+    if not rules._VARIABLE_RE.sub('', rules._TAG_RE.sub('', text_strip)).strip():
+        return True
+    return False
+
+
+def is_trivial(text: str) -> bool:
+    """Empty, single character or number-only text (TL parser)."""
+    if not text:
+        return True
+    text = text.strip()
+    if len(text) <= 1:
+        return True
+    return text.replace('.', '').replace(',', '').isdigit()
+
+
+def settings_fingerprint(config_manager=None) -> str:
+    """
+    Hash of every setting that changes what the extractors keep.
+
+    Only the ``translate_*`` type filters and the never-translate rules take
+    part; engine/endpoint settings do not affect extraction.
+    """
+    if config_manager is None:
+        return "default"
+    payload: Dict[str, Any] = {}
+    ts = getattr(config_manager, 'translation_settings', None)
+    if ts is not None:
+        payload['filters'] = {
+            key: value for key, value in sorted(vars(ts).items())
+            if key.startswith('translate_')
+        }
+    payload['never_translate'] = getattr(config_manager, 'never_translate_rules', {}) or {}
+    raw = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()[:16]
+
+
+_CLASSIFIERS: Dict[str, TextClassifier] = {}
+_CLASSIFIERS_LOCK = threading.Lock()
+_DEFAULT_CLASSIFIER = TextClassifier()
+# Settings combinations kept compiled (GUI users toggle a handful of filters)
+MAX_CLASSIFIERS = 8
+
+
+def get_text_classifier(config_manager=None) -> TextClassifier:
+    """Return the classifier compiled for the current settings of ``config_manager``."""
+    if config_manager is None:
+        return _DEFAULT_CLASSIFIER
+    fingerprint = settings_fingerprint(config_manager)
+    with _CLASSIFIERS_LOCK:
+        classifier = _CLASSIFIERS.get(fingerprint)
+        if classifier is None:
+            classifier = TextClassifier(config_manager, fingerprint)
+            _CLASSIFIERS[fingerprint] = classifier
+            while len(_CLASSIFIERS) > MAX_CLASSIFIERS:
+                _CLASSIFIERS.pop(next(iter(_CLASSIFIERS)))
+        return classifier
+
+
+# ============================================================================
+# PLACEHOLDER PROTECTION
+# ============================================================================
+# Ren'Py değişkenleri, tag'ler ve format string'leri çeviri motoruna gitmeden
+# önce ⟦0000⟧ işaretleriyle değiştirilir. Metin tek geçişte literal ve
+# placeholder parçalarına ayrılır, sonuç join ile kurulur; geri yükleme tek
+# bir derlenmiş regex ile yapılır.
+
+# Leftmost match wins; at the same position the alternatives are tried in order
+_PLACEHOLDER_TOKEN_RE = re.compile(
+    r'(?P<D>\{#[^}]+\})'                   # {#identifier} disambiguation tags
+    r'|(?P<V>\[[^\]]+\])'                  # [variable], [var!t]
+    r'|(?P<T>\{(?!#)[^}]*\})'               # {b}, {/b}, {color=#f00} text tags
+    r'|(?P<F>%\([^)]+\)[sdif]|%[sdif])'     # %(name)s, %s format strings
+)
+# Numbering follows the historical order: every D, then V, then T, then F
+_PLACEHOLDER_KINDS = ('D', 'V', 'T', 'F')
+# Marker as returned by translation engines, tolerating inserted whitespace and
+# bracket substitutions (⟦ V001 ⟧, [V001], 【V001】)
+_PLACEHOLDER_MARKER_RE = re.compile(
+    r'⟦\s*([A-Z]{1,2}\d{3,})\s*⟧|\[\s*([A-Z]{1,2}\d{3,})\s*\]|【\s*([A-Z]{1,2}\d{3,})\s*】'
+)
+_PLACEHOLDER_KEY_RE = re.compile(r'⟦[A-Z]{1,2}\d{3,}⟧')
+
+
+def protect_placeholders(text: str) -> Tuple[str, Dict[str, str]]:
+    """
+    Replace Ren'Py variables, tags and format strings with ⟦..⟧ markers.
+
+    Returns ``(processed_text, placeholder_map)``; see
+    ``RenPyParser.preserve_placeholders``.
+    """
+    if not text or ('[' not in text and '{' not in text and '%' not in text):
+        return text, {}
+
+    matches = list(_PLACEHOLDER_TOKEN_RE.finditer(text))
+    if not matches:
+        return text, {}
+
+    counters = dict.fromkeys(_PLACEHOLDER_KINDS, 0)
+    for match in matches:
+        counters[match.lastgroup] += 1
+    offset = 0
+    for kind in _PLACEHOLDER_KINDS:
+        counters[kind], offset = offset, offset + counters[kind]
+
+    placeholder_map: Dict[str, str] = {}
+    parts: List[str] = []
+    position = 0
+    for match in matches:
+        kind = match.lastgroup
+        original = match.group(0)
+        number = counters[kind]
+        counters[kind] = number + 1
+        if kind == 'V' and '!t' in original:
+            kind = 'VT'  # Translatable variable: Ren'Py translates its value at runtime
+        placeholder_id = f"⟦{kind}{number:03d}⟧"
+        placeholder_map[placeholder_id] = original
+        parts.append(text[position:match.start()])
+        parts.append(placeholder_id)
+        position = match.end()
+    parts.append(text[position:])
+    return ''.join(parts), placeholder_map
+
+
+def restore_placeholder_markers(translated_text: str, placeholder_map: Dict[str, str]) -> str:
+    """Put the original placeholders back into ``translated_text`` in one pass."""
+    if not translated_text or not placeholder_map:
+        return translated_text
+
+    def _restore(match: "re.Match[str]") -> str:
+        key = f"⟦{match.group(1) or match.group(2) or match.group(3)}⟧"
+        return placeholder_map.get(key, match.group(0))
+
+    restored = _PLACEHOLDER_MARKER_RE.sub(_restore, translated_text)
+    # Maps built by other tools may use arbitrary keys
+    for key, original in placeholder_map.items():
+        if not _PLACEHOLDER_KEY_RE.fullmatch(key) and key in restored:
+            restored = restored.replace(key, original)
+    return restored
+
+
+# ============================================================================
+# STREAMING DATA READERS
+# ============================================================================
+# Bazı oyunlar çok MB'lık JSON/YAML/XML eşya ve görev veritabanları taşıyor.
+# Dosyayı tamamen Python nesne ağacına yüklemek dosya boyutunun katları kadar
+# RAM harcıyordu. Bu okuyucular dosyayı olay olay dolaşır ve yalnızca string
+# değerleri (yol ve anahtar ile birlikte) üretir; bellek dosya boyutundan
+# bağımsız kalır. Yol biçimi eski recurse() fonksiyonlarıyla aynıdır:
+# "items[0].name", "quest.desc".
+
+DATA_READ_CHUNK = 64 * 1024
+
+_JSON_TOKEN_RE = re.compile(
+    r'[ \t\n\r]*(?:'
+    r'([{}\[\],:"])'
+    r'|(-?(?:0|[1-9]\d*)(?:\.\d+)?(?:[eE][-+]?\d+)?|true|false|null|NaN|-?Infinity)'
+    r')'
+)
+_JSON_TRAILING_WS_RE = re.compile(r'[ \t\n\r]*')
+_JSON_DECODER = json.JSONDecoder()
+# Characters that could still extend a number/literal cut at a chunk boundary
+_JSON_SCALAR_TAIL_RE = re.compile(r'[\w.+-]*')
+
+# JSON parser states
+_JSON_VALUE, _JSON_KEY_OR_END, _JSON_KEY, _JSON_COLON, _JSON_MEMBER_END, _JSON_ITEM_OR_END, _JSON_ITEM_END = range(7)
+
+
+def iter_json_strings(stream) -> Iterator[Tuple[str, str, Optional[str]]]:
+    """
+    Yield ``(text, path, key)`` for every string value of a JSON document.
+
+    ``stream`` is a text file object read in ``DATA_READ_CHUNK`` pieces.
+    Containers that fit in the current chunk are decoded by the C scanner;
+    larger ones are walked token by token, so memory is bounded by the chunk
+    size and the nesting depth. Object keys are not yielded; list items
+    inherit the key of their list. In a walked object a duplicate key yields
+    each of its values (``json.load`` keeps only the last one). Raises
+    ``ValueError`` for malformed documents like ``json.load``.
+    """
+    buffer = stream.read(DATA_READ_CHUNK)
+    position = 0
+    at_eof = not buffer
+    # Frames: [is_object, path, key, next_index]
+    stack: List[list] = []
+    state = _JSON_VALUE
+    path, key = "", None
+    finished = False
+
+    while True:
+        match = _JSON_TOKEN_RE.match(buffer, position)
+        if match is None or (
+            match.group(2) and not at_eof
+            and _JSON_SCALAR_TAIL_RE.match(buffer, match.end()).end() == len(buffer)
+        ):
+            # Token may continue in the next chunk (or is invalid at EOF)
+            if at_eof:
+                if finished and _JSON_TRAILING_WS_RE.match(buffer, position).end() == len(buffer):
+                    return
+                raise json.JSONDecodeError("Expecting value" if not finished else "Extra data", buffer, position)
+            chunk = stream.read(DATA_READ_CHUNK)
+            at_eof = not chunk
+            buffer = buffer[position:] + chunk
+            position = 0
+            continue
+        if finished:
+            raise json.JSONDecodeError("Extra data", buffer, match.start(1) if match.group(1) else match.start(2))
+
+        symbol = match.group(1)
+        if symbol == '"':
+            try:
+                value, end = json.decoder.scanstring(buffer, match.end())
+            except json.JSONDecodeError:
+                if at_eof:
+                    raise
+                chunk = stream.read(DATA_READ_CHUNK)
+                at_eof = not chunk
+                buffer = buffer[position:] + chunk
+                position = 0
+                continue
+            position = end
+            if state == _JSON_VALUE or state == _JSON_ITEM_OR_END:
+                if state == _JSON_ITEM_OR_END:
+                    frame = stack[-1]
+                    path, key = f"{frame[1]}[{frame[3]}]", frame[2]
+                yield value, path, key
+            elif state == _JSON_KEY_OR_END or state == _JSON_KEY:
+                frame = stack[-1]
+                key = value
+                path = f"{frame[1]}.{value}" if frame[1] else value
+                state = _JSON_COLON
+                continue
+            else:
+                raise json.JSONDecodeError("Unexpected string", buffer, match.start(1))
+        else:
+            position = match.end()
+            if state == _JSON_COLON:
+                if symbol != ':':
+                    raise json.JSONDecodeError("Expecting ':' delimiter", buffer, match.start())
+                state = _JSON_VALUE
+                continue
+            if symbol == ',':
+                if state == _JSON_MEMBER_END:
+                    state = _JSON_KEY
+                elif state == _JSON_ITEM_END:
+                    state = _JSON_VALUE
+                    frame = stack[-1]
+                    path, key = f"{frame[1]}[{frame[3]}]", frame[2]
+                else:
+                    raise json.JSONDecodeError("Unexpected ','", buffer, match.start(1))
+                continue
+            if symbol == '}' or symbol == ']':
+                is_object = symbol == '}'
+                if not stack or stack[-1][0] != is_object or state not in (
+                    (_JSON_KEY_OR_END, _JSON_MEMBER_END) if is_object else (_JSON_ITEM_OR_END, _JSON_ITEM_END)
+                ):
+                    raise json.JSONDecodeError(f"Unexpected '{symbol}'", buffer, match.start(1))
+                stack.pop()
+            elif state in (_JSON_VALUE, _JSON_ITEM_OR_END):
+                if state == _JSON_ITEM_OR_END:
+                    frame = stack[-1]
+                    path, key = f"{frame[1]}[{frame[3]}]", frame[2]
+                if symbol == '{' or symbol == '[':
+                    # Containers that end inside the buffer are decoded by the C scanner
+                    try:
+                        value, position = _JSON_DECODER.raw_decode(buffer, match.start(1))
+                    except json.JSONDecodeError:
+                        stack.append([symbol == '{', path, key, 0])
+                        state = _JSON_KEY_OR_END if symbol == '{' else _JSON_ITEM_OR_END
+                        continue
+                    yield from _iter_value_strings(value, path, key)
+                elif symbol is not None:
+                    raise json.JSONDecodeError("Expecting value", buffer, match.start(1))
+                # Number / literal: not text
+            else:
+                raise json.JSONDecodeError("Expecting property name or delimiter", buffer, match.start())
+
+        # A value (or container) just ended
+        if not stack:
+            finished = True
+            continue
+        frame = stack[-1]
+        if frame[0]:
+            state = _JSON_MEMBER_END
+        else:
+            frame[3] += 1
+            state = _JSON_ITEM_END
+
+
+def _iter_value_strings(obj, path: str, current_key) -> Iterator[Tuple[str, str, Any]]:
+    """Strings of an already decoded (small) value, walked like the old recurse()."""
+    stack = [(obj, path, current_key)]
+    while stack:
+        obj, path, current_key = stack.pop()
+        if isinstance(obj, str):
+            yield obj, path, current_key
+        elif isinstance(obj, dict):
+            stack.extend(reversed([(v, f"{path}.{k}" if path else k, k) for k, v in obj.items()]))
+        elif isinstance(obj, list):
+            stack.extend(reversed([(v, f"{path}[{i}]", current_key) for i, v in enumerate(obj)]))
+
+
+_YAML_PLAIN_TAGS = (None, '!', 'tag:yaml.org,2002:map', 'tag:yaml.org,2002:seq')
+
+
+def iter_yaml_strings(stream) -> Iterator[Tuple[str, str, Any]]:
+    """
+    Yield ``(text, path, key)`` for every string value of a YAML document.
+
+    Plain mappings and sequences are walked from the PyYAML event stream;
+    only leaves, anchored nodes and explicitly tagged collections are
+    composed and built with ``SafeLoader``, so scalars resolve exactly like
+    ``yaml.safe_load``. Merge keys (``<<``) are expanded where they appear.
+    """
+    loader = yaml.SafeLoader(stream)
+    events = yaml.events
+    try:
+        loader.get_event()  # StreamStart
+        if loader.check_event(events.StreamEndEvent):
+            return
+        loader.get_event()  # DocumentStart
+
+        def construct(node):
+            value = loader.construct_object(node, deep=True)
+            # Anchors stay in the composer; constructed objects are rebuilt on alias
+            loader.constructed_objects = {}
+            loader.recursive_objects = {}
+            return value
+
+        # Frames: [is_mapping, path, key, next_index]
+        stack: List[list] = []
+        pending = [("", None)]  # (path, key) of the value to read next
+        while pending or stack:
+            if pending:
+                path, key = pending.pop()
+                event = loader.peek_event()
+                if (
+                    isinstance(event, (events.MappingStartEvent, events.SequenceStartEvent))
+                    and event.anchor is None
+                    and event.tag in _YAML_PLAIN_TAGS
+                ):
+                    loader.get_event()
+                    stack.append([isinstance(event, events.MappingStartEvent), path, key, 0])
+                else:
+                    yield from _iter_value_strings(construct(loader.compose_node(None, None)), path, key)
+                continue
+
+            frame = stack[-1]
+            if loader.check_event(events.MappingEndEvent, events.SequenceEndEvent):
+                loader.get_event()
+                stack.pop()
+                continue
+            if not frame[0]:
+                pending.append((f"{frame[1]}[{frame[3]}]", frame[2]))
+                frame[3] += 1
+                continue
+
+            key_node = loader.compose_node(None, None)
+            if key_node.tag == 'tag:yaml.org,2002:merge':
+                merged = construct(loader.compose_node(None, None))
+                for mapping in (merged if isinstance(merged, list) else [merged]):
+                    if not isinstance(mapping, dict):
+                        raise yaml.constructor.ConstructorError(
+                            "while constructing a mapping", None,
+                            "expected a mapping for merging", key_node.start_mark)
+                    for k, v in mapping.items():
+                        yield from _iter_value_strings(v, f"{frame[1]}.{k}" if frame[1] else k, k)
+                continue
+            member_key = construct(key_node)
+            try:
+                hash(member_key)
+            except TypeError:
+                raise yaml.constructor.ConstructorError(
+                    "while constructing a mapping", None, "found unhashable key", key_node.start_mark)
+            pending.append((f"{frame[1]}.{member_key}" if frame[1] else member_key, member_key))
+
+        loader.get_event()  # DocumentEnd
+        if not loader.check_event(events.StreamEndEvent):
+            event = loader.get_event()
+            raise yaml.composer.ComposerError(
+                "expected a single document in the stream", None,
+                "but found another document", event.start_mark)
+    finally:
+        loader.dispose()
+
+
+def iter_xml_strings(source) -> Iterator[Tuple[str, str, str]]:
+    """
+    Yield ``(text, path, tag)`` for element text and tail of an XML file.
+
+    Uses ``ET.iterparse`` and clears every element once its tail is known,
+    so only the open ancestors stay in memory. Order matches the old tree
+    walk (text, tail, then children): a tail is only known after its
+    element's subtree, so it is slotted in behind the element's text and
+    output is released each time a child of the root is complete.
+    """
+    output: List[Tuple[str, str, str]] = []
+    # Frames: [element, path, text_taken, tail_slot]
+    stack: List[list] = []
+    # Finished element whose tail is settled by the next event: (frame, parent)
+    finished = None
+
+    for event, element in ET.iterparse(source, events=('start', 'end')):
+        if stack and not stack[-1][2]:
+            # Text is complete at the first child (start) or at the end tag
+            top = stack[-1]
+            top[2] = True
+            if top[0].text:
+                output.append((top[0].text, top[1], top[0].tag))
+            top[3] = len(output)
+
+        if finished is not None:
+            frame, parent = finished
+            finished = None
+            done = frame[0]
+            if done.tail:
+                # Later output belongs to this element's subtree only
+                output.insert(frame[3], (done.tail, f"{frame[1]}_tail", done.tag))
+            done.clear()
+            if len(parent) and parent[0] is done:
+                del parent[0]
+            else:
+                parent.remove(done)
+            if len(stack) == 1:
+                yield from output
+                output.clear()
+
+        if event == 'start':
+            path = f"{stack[-1][1]}/{element.tag}" if stack else element.tag
+            stack.append([element, path, False, 0])
+        else:
+            frame = stack.pop()
+            if stack:
+                finished = (frame, stack[-1][0])
+            else:
+                element.clear()  # The root never has a tail
+
+    yield from output
+
+
+_PATTERNS_LOCK = threading.Lock()
+
+
+def _freeze_registry(descriptors: List[Dict[str, Any]]) -> Tuple[Mapping[str, Any], ...]:
+    """Read-only view of a pattern registry shared by every parser."""
+    frozen = []
+    for descriptor in descriptors:
+        if 'lead' in descriptor:
+            descriptor = dict(descriptor, lead=frozenset(descriptor['lead']))
+        frozen.append(MappingProxyType(descriptor))
+    return tuple(frozen)
+
+
 class RenPyParser:
+    # Compiled patterns and registries are class attributes, see _init_patterns
+    _patterns_ready = False
+    # Line head -> candidate descriptors, filled lazily (see _candidate_patterns)
+    _dispatch_table: Dict[str, Tuple[Mapping[str, Any], ...]] = {}
+
     def __init__(self, config_manager=None):
         self.logger = logging.getLogger(__name__)
         self.config = config_manager
 
-        # Blacklist/whitelist for data keys
-        self.DATA_KEY_BLACKLIST = {
-            'id', 'code', 'name_id', 'image', 'img', 'icon', 'sfx', 'sound', 'audio',
-            'voice', 'file', 'path', 'url', 'link', 'type', 'ref', 'var', 'value_id', 'texture'
-        }
-        self.DATA_KEY_WHITELIST = {
-            'name', 'title', 'description', 'desc', 'text', 'content', 'caption',
-            'label', 'prompt', 'help', 'header', 'footer', 'message', 'dialogue',
-            'summary', 'quest', 'objective', 'char', 'character',
-            'tips', 'hints', 'help', 'notes', 'log', 'history', 'inventory', 'items', 'objectives', 'goals', 'achievements', 'gallery'
-        }
+        # Blacklist for technical keys in data files
+        self.DATA_KEY_BLACKLIST = set(DATA_KEY_BLACKLIST)
+        # Whitelist for keys that usually contain user-facing text
+        self.DATA_KEY_WHITELIST = set(DATA_KEY_WHITELIST)
 
-        # Technical terms for filtering
-        self.renpy_technical_terms = {
-            'left', 'right', 'center', 'top', 'bottom', 'gui', 'config',
-            'true', 'false', 'none', 'auto', 'png', 'jpg', 'mp3', 'ogg'
-        }
+        # Technical terms for filtering (see TEXT CLASSIFICATION)
+        self.renpy_technical_terms = RENPY_TECHNICAL_TERMS
+        # Classifier pinned for the duration of one file extraction
+        self._active_classifier = None
+        # (path, AdmissionDecision) of data files skipped/sampled by the last directory scan
+        self.admission_report: List[Tuple[Path, AdmissionDecision]] = []
+        # file -> lines matched in long line guard mode by the last extraction (see mask_dangling_quotes)
+        self.guarded_line_counts: Dict[str, int] = {}
 
+        self._init_patterns()
+    
+    @classmethod
+    def _init_patterns(cls) -> None:
+        """
+        Compile every extraction regex and the pattern registries.
+
+        Runs once per process; the results are class attributes shared
+        read-only by all parser instances (ASTTextExtractor creates a parser
+        per .rpyc file, the GUI and the pipeline create several more).
+        """
+        if cls._patterns_ready:
+            return
+        with _PATTERNS_LOCK:
+            if not cls._patterns_ready:
+                cls._compile_patterns()
+                cls._patterns_ready = True
+
+    @classmethod
+    def _compile_patterns(cls) -> None:
         # Regex for hidden labels
-        self.hidden_label_re = re.compile(r'^label\s+[A-Za-z_][\w\.]*\s+hide\s*:')
+        cls.hidden_label_re = re.compile(r'^label\s+[A-Za-z_][\w\.]*\s+hide\s*:')
 
-        self.label_def_re = re.compile(r'^label\s+([A-Za-z_][\w\.]*)\s*(?!hide):')  # Negative lookahead for 'hide'
+        cls.label_def_re = re.compile(r'^label\s+([A-Za-z_][\w\.]*)\s*(?!hide):')  # Negative lookahead for 'hide'
 
-        self.multiline_registry = []  # Initialize as an empty list
-        self.menu_def_re = re.compile(r'^menu\s*(?:"([^"]*)"|\'([^\']*)\')?:')
+        cls.menu_def_re = re.compile(r'^menu\s*(?:"([^"]*)"|\'([^\']*)\')?:')
 
         # Regex for screen definitions
-        self.screen_def_re = re.compile(r'^screen\s+([A-Za-z_][\w\.]*)\s*:\s*$')
+        cls.screen_def_re = re.compile(r'^screen\s+([A-Za-z_][\w\.]*)\s*:\s*$')
 
-        # Registry for patterns
-        self.pattern_registry = []  # Initialize as an empty list
         # Regex for python blocks
-        self.python_block_re = re.compile(
+        cls.python_block_re = re.compile(
             r'^\s*python\s*(?:early|hide)?\s*(?:in\s+\w+)?\s*:|^\s*init\s+(?:[-+]?\d+\s+)?python\s*(?:hide|in\s+\w+)?\s*:'
         )
-        
-        # Initialize all pattern definitions (moved from dead code location)
-        self._init_patterns()
-    
-    def _init_patterns(self):
-        """Initialize all regex patterns for text extraction."""
-        self.char_dialog_re = re.compile(
+
+        cls.char_dialog_re = re.compile(
             r'^(?P<indent>\s*)(?P<char>[A-Za-z_]\w*)\s+'
             r'(?P<quote>"(?:[^"\\]|\\.)*"|\'(?:[^\\\']|\\.)*\')'
         )
-        self.narrator_re = re.compile(
+        cls.narrator_re = re.compile(
             r'^(?P<indent>\s*)(?P<quote>"(?:[^"\\]|\\.)*"|\'(?:[^\\\']|\\.)*\')\s*(?:#.*)?$'
         )
 
-        self.char_multiline_re = re.compile(
+        cls.char_multiline_re = re.compile(
             r'^(?P<indent>\s*)(?P<char>[A-Za-z_]\w*)\s+(?P<delim>"""|\'\'\')(?P<body>.*)$'
         )
         # Multiline narrator pattern - exclude closing patterns like """)
-        self.narrator_multiline_re = re.compile(
+        cls.narrator_multiline_re = re.compile(
             r'^(?P<indent>\s*)(?P<delim>"""|\'\'\')(?P<body>(?![\s]*\)).*)$'
         )
-        self.extend_multiline_re = re.compile(
+        cls.extend_multiline_re = re.compile(
             r'^(?P<indent>\s*)extend\s+(?P<delim>"""|\'\'\')(?P<body>(?![\s]*\)).*)$'
         )
 
-        self.menu_choice_re = re.compile(
+        cls.menu_choice_re = re.compile(
             r'^\s*(?P<quote>"(?:[^"\\]|\\.)*"|\'(?:[^\\\']|\\.)*\')\s*(?:if\s+[^:]+)?\s*:\s*'
         )
         # Menu choice multiline - exclude closing patterns
-        self.menu_choice_multiline_re = re.compile(
+        cls.menu_choice_multiline_re = re.compile(
             r'^\s*(?P<delim>"""|\'\'\')(?P<body>(?![\s]*\)).*)\s*(?:if\s+[^:]+)?\s*:\s*$'
         )
-        self.menu_title_re = re.compile(
+        cls.menu_title_re = re.compile(
             r'^\s*menu\s*(?:[rRuUbBfF]{,2})?(?P<quote>"(?:[^"\\]|\\.)*"|\'(?:[^\\\']|\\.)*\')?:'
         )
 
-        self.screen_text_re = re.compile(
+        cls.screen_text_re = re.compile(
             r'\s*(?:text|label|tooltip|vbar|slider|frame|window)\s+(?:_\s*\(\s*)?(?:[rRuUbBfF]{,2})?(?P<quote>"(?:[^"\\]|\\.)*"|\'(?:[^\\\']|\\.)*\')(?:\s*\))?'
         )
-        self.textbutton_re = re.compile(
+        cls.textbutton_re = re.compile(
             r'^\s*textbutton\s+(?:_\s*\(\s*)?(?:[rRuUbBfF]{,2})?(?P<quote>"(?:[^"\\]|\\.)*"|\'(?:[^\\\']|\\.)*\')(?:\s*\))?'
         )
         
         # Special patterns for _() marked screen elements - these should ALWAYS be translated
         # textbutton _("History") - navigation buttons (may have additional attributes after)
-        self.textbutton_translatable_re = re.compile(
+        cls.textbutton_translatable_re = re.compile(
             r"^\s*textbutton\s+_\s*\(\s*(?:[rRuUbBfF]{,2})?(?P<quote>\"(?:[^\"\\]|\\.)*\"|'(?:[^\\']|\\.)*')\s*\)"
         )
         # text _("some text") - marked for translation (may have additional attributes like size, color after)
-        self.screen_text_translatable_re = re.compile(
+        cls.screen_text_translatable_re = re.compile(
             r"^\s*(?:text|label|tooltip)\s+_\s*\(\s*(?:[rRuUbBfF]{,2})?(?P<quote>\"(?:[^\"\\]|\\.)*\"|'(?:[^\\']|\\.)*')\s*\)"
         )
         
-        self.screen_multiline_re = re.compile(
+        cls.screen_multiline_re = re.compile(
             r'^\s*(?:text|label|tooltip|textbutton)\s+(?:_\s*\(\s*)?(?P<delim>"""|\'\'\')(?P<body>.*)$'
         )
 
-        self.config_string_re = re.compile(
+        cls.config_string_re = re.compile(
             r"^\s*config\.(?:name|version|about|menu_|window_title|save_name)\s*=\s*(?:[rRuUbBfF]{,2})?(?P<quote>\"(?:[^\"\\]|\\.)*\"|'(?:[^\\']|\\.)*')"
         )
-        self.gui_text_re = re.compile(
+        cls.gui_text_re = re.compile(
             r'^\s*gui\.(?:text|button|label|title|heading|caption|tooltip|confirm)(?:_[a-z_]*)?(?:\[[^\]]*\])?\s*=\s*(?P<quote>"(?:[^"\\]|\\.)*"|\'(?:[^\\\']|\\.)*\')'
         )
-        self.style_property_re = re.compile(
+        cls.style_property_re = re.compile(
             r'^\s*style\s*\.\s*[a-zA-Z_]\w*\s*=\s*(?P<quote>"(?:[^"\\]|\\.)*"|\'(?:[^\\\']|\\.)*\')'
         )
         
         # _p() function for multi-line paragraph text (single-line version)
-        self._p_single_re = re.compile(
+        cls._p_single_re = re.compile(
             r'^\s*(?:define\s+)?(?:gui|config)\.[a-zA-Z_]\w*\s*=\s*_p\s*\(\s*(?P<quote>"(?:[^"\\]|\\.)*"|\'(?:[^\\\']|\\.)*\')\s*\)'
         )
         
         # _p() function with triple-quoted strings (multi-line)
-        self._p_multiline_re = re.compile(
+        cls._p_multiline_re = re.compile(
             r'^\s*(?:define\s+)?(?:gui|config)\.[a-zA-Z_]\w*\s*=\s*_p\s*\(\s*(?P<delim>"""|\'\'\')(?P<body>.*)$'
         )
         
         # _() translation marker function (also for Character names)
-        self._underscore_re = re.compile(
+        cls._underscore_re = re.compile(
             r'^\s*(?:define\s+)?[a-zA-Z_]\w*\s*=\s*(?:Character\s*\(\s*)?_\s*\(\s*(?P<quote>"(?:[^"\\]|\\.)*"|\'(?:[^\\\']|\\.)*\')\s*\)?'
         )
         
         # define statement with simple string (fallback)
-        self.define_string_re = re.compile(
+        cls.define_string_re = re.compile(
             r'^\s*define\s+(?:gui|config)\.[a-zA-Z_]\w*\s*=\s*(?P<quote>"(?:[^"\\]|\\.)*"|\'(?:[^\\\']|\\.)*\')'
         )
         
         # ========== OPTIMIZED SCREEN ELEMENT PATTERNS ==========
         # Combined alt text pattern for imagebutton, hotspot, hotbar (accessibility)
-        self.alt_text_re = re.compile(
+        cls.alt_text_re = re.compile(
             r'^\s*(?:imagebutton|hotspot|hotbar)\s+.*?\balt\s+(?P<quote>"(?:[^"\\]|\\.)*"|\'(?:[^\\\']|\\.)*\')'
         )
         
         # Combined input pattern for default/prefix/suffix
-        self.input_text_re = re.compile(
+        cls.input_text_re = re.compile(
             r'^\s*input\s+.*?\b(?:default|prefix|suffix)\s+(?P<quote>"(?:[^"\\]|\\.)*"|\'(?:[^\\\']|\\.)*\')'
         )
         
-        self.gui_text_re = re.compile(
+        cls.gui_text_re = re.compile(
             r"^\s*gui\.(?:text|button|label|title|heading|caption|tooltip|confirm)(?:_[a-z_]*)?(?:\[[^\]]*\])?\s*=\s*(?:[rRuUbBfF]{,2})?(?P<quote>\"(?:[^\"\\]|\\.)*\"|'(?:[^\\']|\\.)*')"
         )
-        self.style_property_re = re.compile(
+        cls.style_property_re = re.compile(
             r"^\s*style\s*\.\s*[a-zA-Z_]\w*\s*=\s*(?:[rRuUbBfF]{,2})?(?P<quote>\"(?:[^\"\\]|\\.)*\"|'(?:[^\\']|\\.)*')"
         )
-        self.confirm_re = re.compile(
+        cls.confirm_re = re.compile(
             r'^\s*(?:\$\s+)?(?:renpy\.)?[Cc]onfirm\s*\(\s*(?P<quote>"(?:[^"\\]|\\.)*"|\'(?:[^\\\']|\\.)*\')'
         )
         
         # renpy.input() function with prompt (also used as renpy_input_re alias)
-        self.renpy_input_re = re.compile(
+        cls.renpy_input_re = re.compile(
             r'^\s*(?:\$\s+)?renpy\.input\s*\(\s*(?P<quote>"(?:[^"\\]|\\.)*"|\'(?:[^\\\']|\\.)*\')'
         )
         
@@ -198,167 +1940,163 @@ class RenPyParser:
         # NVL character is handled same as regular character dialogue
         
         # extend statement (continuation of previous dialogue)
-        self.extend_re = re.compile(
+        cls.extend_re = re.compile(
             r'^\s*extend\s+(?P<quote>"(?:[^"\\]|\\.)*"|\'(?:[^\\\']|\\.)*\')'
         )
         
         # side text for side images (side "...")
-        self.side_text_re = re.compile(
+        cls.side_text_re = re.compile(
             r'^\s*side\s+(?P<quote>"(?:[^"\\]|\\.)*"|\'(?:[^\\\']|\\.)*\')'
         )
         
         # Notify action: Notify("message")
-        self.notify_re = re.compile(
+        cls.notify_re = re.compile(
             r'^\s*(?:\$\s+)?(?:renpy\.)?[Nn]otify\s*\(\s*(?P<quote>"(?:[^"\\]|\\.)*"|\'(?:[^\\\']|\\.)*\')'
         )
         
         # Notify with string concatenation: renpy.notify("text" + str(var))
-        self.notify_concat_re = re.compile(
+        cls.notify_concat_re = re.compile(
             r'(?:renpy\.)?[Nn]otify\s*\(\s*(?P<quote>"(?:[^"\\]|\\.)*"|\'(?:[^\\\']|\\.)*\')\s*\+'
         )
         
         # Python renpy function calls: $ renpy.xxx("...")
-        self.python_renpy_re = re.compile(
+        cls.python_renpy_re = re.compile(
             r'^\s*\$\s+renpy\.[a-zA-Z_]\w*\s*\([^)]*(?P<quote>"(?:[^"\\]|\\.)*"|\'(?:[^\\\']|\\.)*\')'
         )
         
         # general renpy.xxx() function calls
-        self.renpy_function_re = re.compile(
+        cls.renpy_function_re = re.compile(
             r'^\s*renpy\.[a-zA-Z_]\w*\s*\([^)]*(?P<quote>"(?:[^"\\]|\\.)*"|\'(?:[^\\\']|\\.)*\')'
         )
         
         # gui.xxx = "..." variable assignments
-        self.gui_variable_re = re.compile(
+        cls.gui_variable_re = re.compile(
             r'^\s*gui\.[a-zA-Z_]\w*\s*=\s*(?P<quote>"(?:[^"\\]|\\.)*"|\'(?:[^\\\']|\\.)*\')'
         )
         
         # renpy.show_screen() and similar with string arguments
-        self.renpy_show_re = re.compile(
+        cls.renpy_show_re = re.compile(
             r'^\s*(?:\$\s+)?renpy\.(?:show_screen|call_screen|hide_screen)\s*\([^)]*(?P<quote>"(?:[^"\\]|\\.)*"|\'(?:[^\\\']|\\.)*\')'
         )
         
         # ATL text property: text "..."
-        self.atl_text_re = re.compile(
+        cls.atl_text_re = re.compile(
             r'^\s*text\s+(?P<quote>"(?:[^"\\]|\\.)*"|\'(?:[^\\\']|\\.)*\')\s*$'
         )
         
         # renpy.say() function
-        self.renpy_say_re = re.compile(
+        cls.renpy_say_re = re.compile(
             r'^\s*(?:\$\s+)?renpy\.say\s*\([^,]*,\s*(?P<quote>"(?:[^"\\]|\\.)*"|\'(?:[^\\\']|\\.)*\')'
         )
         
         # action _("text") pattern - for action attributes with translation markers
-        self.action_text_re = re.compile(
+        cls.action_text_re = re.compile(
             r'^\s*action\s+.*?_\s*\(\s*(?P<quote>"(?:[^"\\]|\\.)*"|\'(?:[^\\\']|\\.)*\')\s*\)'
         )
         
         # caption "..." attribute
-        self.caption_re = re.compile(
+        cls.caption_re = re.compile(
             r'^\s*caption\s+(?P<quote>"(?:[^"\\]|\\.)*"|\'(?:[^\\\']|\\.)*\')'
         )
         
         # frame/window title
-        self.frame_title_re = re.compile(
+        cls.frame_title_re = re.compile(
             r'^\s*(?:frame|window)\s+.*?title\s+(?P<quote>"(?:[^"\\]|\\.)*"|\'(?:[^\\\']|\\.)*\')'
         )
         
         # Generic _("...") translation marker anywhere in line
-        self.generic_translatable_re = re.compile(
+        cls.generic_translatable_re = re.compile(
             r'_\s*\(\s*(?P<quote>"(?:[^"\\]|\\.)*"|\'(?:[^\\\']|\\.)*\')\s*\)'
         )
         
         # layout text: text "..." layout
-        self.layout_text_re = re.compile(
+        cls.layout_text_re = re.compile(
             r'^\s*(?:hbox|vbox|grid|fixed|frame|window|viewport)\s*:\s*$'
         )
         # store.xxx = "..." variable assignments (deep scan)
-        self.store_text_re = re.compile(
+        cls.store_text_re = re.compile(
             r'^\s*store\.[a-zA-Z0-9_]+\s*=\s*(?P<quote>"(?:[^"\\]|\\.)*"|\'(?:[^\\\']|\\.)*\')'
         )
-        self.general_define_re = re.compile(
+        cls.general_define_re = re.compile(
             r'^\s*define\s+[a-zA-Z0-9_.]+\s*=\s*(?P<quote>"(?:[^"\\]|\\.)*"|\'(?:[^\\\']|\\.)*\')'
         )
 
-        # Register new patterns in the pattern registry
-        self.pattern_registry = [
-            {'regex': self.layout_text_re, 'type': 'layout'},
-            {'regex': self.store_text_re, 'type': 'store'},
-            {'regex': self.general_define_re, 'type': 'define'},
+        # Register new patterns in the pattern registry.
+        # 'lead' lists the first word a line must start with (after indentation)
+        # for the pattern to have any chance of matching; see _candidate_patterns.
+        renpy_calls = {'renpy', '$renpy'}
+        pattern_registry = [
+            {'regex': cls.layout_text_re, 'type': 'layout', 'lead': set()},  # has no quote group
+            {'regex': cls.store_text_re, 'type': 'store', 'lead': {'store'}},
+            {'regex': cls.general_define_re, 'type': 'define', 'lead': {'define'}},
             # Most specific patterns first
             # Combined patterns for better maintainability
-            {'regex': self.alt_text_re, 'type': 'alt_text'},
-            {'regex': self.input_text_re, 'type': 'input'},
-            {'regex': self.notify_re, 'type': 'notify'},
-            {'regex': self.notify_concat_re, 'type': 'notify'},  # notify with string concatenation
-            {'regex': self.confirm_re, 'type': 'confirm'},
-            {'regex': self.renpy_input_re, 'type': 'input'},
+            {'regex': cls.alt_text_re, 'type': 'alt_text', 'lead': {'imagebutton', 'hotspot', 'hotbar'}},
+            {'regex': cls.input_text_re, 'type': 'input', 'lead': {'input'}},
+            {'regex': cls.notify_re, 'type': 'notify', 'lead': renpy_calls | {'Notify', 'notify', '$Notify', '$notify'}},
+            {'regex': cls.notify_concat_re, 'type': 'notify', 'lead': {'renpy', 'Notify', 'notify'}},  # notify with string concatenation
+            {'regex': cls.confirm_re, 'type': 'confirm', 'lead': renpy_calls | {'Confirm', 'confirm', '$Confirm', '$confirm'}},
+            {'regex': cls.renpy_input_re, 'type': 'input', 'lead': renpy_calls},
             # _() marked screen elements - ALWAYS translatable (check BEFORE general patterns)
-            {'regex': self.textbutton_translatable_re, 'type': 'translatable_string'},
-            {'regex': self.screen_text_translatable_re, 'type': 'translatable_string'},
+            {'regex': cls.textbutton_translatable_re, 'type': 'translatable_string', 'lead': {'textbutton'}},
+            {'regex': cls.screen_text_translatable_re, 'type': 'translatable_string', 'lead': {'text', 'label', 'tooltip'}},
             # NEW: Enhanced patterns for better coverage
-            {'regex': self.atl_text_re, 'type': 'ui'},           # ATL text blocks
-            {'regex': self.renpy_say_re, 'type': 'dialogue'},    # renpy.say() calls
-            {'regex': self.action_text_re, 'type': 'translatable_string'},  # action _("text")
-            {'regex': self.caption_re, 'type': 'ui'},            # caption attributes
-            {'regex': self.frame_title_re, 'type': 'ui'},        # frame/window titles
-            {'regex': self.generic_translatable_re, 'type': 'translatable_string'},  # generic _()
+            {'regex': cls.atl_text_re, 'type': 'ui', 'lead': {'text'}},           # ATL text blocks
+            {'regex': cls.renpy_say_re, 'type': 'dialogue', 'lead': renpy_calls},    # renpy.say() calls
+            {'regex': cls.action_text_re, 'type': 'translatable_string', 'lead': {'action'}},  # action _("text")
+            {'regex': cls.caption_re, 'type': 'ui', 'lead': {'caption'}},            # caption attributes
+            {'regex': cls.frame_title_re, 'type': 'ui', 'lead': {'frame', 'window'}},        # frame/window titles
+            {'regex': cls.generic_translatable_re, 'type': 'translatable_string', 'lead': {'_'}},  # generic _()
             # _p() and _() function patterns
-            {'regex': self._p_single_re, 'type': 'paragraph'},
-            {'regex': self._underscore_re, 'type': 'translatable_string'},
-            {'regex': self.define_string_re, 'type': 'define'},
+            {'regex': cls._p_single_re, 'type': 'paragraph', 'lead': {'define', 'gui', 'config'}},
+            {'regex': cls._underscore_re, 'type': 'translatable_string', 'lead': {LEAD_ANY_WORD}},
+            {'regex': cls.define_string_re, 'type': 'define', 'lead': {'define'}},
             # Config/GUI patterns
-            {'regex': self.config_string_re, 'type': 'config'},
-            {'regex': self.gui_text_re, 'type': 'gui'},
-            {'regex': self.style_property_re, 'type': 'style'},
+            {'regex': cls.config_string_re, 'type': 'config', 'lead': {'config'}},
+            {'regex': cls.gui_text_re, 'type': 'gui', 'lead': {'gui'}},
+            {'regex': cls.style_property_re, 'type': 'style', 'lead': {'style'}},
             # Screen UI patterns (textbutton before general text)
-            {'regex': self.textbutton_re, 'type': 'button'},
-            {'regex': self.screen_text_re, 'type': 'ui'},
-            {'regex': self.side_text_re, 'type': 'ui'},
+            {'regex': cls.textbutton_re, 'type': 'button', 'lead': {'textbutton'}},
+            {'regex': cls.screen_text_re, 'type': 'ui', 'lead': {'text', 'label', 'tooltip', 'vbar', 'slider', 'frame', 'window'}},
+            {'regex': cls.side_text_re, 'type': 'ui', 'lead': {'side'}},
             # Menu patterns
-            {'regex': self.menu_choice_re, 'type': 'menu'},
-            {'regex': self.menu_title_re, 'type': 'menu'},
+            {'regex': cls.menu_choice_re, 'type': 'menu', 'lead': {LEAD_QUOTE}},
+            # menu may be glued to a string prefix: menu f"...":
+            {'regex': cls.menu_title_re, 'type': 'menu',
+             'lead': {'menu' + a + b for a in ('',) + tuple(STRING_PREFIXES) for b in ('',) + tuple(STRING_PREFIXES)}},
             # Python/renpy functions
-            {'regex': self.python_renpy_re, 'type': 'renpy_func'},
-            {'regex': self.renpy_function_re, 'type': 'renpy_func'},
+            {'regex': cls.python_renpy_re, 'type': 'renpy_func', 'lead': {'$renpy'}},
+            {'regex': cls.renpy_function_re, 'type': 'renpy_func', 'lead': {'renpy'}},
             # Dialogue patterns (most general - last)
-            {'regex': self.char_dialog_re, 'type': 'dialogue', 'character_group': 'char'},
-            {'regex': self.extend_re, 'type': 'dialogue'},
-            {'regex': self.narrator_re, 'type': 'dialogue'},
-            {'regex': self.gui_variable_re, 'type': 'gui'},
-            {'regex': self.renpy_show_re, 'type': 'ui'},
+            {'regex': cls.char_dialog_re, 'type': 'dialogue', 'character_group': 'char', 'lead': {LEAD_ANY_WORD}},
+            {'regex': cls.extend_re, 'type': 'dialogue', 'lead': {'extend'}},
+            {'regex': cls.narrator_re, 'type': 'dialogue', 'lead': {LEAD_QUOTE}},
+            {'regex': cls.gui_variable_re, 'type': 'gui', 'lead': {'gui'}},
+            {'regex': cls.renpy_show_re, 'type': 'ui', 'lead': renpy_calls},
         ]
+        cls.pattern_registry = _freeze_registry(pattern_registry)
 
-        self.multiline_registry = [
-            {'regex': self.char_multiline_re, 'type': 'dialogue', 'character_group': 'char'},
-            {'regex': self.extend_multiline_re, 'type': 'dialogue'},
-            {'regex': self.narrator_multiline_re, 'type': 'dialogue'},
-            {'regex': self.screen_multiline_re, 'type': 'ui'},
+        cls.multiline_registry = _freeze_registry([
+            {'regex': cls.char_multiline_re, 'type': 'dialogue', 'character_group': 'char'},
+            {'regex': cls.extend_multiline_re, 'type': 'dialogue'},
+            {'regex': cls.narrator_multiline_re, 'type': 'dialogue'},
+            {'regex': cls.screen_multiline_re, 'type': 'ui'},
             # _p() multi-line patterns - check FIRST as it's most specific
-            {'regex': self._p_multiline_re, 'type': 'paragraph'},
-        ]
-
-        self.renpy_technical_terms = {
-            'left', 'right', 'center', 'top', 'bottom', 'gui', 'config',
-            'true', 'false', 'none', 'auto', 'png', 'jpg', 'mp3', 'ogg'
-        }
+            {'regex': cls._p_multiline_re, 'type': 'paragraph'},
+        ])
 
-        # Blacklist for technical keys in data files
-        self.DATA_KEY_BLACKLIST = set(DATA_KEY_BLACKLIST)
-        # Whitelist for keys that usually contain user-facing text
-        self.DATA_KEY_WHITELIST = set(DATA_KEY_WHITELIST)
-
-    def extract_from_csv(self, file_path: Path) -> List[Dict[str, Any]]:
-        """Extract translatable text from CSV files."""
+    def extract_from_csv(self, file_path: Path, max_bytes: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Extract translatable text from CSV files (only the first ``max_bytes`` when given)."""
         entries = []
         try:
             import csv
             # Ren'Py devs often use UTF-8, but sometimes Excel saves as CP1252. We try UTF-8 first.
             try:
-                content = self._read_file_lines(file_path)
+                content = self._read_file_lines(file_path, max_bytes)
             except Exception:
                 # Fallback to reading as generic text if helper fails
                 with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.readlines()
+                    content = f.readlines(max_bytes or -1)
             # Re-join to parse with CSV module
             full_text = '\n'.join(content)
             from io import StringIO
@@ -385,11 +2123,11 @@ class RenPyParser:
             self.logger.error(f"CSV parsing error {file_path}: {e}")
         return entries
 
-    def extract_from_txt(self, file_path: Path) -> List[Dict[str, Any]]:
-        """Extract translatable text from TXT files (one line = one entry)."""
+    def extract_from_txt(self, file_path: Path, max_bytes: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Extract translatable text from TXT files (one line = one entry, first ``max_bytes`` when given)."""
         entries = []
         try:
-            lines = self._read_file_lines(file_path)
+            lines = self._read_file_lines(file_path, max_bytes)
             for idx, line in enumerate(lines):
                 line = line.strip()
                 if self.is_meaningful_text(line):
@@ -413,15 +2151,54 @@ class RenPyParser:
         return await loop.run_in_executor(None, self.extract_translatable_text, file_path)
 
     def extract_text_entries(self, file_path: Union[str, Path]) -> List[Dict[str, Any]]:
+        return self._cached_extract('entries', file_path, self._extract_text_entries_uncached)
+
+    def get_extraction_cache(self):
+        """Kalıcı extraction cache'i döndür (config yoksa veya kapalıysa None)."""
+        try:
+            from .extraction_cache import get_extraction_cache
+        except ImportError:
+            return None
+        return get_extraction_cache(self.config)
+
+    def _cached_extract(self, kind: str, file_path: Union[str, Path], extractor) -> List[Dict[str, Any]]:
+        """
+        Serve ``extractor(file_path)`` from the on-disk cache when the file and
+        the type filters are unchanged; otherwise run it and store the result.
+        """
+        cache = self.get_extraction_cache()
+        if cache is None:
+            return extractor(file_path)
+
+        fingerprint = settings_fingerprint(self.config)
+        cached = cache.lookup(file_path, kind, fingerprint)
+        if cached is not None:
+            return [TextEntry.from_mapping(entry) for entry in cached]
+        entries = extractor(file_path)
+        cache.store(file_path, kind, fingerprint, entries)
+        return entries
+
+    def _extract_text_entries_uncached(
+        self, file_path: Union[str, Path], read_lines=None
+    ) -> List[Dict[str, Any]]:
         try:
-            lines = self._read_file_lines(file_path)
+            lines = (read_lines or self._read_file_lines)(file_path)
         except Exception as exc:
             self.logger.error("Error reading %s: %s", file_path, exc)
             return []
 
+        # Resolve the classifier once per file instead of once per entry
+        self._active_classifier = self.text_classifier()
+        try:
+            return self._extract_lines(file_path, lines)
+        finally:
+            self._active_classifier = None
+
+    def _extract_lines(self, file_path: Union[str, Path], lines: List[str]) -> List[Dict[str, Any]]:
         entries: List[Dict[str, Any]] = []
         context_stack: List[ContextNode] = []
         index = 0
+        guarded_lines = 0
 
         # Main line processing loop
         while index < len(lines):
@@ -434,13 +2211,26 @@ class RenPyParser:
             indent = self._calculate_indent(raw_line)
             self._pop_contexts(context_stack, indent)
             pending_context = self._detect_new_context(stripped_line, indent)
-            context_path = self._build_context_path(context_stack, pending_context)
-            self._pop_contexts(context_stack, indent)
-            pending_context = self._detect_new_context(stripped_line, indent)
+
+            # Every text pattern needs a string literal; scene/show/with/ATL lines
+            # and plain python statements only update the context stack.
+            if '"' not in raw_line and "'" not in raw_line:
+                if pending_context:
+                    context_stack.append(pending_context)
+                index += 1
+                continue
+
             context_path = self._build_context_path(context_stack, pending_context)
 
+            # Çok uzun satırlar maskelenmiş kopyada eşleştirilir (LONG LINE GUARD)
+            scan_line = raw_line
+            if len(raw_line) > LONG_LINE_THRESHOLD:
+                scan_line = mask_dangling_quotes(raw_line)
+                guarded_lines += 1
+
             multi_entry, consumed_idx = self._handle_multiline_start(
-                lines, index, raw_line, stripped_line, context_path, file_path=str(file_path)
+                lines, index, raw_line, stripped_line, context_path,
+                file_path=str(file_path), scan_line=scan_line,
             )
             if multi_entry:
                 entries.append(multi_entry)
@@ -450,8 +2240,8 @@ class RenPyParser:
                 continue
 
             matched = False
-            for descriptor in self.pattern_registry:
-                match = descriptor['regex'].match(raw_line)
+            for descriptor in self._candidate_patterns(raw_line):
+                match = guarded_match(descriptor['regex'], raw_line, scan_line)
                 if not match:
                     continue
 
@@ -500,68 +2290,76 @@ class RenPyParser:
             else:
                 index += 1
 
+        if guarded_lines:
+            self.guarded_line_counts[str(file_path)] = guarded_lines
+            self.logger.info(
+                "%s: %d line(s) over %d characters matched with the long line guard",
+                file_path, guarded_lines, LONG_LINE_THRESHOLD,
+            )
         return entries
 
+    def _candidate_patterns(self, raw_line: str) -> Tuple[Mapping[str, Any], ...]:
+        """
+        Registry patterns that can match ``raw_line``, in registry order.
+
+        Lines are classified by their first word (``e``, ``textbutton``,
+        ``$renpy``...) or by a leading quote; the candidate list for each class
+        is built once per process. Order is kept because the first matching
+        pattern decides the text type.
+        """
+        head = _LINE_HEAD_RE.match(raw_line)
+        prefix = '$' if head.group('dollar') else ''
+        if head.group('word'):
+            key = prefix + head.group('word')
+        elif head.group('quote'):
+            key = prefix + LEAD_QUOTE
+        else:
+            key = prefix
+
+        candidates = self._dispatch_table.get(key)
+        if candidates is None:
+            plain_word = bool(head.group('word')) and not prefix
+            candidates = tuple(
+                descriptor for descriptor in self.pattern_registry
+                if 'lead' not in descriptor
+                or key in descriptor['lead']
+                or (plain_word and LEAD_ANY_WORD in descriptor['lead'])
+            )
+            self._dispatch_table[key] = candidates
+        return candidates
+
     def extract_from_json(self, file_path: Path) -> List[Dict[str, Any]]:
         """
         Extract translatable strings from a JSON file.
-        """
-        entries = []
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
 
-            def recurse(obj, path, current_key):
-                if isinstance(obj, str):
-                    if self._is_meaningful_data_value(obj, current_key):
-                        entries.append({
-                            'text': obj,
-                            'line_number': 0,
-                            'context_line': f"json:{path}",
-                            'text_type': 'string',
-                            'file_path': str(file_path)
-                        })
-                elif isinstance(obj, dict):
-                    for k, v in obj.items():
-                        recurse(v, f"{path}.{k}" if path else k, k)
-                elif isinstance(obj, list):
-                    for i, v in enumerate(obj):
-                        recurse(v, f"{path}[{i}]", current_key)
-
-            recurse(data, "", None)
-        except Exception as e:
-            self.logger.error(f"JSON parsing error {file_path}: {e}")
-        return entries
+        The file is tokenized incrementally (see iter_json_strings), so large
+        item/quest databases are never loaded as a whole object tree.
+        """
+        return self._extract_data_strings(file_path, 'json', iter_json_strings)
 
     def extract_from_yaml(self, file_path: Path) -> List[Dict[str, Any]]:
         """
-        Extract translatable strings from a YAML file.
+        Extract translatable strings from a YAML file (event stream, see iter_yaml_strings).
         """
+        return self._extract_data_strings(file_path, 'yaml', iter_yaml_strings)
+
+    def _extract_data_strings(self, file_path: Path, kind: str, reader) -> List[Dict[str, Any]]:
         entries = []
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
-
-            def recurse(obj, path, current_key):
-                if isinstance(obj, str):
-                    if self._is_meaningful_data_value(obj, current_key):
+                for text, path, key in reader(f):
+                    if self._is_meaningful_data_value(text, key):
                         entries.append({
-                            'text': obj,
+                            'text': text,
                             'line_number': 0,
-                            'context_line': f"yaml:{path}",
+                            'context_line': f"{kind}:{path}",
                             'text_type': 'string',
                             'file_path': str(file_path)
                         })
-                elif isinstance(obj, dict):
-                    for k, v in obj.items():
-                        recurse(v, f"{path}.{k}" if path else k, k)
-                elif isinstance(obj, list):
-                    for i, v in enumerate(obj):
-                        recurse(v, f"{path}[{i}]", current_key)
-
-            recurse(data, "", None)
         except Exception as e:
-            self.logger.error(f"YAML parsing error {file_path}: {e}")
+            self.logger.error(f"{kind.upper()} parsing error {file_path}: {e}")
+            # A broken file yields nothing, as when it was loaded in one piece
+            return []
         return entries
 
     def extract_from_ini(self, file_path: Path) -> List[Dict[str, Any]]:
@@ -590,102 +2388,180 @@ class RenPyParser:
     def extract_from_xml(self, file_path: Path) -> List[Dict[str, Any]]:
         """
         Extract translatable strings from an XML file.
+
+        Parsed with iterparse (see iter_xml_strings); finished elements are
+        cleared so memory stays flat for large data files.
         """
         entries = []
         try:
-            tree = ET.parse(file_path)
-            root = tree.getroot()
-
-            def recurse_xml(node, path):
-                # Check text content inside the tag
-                if node.text and self._is_meaningful_data_value(node.text, node.tag):
+            for text, path, tag in iter_xml_strings(str(file_path)):
+                if self._is_meaningful_data_value(text, tag):
                     entries.append({
-                        'text': node.text,
+                        'text': text,
                         'line_number': 0,
                         'context_line': f"xml:{path}",
                         'text_type': 'string',
                         'file_path': str(file_path)
                     })
-
-                # Check tail text (text after the tag but before the next tag)
-                if node.tail and self._is_meaningful_data_value(node.tail, node.tag):
-                    entries.append({
-                        'text': node.tail,
-                        'line_number': 0,
-                        'context_line': f"xml:{path}_tail",
-                        'text_type': 'string',
-                        'file_path': str(file_path)
-                    })
-
-                for child in node:
-                    recurse_xml(child, f"{path}/{child.tag}")
-
-            recurse_xml(root, root.tag)
         except Exception as e:
             self.logger.error(f"XML parsing error {file_path}: {e}")
+            return []
         return entries
 
-    def parse_directory(self, directory: Union[str, Path], include_deep_scan: bool = True, recursive: bool = True) -> Dict[Path, List[Dict[str, Any]]]:
+    def parse_directory(
+        self,
+        directory: Union[str, Path],
+        include_deep_scan: bool = True,
+        recursive: bool = True,
+        file_index: Optional[ProjectFileIndex] = None,
+    ) -> Dict[Path, List[Dict[str, Any]]]:
         """
         Parse a directory for translatable strings, including .rpy, .json, .yaml, .xml, and .ini files.
-        """
-        directory = Path(directory)
-        search_root = self._resolve_search_root(directory)
-        results: Dict[Path, List[Dict[str, Any]]] = {}
-
-        def _in_tl_folder(path: Path) -> bool:
-            try:
-                rel = path.relative_to(search_root)
-                return str(rel).replace('\\', '/').lower().startswith('tl/')
-            except Exception:
-                return False
 
-        # Existing logic for .rpy and .rpym files (skip tl/)
-        rpy_files = list(search_root.glob("**/*.rpy")) + list(search_root.glob("**/*.rpym"))
-        for file_path in rpy_files:
-            if not _in_tl_folder(file_path):
-                results[file_path] = self.extract_text_entries(file_path)
+        The project is listed once (see ``ProjectFileIndex``) and every file is
+        dispatched to its extractor by suffix. Pass ``file_index`` to reuse a
+        listing that was already made for the same directory.
+        """
+        return dict(self.iter_file_entries(directory, recursive=recursive, file_index=file_index))
 
-        # Logic for .json files
-        json_files = [f for f in search_root.glob("**/*.json") if not _in_tl_folder(f)]
-        for file_path in json_files:
-            results[file_path] = self.extract_from_json(file_path)
+    def iter_file_entries(
+        self,
+        directory: Union[str, Path],
+        include_rpy: bool = True,
+        include_deep_scan: bool = False,
+        include_data_files: bool = True,
+        include_rpyc: bool = False,
+        recursive: bool = True,
+        file_index: Optional[ProjectFileIndex] = None,
+        source_mode: Optional[str] = None,
+    ) -> Iterator[Tuple[Path, List[Dict[str, Any]]]]:
+        """
+        Yield ``(file_path, entries)`` one file at a time, as soon as each file is parsed.
 
-        # Logic for .csv files
-        csv_files = [f for f in search_root.glob("**/*.csv") if not _in_tl_folder(f)]
-        for file_path in csv_files:
-            results[file_path] = self.extract_from_csv(file_path)
+        Order: .rpy/.rpym scripts (normal extraction and deep scan merged per
+        file), then data files (json, csv, txt, yaml, xml, ini), then .rpyc
+        files. RPYC entries whose text was already yielded by an earlier file
+        are dropped, the same way ``extract_combined`` merges them.
 
-        # Logic for .txt files
-        txt_files = [f for f in search_root.glob("**/*.txt") if not _in_tl_folder(f)]
-        for file_path in txt_files:
-            results[file_path] = self.extract_from_txt(file_path)
+        When one call reads both scripts and .rpyc files, a script shipped as
+        both is read from one of them (``ScriptSourcePlan``, mode from
+        ``script_source_mode``). Callers that read .rpyc files in a separate
+        call pass the same ``source_mode`` to every call so the passes share a plan.
 
-        # Logic for .yaml files
-        try:
-            yaml_files = [f for f in search_root.glob("**/*.yaml") if not _in_tl_folder(f)]
-            for file_path in yaml_files:
-                results[file_path] = self.extract_from_yaml(file_path)
-        except ImportError:
-            self.logger.warning("PyYAML not available. Skipping .yaml files.")
+        Data files pass ``FileAdmissionPolicy`` first; skipped and sampled
+        files are listed in ``self.admission_report`` as ``(path, decision)``.
 
-        # Logic for .xml files
-        xml_files = [f for f in search_root.glob("**/*.xml") if not _in_tl_folder(f)]
-        for file_path in xml_files:
-            results[file_path] = self.extract_from_xml(file_path)
+        Args:
+            directory: Klasör yolu
+            include_rpy: Normal pattern extraction for scripts
+            include_deep_scan: Deep scan for scripts (only the deep entries when include_rpy is False)
+            include_data_files: json/csv/txt/yaml/xml/ini dosyalarını da tara
+            include_rpyc: .rpyc/.rpymc dosyalarını AST ile oku
+            recursive: Alt klasörleri de tara
+            file_index: Aynı klasör için önceden oluşturulmuş dosya listesi (opsiyonel)
+            source_mode: SOURCE_MODE_AUTO / SOURCE_MODE_BOTH (.rpy/.rpyc çiftleri)
+        """
+        search_root = self._resolve_search_root(Path(directory))
+        index = get_file_index(search_root, file_index, recursive)
+        if source_mode is None and include_rpyc and (include_rpy or include_deep_scan):
+            source_mode = self.script_source_mode()
+        skipped = index.script_sources(source_mode).skipped if source_mode else frozenset()
+        seen_texts: Optional[Set[str]] = set() if include_rpyc else None
+        admission = FileAdmissionPolicy.from_config(self.config) if include_data_files else None
+        self.admission_report = []
+
+        for suffixes, extractor in self._data_extractors():
+            is_script = '.rpy' in suffixes
+            if is_script and not (include_rpy or include_deep_scan):
+                continue
+            if not is_script and not include_data_files:
+                continue
+            for file_path in index.files(*suffixes):
+                if file_path in skipped:
+                    continue
+                if not is_script:
+                    decision = admission.admit(file_path)
+                    if decision.action != ADMIT_PARSE:
+                        self.admission_report.append((file_path, decision))
+                        self.logger.info(
+                            "Data file %s %s: %s",
+                            "skipped" if decision.action == ADMIT_SKIP else "sampled",
+                            file_path, decision.reason,
+                        )
+                    if decision.action == ADMIT_SKIP:
+                        continue
+                    if decision.action == ADMIT_SAMPLE:
+                        entries = extractor(file_path, max_bytes=decision.limit)
+                    else:
+                        entries = extractor(file_path)
+                elif include_rpy and include_deep_scan:
+                    entries = self.extract_with_deep_scan(file_path, include_deep_scan=True)
+                elif include_deep_scan:
+                    entries = self.deep_scan_strings(file_path)
+                else:
+                    entries = extractor(file_path)
+                if seen_texts is not None:
+                    seen_texts.update(entry.get('text', '') for entry in entries)
+                yield file_path, entries
 
-        # Logic for .ini files
-        ini_files = [f for f in search_root.glob("**/*.ini") if not _in_tl_folder(f)]
-        for file_path in ini_files:
-            results[file_path] = self.extract_from_ini(file_path)
+        if include_rpyc:
+            rpyc_files = [path for path in index.files('.rpyc', '.rpymc') if path not in skipped]
+            for file_path, entries in self._iter_rpyc_entries(rpyc_files):
+                entries = [entry for entry in entries if entry.get('text', '') not in seen_texts]
+                if entries:
+                    seen_texts.update(entry.get('text', '') for entry in entries)
+                    yield file_path, entries
+
+    def iter_text_entries(
+        self,
+        directory: Union[str, Path],
+        include_rpy: bool = True,
+        include_deep_scan: bool = False,
+        include_data_files: bool = True,
+        include_rpyc: bool = False,
+        recursive: bool = True,
+        file_index: Optional[ProjectFileIndex] = None,
+        source_mode: Optional[str] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Streaming counterpart of ``parse_directory`` / ``extract_combined``.
 
-        return results
+        Entries are yielded file by file (see ``iter_file_entries`` for the
+        order and the flags) with ``file_path`` filled in, so callers can
+        deduplicate or write output without holding every file's results.
+        """
+        for file_path, entries in self.iter_file_entries(
+            directory,
+            include_rpy=include_rpy,
+            include_deep_scan=include_deep_scan,
+            include_data_files=include_data_files,
+            include_rpyc=include_rpyc,
+            recursive=recursive,
+            file_index=file_index,
+            source_mode=source_mode,
+        ):
+            path_str = str(file_path)
+            for entry in entries:
+                entry['file_path'] = path_str
+                yield entry
+
+    def _data_extractors(self):
+        """Suffix -> extractor dispatch table used by ``parse_directory`` (in output order)."""
+        return (
+            (('.rpy', '.rpym'), self.extract_text_entries),
+            (('.json',), self.extract_from_json),
+            (('.csv',), self.extract_from_csv),
+            (('.txt',), self.extract_from_txt),
+            (('.yaml',), self.extract_from_yaml),
+            (('.xml',), self.extract_from_xml),
+            (('.ini',), self.extract_from_ini),
+        )
 
     async def extract_from_directory_async(
         self,
         directory: Union[str, Path],
         recursive: bool = True,
-        max_workers: int = 4,
+        max_workers: Optional[int] = None,
     ) -> Dict[Path, Set[str]]:
         loop = asyncio.get_running_loop()
         return await loop.run_in_executor(
@@ -701,28 +2577,45 @@ class RenPyParser:
         self,
         directory: Union[str, Path],
         recursive: bool = True,
-        max_workers: int = 4,
-    ):
+        max_workers: Optional[int] = None,
+    ) -> Dict[Path, Set[str]]:
+        """
+        Extract translatable text from all .rpy files using a process pool.
+
+        The pool size defaults to ``app_settings.parser_workers``. Files are
+        scheduled largest first so a single huge script does not become the
+        tail of the run. The result has the same shape as
+        ``extract_from_directory`` ({path: set of texts}, discovery order).
+        """
         directory = Path(directory)
         search_root = self._resolve_search_root(directory)
-        results: Dict[Path, Set[str]] = {}
-        if recursive:
-            iterator = search_root.glob("**/*.rpy")
-        else:
-            iterator = search_root.glob("*.rpy")
-        rpy_files = [f for f in iterator if not self._is_excluded_rpy(f, search_root)]
+        rpy_files = ProjectFileIndex(search_root, recursive=recursive).files('.rpy')
+        workers = self._resolve_worker_count(max_workers, len(rpy_files))
 
         self.logger.info(
-            "Found %s .rpy files for parallel processing (excluding Ren'Py engine & tl folders)",
+            "Found %s .rpy files for parallel processing with %s workers (excluding Ren'Py engine & tl folders)",
             len(rpy_files),
+            workers,
         )
 
-        for rpy_file in rpy_files:
+        collected: Optional[Dict[Path, Set[str]]] = None
+        if workers > 1:
             try:
-                results[rpy_file] = self.extract_translatable_text(rpy_file)
-            except Exception as exc:
-                self.logger.error("Error processing file %s: %s", rpy_file, exc)
-                results[rpy_file] = set()
+                collected = self._extract_with_process_pool(rpy_files, workers)
+            except (BrokenProcessPool, OSError, RuntimeError, TypeError, AttributeError) as exc:
+                # Pool could not start (frozen build, unpicklable config, ...)
+                self.logger.warning("Process pool unavailable, falling back to sequential parsing: %s", exc)
+
+        if collected is None:
+            collected = {}
+            for rpy_file in rpy_files:
+                try:
+                    collected[rpy_file] = self.extract_translatable_text(rpy_file)
+                except Exception as exc:
+                    self.logger.error("Error processing file %s: %s", rpy_file, exc)
+                    collected[rpy_file] = set()
+
+        results: Dict[Path, Set[str]] = {f: collected.get(f, set()) for f in rpy_files}
 
         total_texts = sum(len(texts) for texts in results.values())
         self.logger.info(
@@ -732,6 +2625,56 @@ class RenPyParser:
         )
         return results
 
+    def _resolve_worker_count(self, max_workers: Optional[int], file_count: int) -> int:
+        """Pick the process pool size from the argument or ``parser_workers``."""
+        workers = max_workers
+        if workers is None:
+            app_settings = getattr(self.config, 'app_settings', None)
+            workers = getattr(app_settings, 'parser_workers', 4) or 4
+        try:
+            workers = int(workers)
+        except (TypeError, ValueError):
+            workers = 4
+        workers = min(workers, os.cpu_count() or 1, file_count)
+        return max(1, workers)
+
+    def pool_workers(self, file_count: Optional[int] = None) -> int:
+        """Process pool size for ``file_count`` files (``parser_workers``, capped by CPU count)."""
+        if file_count is None:
+            file_count = os.cpu_count() or 1
+        return self._resolve_worker_count(None, file_count)
+
+    def _extract_with_process_pool(self, files: List[Path], workers: int) -> Dict[Path, Set[str]]:
+        """Run ``extract_translatable_text`` for each file in a process pool."""
+
+        def _size(path: Path) -> int:
+            try:
+                return path.stat().st_size
+            except OSError:
+                return 0
+
+        # Largest files first (LPT scheduling) keeps all workers busy until the end
+        ordered = sorted(files, key=_size, reverse=True)
+        collected: Dict[Path, Set[str]] = {}
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_parser_worker,
+            initargs=(self.config,),
+        ) as executor:
+            futures = {executor.submit(_extract_file_worker, str(f)): f for f in ordered}
+            for future in as_completed(futures):
+                rpy_file = futures[future]
+                try:
+                    collected[rpy_file] = future.result()
+                except BrokenProcessPool:
+                    raise
+                except Exception as exc:
+                    self.logger.error("Error processing file %s: %s", rpy_file, exc)
+                    collected[rpy_file] = set()
+
+        return collected
+
     def extract_from_directory(self, directory: Union[str, Path], recursive: bool = True) -> Dict[Path, Set[str]]:
         """
         Sequential directory extraction for backwards compatibility with tests.
@@ -739,11 +2682,7 @@ class RenPyParser:
         directory = Path(directory)
         search_root = self._resolve_search_root(directory)
         results: Dict[Path, Set[str]] = {}
-        if recursive:
-            iterator = search_root.glob("**/*.rpy")
-        else:
-            iterator = search_root.glob("*.rpy")
-        rpy_files = [f for f in iterator if not self._is_excluded_rpy(f, search_root)]
+        rpy_files = ProjectFileIndex(search_root, recursive=recursive).files('.rpy')
 
         for rpy_file in rpy_files:
             try:
@@ -795,19 +2734,33 @@ class RenPyParser:
 
         return False
 
-    def _read_file_lines(self, file_path: Union[str, Path]) -> List[str]:
+    def _read_file_lines(self, file_path: Union[str, Path], max_bytes: Optional[int] = None) -> List[str]:
         with open(file_path, 'rb') as raw_file:
-            raw_bytes = raw_file.read()
+            if max_bytes is None:
+                raw_bytes = raw_file.read()
+            else:
+                # Sampled read: stop at the last complete line
+                raw_bytes = raw_file.read(max_bytes)
+                if len(raw_bytes) == max_bytes and b'\n' in raw_bytes:
+                    raw_bytes = raw_bytes[:raw_bytes.rfind(b'\n') + 1]
 
         # Attempt fast UTF-8 decoding first
         try:
             return raw_bytes.decode('utf-8-sig').splitlines()
         except UnicodeDecodeError:
-            pass  # Fall back to chardet if decoding fails
+            pass  # Legacy encoding: try what we already know before sampling
 
-        detected = chardet.detect(raw_bytes)
-        encoding = detected.get('encoding') or 'utf-8'
-        return raw_bytes.decode(encoding, errors='ignore').splitlines()
+        cache = self.get_extraction_cache()
+        hints = (
+            cache.encoding_hint(file_path) if cache is not None else None,
+            remembered_encoding(file_path),
+        )
+        text, encoding = decode_text(raw_bytes, hints)
+        if encoding != 'utf-8':
+            remember_encoding(file_path, encoding)
+            if cache is not None:
+                cache.note_encoding(file_path, encoding)
+        return text.splitlines()
 
     def _calculate_indent(self, line: str) -> int:
         expanded = line.replace('\t', '    ')
@@ -858,9 +2811,13 @@ class RenPyParser:
         stripped_line: str,
         context_path: List[str],
         file_path: str = '',
+        scan_line: Optional[str] = None,
     ) -> Tuple[Optional[Dict[str, Any]], int]:
+        # All multiline patterns open with a triple quote
+        if '"""' not in raw_line and "'''" not in raw_line:
+            return None, index
         for descriptor in self.multiline_registry:
-            match = descriptor['regex'].match(raw_line)
+            match = guarded_match(descriptor['regex'], raw_line, scan_line or raw_line)
             if not match:
                 continue
 
@@ -1001,21 +2958,26 @@ class RenPyParser:
             resolved_type = 'renpy_func'
 
         # Apply user-configurable type filters (e.g. translate_ui)
-        if not self._should_translate_text(text, resolved_type):
+        classifier = self.text_classifier()
+        if not classifier.should_translate(text, resolved_type, context_line):
             return None
 
         # context_tag is handled by callers (e.g., deep scan) via context_path
-        return {
-            'text': text,
-            'line_number': line_number,
-            'context_line': context_line,
-            'character': character,
-            'text_type': resolved_type,
-            'context_path': list(context_path),
-            'processed_text': processed_text,
-            'placeholder_map': placeholder_map,
-            'file_path': file_path,
-        }
+        entry = TextEntry.create(
+            text,
+            line_number,
+            context_line,
+            character,
+            resolved_type,
+            context_path,
+            processed_text,
+            placeholder_map,
+            file_path,
+        )
+        if classifier.enabled:
+            # Verdict travels with the entry; the output formatter trusts it
+            entry.translatable = True
+        return entry
 
     def _is_python_context(self, context_path: List[str]) -> bool:
         for ctx in context_path or []:
@@ -1058,75 +3020,13 @@ class RenPyParser:
         return content
 
     def is_meaningful_text(self, text: str) -> bool:
-        if not text or len(text.strip()) < 2:
-            return False
-
-        text_lower = text.lower().strip()
-        text_strip = text.strip()
-        
-        if text_lower in self.renpy_technical_terms:
-            return False
-
-        if re.fullmatch(r"\s*(\[[^\]]+\]|\{[^}]+\}|%s|%\([^)]+\)[sdif])\s*", text):
-            return False
-        
-        # Skip Python format strings like {:,}, {:3d}, {}, {}Attitude:{} {}, etc.
-        # These are used for number/string formatting and should not be translated
-        if '{' in text_strip:
-            # Count format placeholders
-            format_count = len(re.findall(r'\{[^}]*\}', text_strip))
-            if format_count >= 1:
-                # Remove format placeholders and check remaining content
-                remaining = re.sub(r'\{[^}]*\}', '', text_strip).strip()
-                # If remaining has no meaningful words (at least 3 consecutive letters), skip
-                if not re.search(r'[a-zA-ZçğıöşüÇĞIİÖŞÜ]{3,}', remaining):
-                    return False
-                # If format placeholders dominate the string (2+ placeholders with short remaining), skip
-                if format_count >= 2 and len(remaining) < 10:
-                    return False
+        return is_meaningful(text)
 
-        technical_patterns = [
-            r'^#[0-9a-fA-F]+$',
-            r'\.ttf$',
-            r'^%s[%\s]*$',
-            r'fps|renderer|ms$',
-            r'^[0-9.]+$',
-            r'game_menu|sync|input|overlay',
-            r'vertical|horizontal|linear',
-            r'touch_keyboard|subtitle|empty',
-        ]
-        for pattern in technical_patterns:
-            if re.search(pattern, text_lower):
-                return False
-
-        # Skip file paths and media files
-        if any(ext in text_lower for ext in ['.png', '.jpg', '.jpeg', '.gif', '.webp', '.mp3', '.ogg', '.wav', '.mp4', '.webm', '.ttf', '.otf']):
-            return False
-        
-        # Skip paths with slashes (file paths)
-        if '/' in text_strip and ' ' not in text_strip:
-            return False
-
-        if re.match(r'^[-+]?\d+$', text.strip()):
-            return False
-        if re.match(r'^\d+(?:\.\d+)+$', text.strip()):
-            return True
-
-        # Büyük harfle başlayan ve boşluk içeren metinleri kontrol et
-        if text[0].isupper() and ' ' in text:
-            return True  # %99 metindir
-
-        # Küçük harf ve boşluksuz metinleri düşük güven olarak işaretle
-        if text.islower() and ' ' not in text:
-            return False
-
-        # FIX: Reject strings that are actually code wrappers captured by mistake
-        # e.g. '_("Text")' or "_('Text')"
-        if (text.startswith('_("') and text.endswith('")')) or \
-           (text.startswith("_('") and text.endswith("')")):
-            return False
-
-        return bool(re.search(r'[a-zA-ZçğıöşüÇĞIİÖŞÜ]', text)) and len(text.strip()) >= 2
+    def text_classifier(self):
+        """Classification engine compiled for the current translation settings."""
+        if self._active_classifier is not None:
+            return self._active_classifier
+        return get_text_classifier(self.config)
 
     def determine_text_type(
         self,
@@ -1179,211 +3079,12 @@ class RenPyParser:
 
         return 'dialogue'
 
-    def _should_translate_text(self, text: str, text_type: str) -> bool:
-        if self.config is None:
-            return True
-        
-        text_strip = text.strip()
-        text_lower = text_strip.lower()
-        
-        # =================================================================
-        # CRITICAL: Skip technical content that should NEVER be translated
-        # These checks run BEFORE user settings to prevent breaking games
-        # =================================================================
-        
-        # Skip empty or whitespace-only text
-        if not text_strip:
-            return False
-        
-        # Skip file paths and file names (fonts, images, audio, etc.)
-        file_extensions = (
-            '.otf', '.ttf', '.woff', '.woff2', '.eot',  # Fonts
-            '.png', '.jpg', '.jpeg', '.gif', '.webp', '.bmp', '.ico', '.svg',  # Images
-            '.mp3', '.ogg', '.wav', '.flac', '.aac', '.m4a', '.opus',  # Audio
-            '.mp4', '.webm', '.avi', '.mkv', '.mov', '.ogv',  # Video
-            '.rpy', '.rpyc', '.rpa', '.rpym', '.rpymc',  # Ren'Py files
-            '.py', '.pyc', '.pyo',  # Python files
-            '.json', '.txt', '.xml', '.csv', '.yaml', '.yml',  # Data files
-            '.zip', '.rar', '.7z', '.tar', '.gz',  # Archives
-        )
-        if any(text_lower.endswith(ext) for ext in file_extensions):
-            return False
-        
-        # Skip if text starts with common file path patterns
-        if text_strip.startswith(('fonts/', 'images/', 'audio/', 'music/', 'sounds/', 
-                                   'gui/', 'screens/', 'script/', 'game/', 'tl/',
-                                   'video/', 'movies/', 'sfx/', 'voice/', 'bg/',
-                                   'cg/', 'sprites/', 'characters/', 'scenes/')):
-            return False
-        
-        # Skip any path containing common asset folder names
-        asset_folders = ('/images/', '/audio/', '/music/', '/sounds/', '/fonts/', 
-                        '/gui/', '/video/', '/movies/', '/sfx/', '/voice/',
-                        '/frames/', '/scenes/', '/sprites/', '/cg/', '/bg/')
-        if any(folder in text_lower for folder in asset_folders):
-            return False
-        
-        # Skip paths with slashes that look like file paths (no spaces)
-        if '/' in text_strip and ' ' not in text_strip:
-            if re.match(r'^[a-zA-Z0-9_/.\-]+$', text_strip):
-                return False
-        
-        # Skip backslash paths (Windows style)
-        if '\\' in text_strip and ' ' not in text_strip:
-            if re.match(r'^[a-zA-Z0-9_\\\.\-]+$', text_strip):
-                return False
-        
-        # Skip URLs and URIs
-        if re.match(r'^(https?://|ftp://|mailto:|file://|www\.)', text_lower):
-            return False
-        
-        # Skip hex color codes
-        if re.match(r'^#[0-9a-fA-F]{3,8}$', text_strip):
-            return False
-        
-        # Skip pure numbers (including floats and negative)
-        if re.match(r'^-?\d+\.?\d*$', text_strip):
-            return False
-        
-        # Skip CSS/style-like values
-        if re.match(r'^\d+(\.\d+)?(px|em|rem|%|pt|vh|vw)$', text_lower):
-            return False
-        
-        # Skip Ren'Py screen/style element names (technical identifiers)
-        # IMPORTANT: Only skip lowercase versions - "history" is technical, "History" is UI text
-        renpy_technical_terms_lowercase = {
-            # Screen elements & style identifiers (always lowercase in code)
-            'say', 'window', 'namebox', 'choice', 'quick', 'navigation',
-            'return_button', 'page_label', 'page_label_text', 'slot',
-            'slot_time_text', 'slot_name_text', 'save_delete', 'pref',
-            'radio', 'check', 'slider', 'tooltip_icon', 'tooltip_frame',
-            'dismiss', 'history_name', 'color',  # Note: removed 'history', 'help' - these are valid UI labels
-            'confirm_prompt', 'notify',
-            'nvl_window', 'nvl_button', 'medium', 'touch', 'small',
-            'replay_locked',
-            # Style & layout properties
-            'show', 'hide', 'unicode', 'left', 'right', 'center', 
-            'top', 'bottom', 'true', 'false', 'none', 'null', 'auto',
-            # Common screen/action identifiers
-            'add_post', 'card', 'money_get', 'money_pay', 'mp',
-            'pass_time', 'rel_down', 'rel_up',
-            # Input/output
-            'input', 'output', 'default', 'value',
-            # Common variable/config names (shouldn't be translated)
-            'id', 'name', 'type', 'style', 'action', 'hovered', 'unhovered',
-            'selected', 'insensitive', 'activate', 'alternate',
-        }
-        # Only skip if text is EXACTLY lowercase (technical) - not Title Case UI text
-        # "history" -> skip, "History" -> translate
-        if text_strip in renpy_technical_terms_lowercase:
-            return False
-        
-        # Skip snake_case identifiers (like page_label_text, slot_time_text)
-        if re.match(r'^[a-z][a-z0-9]*(_[a-z0-9]+)+$', text_strip):
-            return False
-        
-        # Skip SCREAMING_SNAKE_CASE constants
-        if re.match(r'^[A-Z][A-Z0-9]*(_[A-Z0-9]+)+$', text_strip):
-            return False
-        
-        # Skip camelCase identifiers (likely variable names)
-        if re.match(r'^[a-z][a-zA-Z0-9]*[A-Z][a-zA-Z0-9]*$', text_strip) and ' ' not in text_strip:
-            return False
-        
-        # Skip save/game identifiers like "GameName-1234567890"
-        if re.match(r'^[A-Za-z_][A-Za-z0-9_]*-\d+$', text_strip):
-            return False
-        
-        # Skip version strings like "v1.0.0" or "1.2.3"
-        if re.match(r'^v?\d+\.\d+(\.\d+)?([a-z])?$', text_lower):
-            return False
-        
-        # Skip single character strings (often used as separators or bullets)
-        if len(text_strip) == 1 and not text_strip.isalpha():
-            return False
-        
-        # Skip if it's just Ren'Py tags/variables with no actual text
-        # e.g., "{font=something}[variable]{/font}" with no human-readable text
-        stripped_of_tags = re.sub(r'\{[^}]*\}', '', text_strip)  # Remove tags
-        stripped_of_vars = re.sub(r'\[[^\]]*\]', '', stripped_of_tags)  # Remove variables
-        if not stripped_of_vars.strip():
-            return False
-
-        # =================================================================
-        # User-configurable text type filters
-        # =================================================================
-        ts = self.config.translation_settings
-        if text_type == 'dialogue' and not ts.translate_dialogue:
-            return False
-        if text_type == 'menu' and not ts.translate_menu:
-            return False
-        if text_type == 'ui' and not ts.translate_ui:
-            return False
-        if text_type == 'button' and not getattr(ts, 'translate_buttons', ts.translate_ui):
-            return False
-        if text_type == 'config' and not ts.translate_config_strings:
-            return False
-        if text_type == 'gui' and not ts.translate_gui_strings:
-            return False
-        if text_type == 'style' and not ts.translate_style_strings:
-            return False
-        if text_type == 'renpy_func' and not ts.translate_renpy_functions:
-            return False
-        # NEW text types
-        if text_type == 'alt_text' and not getattr(ts, 'translate_alt_text', ts.translate_ui):
-            return False
-        if text_type == 'input' and not getattr(ts, 'translate_input_text', ts.translate_ui):
-            return False
-        if text_type == 'notify' and not getattr(ts, 'translate_notifications', ts.translate_dialogue):
-            return False
-        if text_type == 'confirm' and not getattr(ts, 'translate_confirmations', ts.translate_dialogue):
-            return False
-        if text_type == 'translatable_string':
-            # _() marked strings should always be translated
-            return True
-        if text_type == 'define' and not getattr(ts, 'translate_define_strings', ts.translate_config_strings):
-            return False
-        # paragraph type always translatable (like dialogue)
-        if text_type == 'paragraph':
-            # Use same settings as dialogue
-            if not ts.translate_dialogue:
-                return False
-
-        rules: Dict[str, Any] = getattr(self.config, 'never_translate_rules', {}) or {}
-
-        try:
-            for val in rules.get('exact', []) or []:
-                if text_strip == val:
-                    return False
-            for val in rules.get('contains', []) or []:
-                if val and val in text_strip:
-                    return False
-            for pattern in rules.get('regex', []) or []:
-                try:
-                    if re.search(pattern, text_strip):
-                        return False
-                except re.error:
-                    continue
-        except Exception as exc:
-            self.logger.warning("never_translate rules failed: %s", exc)
-
-        # Eğer metin 'jump', 'call', 'scene', 'show' bağlamında ise ve boşluk içermiyorsa -> ÇEVİRME
-        if text_type in ('renpy_func', 'python_string'):
-            context_lower = self.get_context_line().lower()  # Bağlam satırını al
-            if any(keyword in context_lower for keyword in ('jump', 'call', 'scene', 'show')):
-                if ' ' not in text_strip and text_strip[0].isupper():
-                    # Örn: "Start", "Forest", "Date" gibi kelimeler label olabilir.
-                    return False
-
-        # Eğer metin 'font' veya 'style' bağlamında ise ve boşluk içermiyorsa -> ÇEVİRME
-        if text_type in ('config', 'gui', 'style'):
-            context_lower = self.get_context_line().lower()  # Bağlam satırını al
-            if any(keyword in context_lower for keyword in ('font', 'style')):
-                if ' ' not in text_strip:
-                    # Örn: "Roboto-Regular", "GuiFont" gibi isimler çevrilmemeli.
-                    return False
-
-        return True
+    def _should_translate_text(self, text: str, text_type: str, context_line: str = '') -> bool:
+        """
+        Technical safety checks, user ``translate_*`` filters and
+        never-translate rules; see ``TextClassifier``.
+        """
+        return self.text_classifier().should_translate(text, text_type, context_line)
 
     def preserve_placeholders(self, text: str):
         """
@@ -1397,116 +3098,26 @@ class RenPyParser:
         - {#identifier} - Disambiguation tags (MUST be preserved)
         - %(var)s, %s - Python format strings
         """
-        if not text:
-            return text, {}
-
-        placeholder_map: Dict[str, str] = {}
-        processed_text = text
-        placeholder_counter = 0
-
-        # CRITICAL: Preserve disambiguation tags {#...} FIRST
-        # These are used to distinguish identical strings in different contexts
-        # e.g., "New", "New{#project}", "New{#game}" are all different in Ren'Py
-        disambiguation_pattern = r'\{#[^}]+\}'
-        for match in re.finditer(disambiguation_pattern, text):
-            placeholder_id = f"⟦D{placeholder_counter:03d}⟧"  # D for disambiguation
-            placeholder_map[placeholder_id] = match.group(0)
-            processed_text = processed_text.replace(match.group(0), placeholder_id, 1)
-            placeholder_counter += 1
-
-        # RenPy variable placeholders like [variable_name] or [var!t] (translatable)
-        # The !t flag marks a variable as translatable - these are SPECIAL
-        # [mood!t] - the value in 'mood' will be translated at display time
-        # We need to preserve the whole placeholder but NOT translate the variable name
-        renpy_var_pattern = r'\[([^\]]+)\]'
-        for match in re.finditer(renpy_var_pattern, processed_text):
-            if match.group(0).startswith('⟦'):  # Already processed
-                continue
-            
-            var_content = match.group(1)
-            
-            # Check for !t flag (translatable variable)
-            # The variable VALUE will be translated by Ren'Py at runtime
-            if '!t' in var_content:
-                # Mark as translatable variable placeholder (still preserve it)
-                placeholder_id = f"⟦VT{placeholder_counter:03d}⟧"  # VT for translatable variable
-            else:
-                placeholder_id = f"⟦V{placeholder_counter:03d}⟧"  # V for regular variable
-            
-            placeholder_map[placeholder_id] = match.group(0)
-            processed_text = processed_text.replace(match.group(0), placeholder_id, 1)
-            placeholder_counter += 1
-
-        # RenPy text tags like {color=#ff0000}, {/color}, {b}, {/b}, etc.
-        # BUT NOT disambiguation tags (already handled above)
-        renpy_tag_pattern = r'\{[^}]*\}'
-        for match in re.finditer(renpy_tag_pattern, processed_text):
-            tag = match.group(0)
-            if tag.startswith('⟦') or tag.startswith('{#'):  # Already processed or disambiguation
-                continue
-            placeholder_id = f"⟦T{placeholder_counter:03d}⟧"  # T for tag
-            placeholder_map[placeholder_id] = tag
-            processed_text = processed_text.replace(tag, placeholder_id, 1)
-            placeholder_counter += 1
+        return protect_placeholders(text)
 
-        # Python-style format strings like %(variable)s, %s, %d, etc.
-        python_format_pattern = r'%\([^)]+\)[sdif]|%[sdif]'
-        for match in re.finditer(python_format_pattern, processed_text):
-            placeholder_id = f"⟦F{placeholder_counter:03d}⟧"  # F for format
-            placeholder_map[placeholder_id] = match.group(0)
-            processed_text = processed_text.replace(match.group(0), placeholder_id, 1)
-            placeholder_counter += 1
-
-        return processed_text, placeholder_map
+    def preserve_placeholders_batch(self, texts: Iterable[str]) -> List[Tuple[str, Dict[str, str]]]:
+        """``preserve_placeholders`` for a whole batch of texts."""
+        protect = protect_placeholders
+        return [protect(text) for text in texts]
 
     # Restore placeholders in translated text.
     # Uses Unicode bracket markers ⟦0000⟧ which are more resistant to translation corruption.
     def restore_placeholders(self, translated_text: str, placeholder_map: dict) -> str:
         """
         Restore placeholders in translated text.
-        Uses Unicode bracket markers ⟦0000⟧ which are more resistant to translation corruption.
+        Also accepts markers the engine mangled into ⟦ 0000 ⟧, [0000] or 【0000】.
         """
-        if not translated_text or not placeholder_map:
-            return translated_text
-        
-        restored_text = translated_text
-        
-        # First try exact match - this handles most cases with Unicode markers
-        for placeholder_id, original_placeholder in placeholder_map.items():
-            restored_text = restored_text.replace(placeholder_id, original_placeholder)
-        
-        # Handle potential space insertions around Unicode markers
-        for placeholder_id, original_placeholder in placeholder_map.items():
-            if placeholder_id.startswith('⟦') and placeholder_id.endswith('⟧'):
-                # Extract number part
-                number_part = placeholder_id[1:-1]  # Get "0000" part
-                
-                # Try with spaces around the marker
-                space_patterns = [
-                    f"⟦ {number_part} ⟧",  # Spaces inside brackets
-                    f"⟦ {number_part}⟧",    # Space after opening
-                    f"⟦{number_part} ⟧",    # Space before closing
-                    f" {placeholder_id} ",   # Spaces around
-                    f" {placeholder_id}",    # Space before
-                    f"{placeholder_id} ",    # Space after
-                ]
-                
-                for pattern in space_patterns:
-                    if pattern in restored_text:
-                        restored_text = restored_text.replace(pattern, original_placeholder)
-                
-                # Regex fallback for Unicode markers with potential corruption
-                import re
-                unicode_patterns = [
-                    r'⟦\s*' + re.escape(number_part) + r'\s*⟧',  # Flexible whitespace
-                    r'\[\s*' + re.escape(number_part) + r'\s*\]',  # Similar brackets
-                    r'【\s*' + re.escape(number_part) + r'\s*】',  # CJK brackets
-                ]
-                
-                for pattern in unicode_patterns:
-                    restored_text = re.sub(pattern, original_placeholder, restored_text)
-        
-        return restored_text
+        return restore_placeholder_markers(translated_text, placeholder_map)
+
+    def restore_placeholders_batch(self, items: Iterable[Tuple[str, Dict[str, str]]]) -> List[str]:
+        """``restore_placeholders`` for ``(translated_text, placeholder_map)`` pairs."""
+        restore = restore_placeholder_markers
+        return [restore(text, placeholder_map) for text, placeholder_map in items]
 
     def validate_placeholders(self, text: str, placeholder_map: dict) -> bool:
         """
@@ -1530,7 +3141,31 @@ class RenPyParser:
     # Bu modül, normal pattern'lerin yakalayamadığı gizli metinleri bulur
     # init python bloklarındaki dictionary'ler, değişken atamaları vb.
     
-    def deep_scan_strings(self, file_path: Union[str, Path]) -> List[Dict[str, Any]]:
+    def deep_scan_strings(
+        self,
+        file_path: Union[str, Path],
+        normal_entries: Optional[List[Dict[str, Any]]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Dosyadaki TÜM string literal'leri tarar.
+        Sonuçlar extraction cache üzerinden döner; ayrıntılar için
+        ``_deep_scan_strings_uncached``.
+
+        Args:
+            file_path: Dosya yolu
+            normal_entries: Aynı dosyanın ``extract_text_entries`` sonucu; verilirse tekrar hesaplanmaz
+        """
+        return self._cached_extract(
+            'deep_scan', file_path,
+            functools.partial(self._deep_scan_strings_uncached, normal_entries=normal_entries),
+        )
+
+    def _deep_scan_strings_uncached(
+        self,
+        file_path: Union[str, Path],
+        normal_entries: Optional[List[Dict[str, Any]]] = None,
+        read_lines=None,
+    ) -> List[Dict[str, Any]]:
         """
         Dosyadaki TÜM string literal'leri tarar.
         Normal pattern'lerin kaçırdığı metinleri bulmak için kullanılır.
@@ -1542,11 +3177,19 @@ class RenPyParser:
         - Fonksiyon argümanlarındaki stringler
         - Çok satırlı triple-quoted stringler
 
+        Dosya bir kez okunur; satır numaraları offset tablosundan (bisect),
+        python bloğu bilgisi tek geçişte çıkarılan satır haritasından gelir.
+
+        Args:
+            file_path: Dosya yolu
+            normal_entries: Aynı dosyanın normal extraction sonuçları (varsa tekrar parse edilmez)
+            read_lines: Dosyayı okuyan fonksiyon (normal extraction ile paylaşmak için)
+
         Returns:
             List of entries with text, line_number, context info
         """
         try:
-            lines = self._read_file_lines(file_path)
+            lines = (read_lines or self._read_file_lines)(file_path)
         except Exception as exc:
             self.logger.error("Deep scan error reading %s: %s", file_path, exc)
             return []
@@ -1555,7 +3198,11 @@ class RenPyParser:
         already_found: Set[Tuple[str,str]] = set()
         
         # Normal pattern'lerle bulunanları al (bunları atlamak için)
-        normal_entries = self.extract_text_entries(file_path)
+        if normal_entries is None:
+            normal_entries = self._cached_extract(
+                'entries', file_path,
+                functools.partial(self._extract_text_entries_uncached, read_lines=lambda _path: lines),
+            )
         for entry in normal_entries:
             normalized = entry.get('processed_text') or entry.get('text')
             ctx = (entry.get('context_path') or ['deep_scan'])[0]
@@ -1563,67 +3210,32 @@ class RenPyParser:
         
         # Tüm dosya içeriği (çok satırlı stringler için)
         full_content = '\n'.join(lines)
-        
-        # Tüm string literal'leri yakalayan regex
-        # Hem tek tırnak hem çift tırnak, escape karakterlerle
-        # Support optional string prefixes (r, u, b, f, fr, rf, etc.)
-        string_literal_re = re.compile(
-            r'''(?P<quote>(?:[rRuUbBfF]{,2})?(?:"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*'))'''
-        )
-
-        # Triple-quoted stringler için ayrı regex (çok satırlı - tüm dosyada ara)
-        # Triple-quoted strings with optional prefixes
-        triple_quote_re = re.compile(
-            r'''(?P<triple>(?:[rRuUbBfF]{,2})?(?:"""[\s\S]*?"""|\'\'\'[\s\S]*?\'\'\'))'''
-        )
-
-        # Key-value eşleştirmesi için regex
-        key_capture_re = re.compile(r'(?:["\']?(\w+)["\']?\s*[:=]\s*)$')
-        # Assignment detection (var = value)
-        assignment_context_re = re.compile(r'([a-zA-Z_]\w*)\s*=\s*')
-        # join call detection ("delimiter".join([...]) )
-        join_call_re = re.compile(r'(?P<delim>"[^"]*"|\'[^\']*\')\s*\.\s*join\s*\(')
+        line_starts = self._line_offsets(lines)
+        python_lines = self._python_block_map(lines)
 
         # Önce çok satırlı triple-quoted stringleri tüm dosyada ara
         # Bu sayede birden fazla satıra yayılan stringler de yakalanır
-        for match in triple_quote_re.finditer(full_content):
-            # Ensure match.group exists before accessing
-            if match and match.group('triple'):
-                text = self._extract_triple_string_content(match.group('triple'))
-
-            context_tag = 'deep_scan'
-            # triple quoted content: try to capture key in same line
-            line_number = full_content[:match.start()].count('\n') + 1
-            context_line = ''
-            if 0 <= line_number - 1 < len(lines):
-                context_line = lines[line_number - 1].strip()
-            # Key capture from context_line
-            key_match = key_capture_re.search(context_line[:match.start()])
-            found_key = key_match.group(1) if key_match else None
+        reversed_lines: Dict[int, str] = {}
+        for match in _DEEP_TRIPLE_QUOTE_RE.finditer(full_content):
+            text = self._extract_triple_string_content(match.group('triple'))
+            line_number = bisect.bisect_right(line_starts, match.start())
+            context_line = lines[line_number - 1].strip()
+            # Key-value eşleştirmesi yap (aynı satırda "key = " / "key:" var mı)
+            if len(context_line) > LONG_LINE_THRESHOLD:
+                if line_number not in reversed_lines:
+                    reversed_lines[line_number] = context_line[::-1]
+                found_key = key_before(reversed_lines[line_number], match.start())
+            else:
+                key_match = _DEEP_KEY_CAPTURE_RE.search(context_line[:match.start()])
+                found_key = key_match.group(1) if key_match else None
             context_tag = f'variable:{found_key}' if found_key else 'deep_scan'
             if text and (text, context_tag) not in already_found:
-                # Calculate in_python status
-                line_number = full_content[:match.start()].count('\n') + 1
-                in_python = self._is_position_in_python_block(lines, line_number)
-
-                # FIX: Define context_line safely
-                context_line = ""
-                if 0 <= line_number - 1 < len(lines):
-                    context_line = lines[line_number - 1].strip()
-
-                # Key-value eşleştirmesi yap
-                key_match = key_capture_re.search(context_line[:match.start()])
-                found_key = key_match.group(1) if key_match else None
-
-                # Now pass the defined variable
                 if self._is_meaningful_data_value(text, found_key):
-                    # Python bloğu içinde mi kontrol et
-                    in_python = self._is_position_in_python_block(lines, line_number)
                     entry = self._create_deep_scan_entry(
                         text=text,
                         line_number=line_number,
                         context_line=context_line,
-                        in_python=in_python,
+                        in_python=python_lines[line_number],
                         file_path=str(file_path),
                         found_key=found_key
                     )
@@ -1631,99 +3243,81 @@ class RenPyParser:
                         entries.append(entry)
                         already_found.add((text, entry.get('context_path', ['deep_scan'])[0]))
         
-        # Python/init python bloğu içinde miyiz?
-        in_python_block = False
-        python_block_indent = 0
-        
+        # Devam satırlarındaki ilk string literal (None = birleştirme burada biter)
+        continuation_pieces: Dict[int, Optional[str]] = {}
+
+        def continuation_piece(line_no: int) -> Optional[str]:
+            if line_no not in continuation_pieces:
+                next_line = lines[line_no - 1]
+                next_stripped = next_line.strip()
+                piece = None
+                # ensure the next line's string literal isn't part of a new assignment
+                if not next_stripped.startswith('#') and not (
+                    '=' in next_line and not next_stripped.startswith(('"', "'"))
+                ):
+                    next_match = _DEEP_STRING_LITERAL_RE.search(next_line)
+                    if next_match:
+                        piece = self._extract_string_content(next_match.group('quote'))
+                continuation_pieces[line_no] = piece
+            return continuation_pieces[line_no]
+
         for line_num, line in enumerate(lines, 1):
-            stripped = line.strip()
-            
-            # Yorum satırlarını atla
-            if stripped.startswith('#'):
+            # String literal içermeyen satırlarda yapılacak bir şey yok
+            if '"' not in line and "'" not in line:
                 continue
+            stripped = line.strip()
             
-            indent = self._calculate_indent(line)
-            
-            # Python bloğu başlangıcı
-            if self.python_block_re.match(stripped):
-                in_python_block = True
-                python_block_indent = indent
+            # Yorum satırlarını ve python bloğu başlangıçlarını atla
+            if stripped.startswith('#') or self.python_block_re.match(stripped):
                 continue
-            
-            # Python bloğundan çıkış
-            if in_python_block and indent <= python_block_indent and stripped:
-                if not stripped.startswith('#'):
-                    in_python_block = False
+            in_python_block = python_lines[line_num]
+
+            scan_line = line
+            if len(line) > LONG_LINE_THRESHOLD:
+                scan_line = mask_dangling_quotes(line)
+                literals = list(_DEEP_STRING_LITERAL_RE.finditer(scan_line))
+                last_start = literals[-1].start() if literals else 0
+                line_context = _LongDeepLineContext(lines, line_num, last_start)
+            else:
+                literals = _DEEP_STRING_LITERAL_RE.finditer(line)
+                line_context = _DeepLineContext(lines, line_num)
             
             # Normal stringler (tek satırlık)
-            found_key = None
-            for match in string_literal_re.finditer(line):
-                text = self._extract_string_content(match.group('quote'))
-                context_tag = 'deep_scan'
-                # 1. Try finding context in the current line
+            for match in literals:
+                text = self._extract_string_content(line[match.start():match.end()])
+                # 1. Try finding context in the current line, then in previous lines
                 found_key = None
-                list_context_re = re.compile(r'([a-zA-Z_]\w*)\s*(?:=\s*[\[\(\{]|\+=\s*[\[\(]|\.(?:append|extend|insert)\s*\()')
-                list_match = list_context_re.search(line[:match.start()])
-
-                # 2. Look back at previous lines if not found
-                if not list_match and line_num > 1:
-                    start_idx = max(0, line_num - 10)
-                    prev_context = "\n".join(lines[start_idx:line_num-1]) + "\n" + line[:match.start()]
-                    matches = list(list_context_re.finditer(prev_context))
-                    if matches:
-                        list_match = matches[-1]  # Take the closest one
+                list_match = line_context.list_match(match.start())
 
                 if list_match:
                     found_key = list_match.group(1)
                 else:
                     # Try assignment var detection (same-line or lookback)
-                    assign_match = assignment_context_re.search(line[:match.start()])
-                    if not assign_match and line_num > 1:
-                        prev_context = "\n".join(lines[max(0, line_num - 10):line_num-1]) + "\n" + line[:match.start()]
-                        assign_matches = list(assignment_context_re.finditer(prev_context))
-                        if assign_matches:
-                                assign_match = assign_matches[-1]
-                        if assign_match:
-                            found_key = assign_match.group(1)
+                    found_key = line_context.assignment_key(match.start())
 
                     # If not found key, check for join call around the literal
                     if not found_key:
                         # Check immediate lookback for "x".join(...)
-                        sb = line[:match.start()]
-                        join_m = join_call_re.search(sb)
-                        if join_m:
+                        if line_context.join_before(match.start()):
                             found_key = 'join_delim'
 
-                    # Pass found_key to validator
                     # handle implicit string concatenation across lines: collect contiguous string literals
                     # e.g., "Hello "\n   "World" -> Hello World
                     concat_text = text
-                    # look ahead for immediate next string literal contiguous with this one
-                    next_pos = match.end()
-                    rest = line[next_pos:]
                     # Simple detection: if a backslash at end, within parentheses, or trailing + operator then next line may continue the expression
-                    rest_r = rest.rstrip()
-                    continuation = rest_r.endswith('\\') or (line.strip().endswith('(') or line.strip().endswith('+')) or ('(' in line and ')' not in line)
+                    continuation = (
+                        line_context.backslash_after(match.end())
+                        or stripped.endswith(('(', '+'))
+                        or line_context.open_paren
+                    )
                     if continuation:
-                        # scan following lines for string literal
                         j = line_num + 1
                         while j <= len(lines):
-                            next_line = lines[j-1]
-                            next_match = string_literal_re.search(next_line)
-                            # ensure the next line's string literal isn't part of a new assignment
-                            if next_line.strip().startswith('#'):
-                                break
-                            if '=' in next_line.split('\n')[0] and not next_line.strip().startswith(('"', "'")):
-                                break
-                            if next_match:
-                                next_text = self._extract_string_content(next_match.group('quote'))
-                                concat_text += next_text
-                                # mark with context if found
-                                key_ctx = found_key or 'deep_scan'
-                                already_found.add((next_text, key_ctx))
-                                j += 1
-                            else:
+                            piece = continuation_piece(j)
+                            if piece is None:
                                 break
+                            concat_text += piece
+                            j += 1
 
                     if self._is_meaningful_data_value(concat_text, found_key):
                         entry = self._create_deep_scan_entry(
@@ -1736,33 +3330,45 @@ class RenPyParser:
                         )
                         if entry:
                             entries.append(entry)
-                            already_found.add((text, entry.get('context_path', ['deep_scan'])[0]))
         
         self.logger.info(f"Deep scan found {len(entries)} additional strings in {file_path}")
         return entries
-    
-    def _is_position_in_python_block(self, lines: List[str], target_line: int) -> bool:
-        """Belirtilen satırın python bloğu içinde olup olmadığını kontrol et"""
+
+    @staticmethod
+    def _line_offsets(lines: List[str]) -> List[int]:
+        """'\\n'.join(lines) içinde her satırın başladığı offset (bisect ile satır bulmak için)."""
+        offsets = [0] * len(lines)
+        position = 0
+        for index, line in enumerate(lines):
+            offsets[index] = position
+            position += len(line) + 1
+        return offsets
+
+    def _python_block_map(self, lines: List[str]) -> List[bool]:
+        """
+        Her satırın python / init python bloğu içinde olup olmadığı.
+        Index 1'den başlar (satır numarası); index 0 daima False.
+        """
+        states = [False] * (len(lines) + 1)
         in_python_block = False
         python_block_indent = 0
-        
-        for line_num, line in enumerate(lines[:target_line], 1):
+
+        for line_num, line in enumerate(lines, 1):
             stripped = line.strip()
-            if stripped.startswith('#'):
-                continue
-            
-            indent = self._calculate_indent(line)
-            
-            if self.python_block_re.match(stripped):
-                in_python_block = True
-                python_block_indent = indent
-                continue
-            
-            if in_python_block and indent <= python_block_indent and stripped:
-                if not stripped.startswith('#'):
+            if stripped and not stripped.startswith('#'):
+                indent = self._calculate_indent(line)
+                if self.python_block_re.match(stripped):
+                    in_python_block = True
+                    python_block_indent = indent
+                elif in_python_block and indent <= python_block_indent:
                     in_python_block = False
-        
-        return in_python_block
+            states[line_num] = in_python_block
+
+        return states
+
+    def _is_position_in_python_block(self, lines: List[str], target_line: int) -> bool:
+        """Belirtilen satırın python bloğu içinde olup olmadığını kontrol et"""
+        return self._python_block_map(lines[:target_line])[-1]
     
     def _extract_triple_string_content(self, triple_quoted: str) -> str:
         """Triple-quoted string'in içeriğini çıkar"""
@@ -1868,18 +3474,19 @@ class RenPyParser:
         if found_key:
             context_tag = f'variable:{found_key}'
 
-        return {
-            'text': text,
-            'line_number': line_number,
-            'context_line': context_line,
-            'character': '',
-            'text_type': text_type,
-            'context_path': [context_tag],
-            'processed_text': processed_text,
-            'placeholder_map': placeholder_map,
-            'is_deep_scan': True,  # Marker for UI
-            'file_path': file_path,
-        }
+        entry = TextEntry.create(
+            text,
+            line_number,
+            context_line,
+            '',
+            text_type,
+            (context_tag,),
+            processed_text,
+            placeholder_map,
+            file_path,
+        )
+        entry.is_deep_scan = True  # Marker for UI
+        return entry
     
     def extract_with_deep_scan(
         self,
@@ -1896,10 +3503,20 @@ class RenPyParser:
         Returns:
             Birleştirilmiş entry listesi
         """
-        entries = self.extract_text_entries(file_path)
+        # Dosya bir kez okunur; normal sonuçlar deep scan ile paylaşılır
+        read_once = functools.lru_cache(maxsize=1)(self._read_file_lines)
+        entries = self._cached_extract(
+            'entries', file_path,
+            functools.partial(self._extract_text_entries_uncached, read_lines=read_once),
+        )
         
         if include_deep_scan:
-            deep_entries = self.deep_scan_strings(file_path)
+            deep_entries = self._cached_extract(
+                'deep_scan', file_path,
+                functools.partial(
+                    self._deep_scan_strings_uncached, normal_entries=entries, read_lines=read_once
+                ),
+            )
             entries.extend(deep_entries)
         
         return entries
@@ -1908,7 +3525,9 @@ class RenPyParser:
         self,
         directory: Union[str, Path],
         include_deep_scan: bool = True,
-        recursive: bool = True
+        recursive: bool = True,
+        file_index: Optional[ProjectFileIndex] = None,
+        skip: Collection[Path] = (),
     ) -> Dict[Path, List[Dict[str, Any]]]:
         """
         Klasördeki tüm dosyaları deep scan ile tara.
@@ -1917,6 +3536,8 @@ class RenPyParser:
             directory: Klasör yolu
             include_deep_scan: Deep scan dahil et
             recursive: Alt klasörleri de tara
+            file_index: Aynı klasör için önceden oluşturulmuş dosya listesi (opsiyonel)
+            skip: Atlanacak dosyalar (ör. ScriptSourcePlan.skipped)
             
         Returns:
             {dosya_yolu: [entry listesi]} dictionary
@@ -1925,12 +3546,10 @@ class RenPyParser:
         search_root = self._resolve_search_root(directory)
         results: Dict[Path, List[Dict[str, Any]]] = {}
         
-        if recursive:
-            iterator = search_root.glob("**/*.rpy")
-        else:
-            iterator = search_root.glob("*.rpy")
-        
-        rpy_files = [f for f in iterator if not self._is_excluded_rpy(f, search_root)]
+        rpy_files = [
+            path for path in get_file_index(search_root, file_index, recursive).files('.rpy')
+            if path not in skip
+        ]
         
         self.logger.info(
             "Deep scan: Found %s .rpy files for processing",
@@ -1984,7 +3603,7 @@ class RenPyParser:
         """
         try:
             from .rpyc_reader import extract_texts_from_rpyc
-            return extract_texts_from_rpyc(file_path)
+            return extract_texts_from_rpyc(file_path, cache=self.get_extraction_cache())
         except ImportError:
             self.logger.warning("rpyc_reader module not available")
             return []
@@ -1992,10 +3611,26 @@ class RenPyParser:
             self.logger.error("Error reading RPYC %s: %s", file_path, exc)
             return []
     
+    def _iter_rpyc_entries(self, files: List[Path]) -> Iterator[Tuple[Path, List[Dict[str, Any]]]]:
+        """``extract_from_rpyc`` for each file in order; large sets use the process pool."""
+        try:
+            from .rpyc_reader import iter_rpyc_results
+        except ImportError:
+            self.logger.warning("rpyc_reader module not available")
+            return
+        yield from iter_rpyc_results(
+            files,
+            cache=self.get_extraction_cache(),
+            workers=self.pool_workers(len(files)),
+            extract=self.extract_from_rpyc,
+        )
+
     def extract_from_rpyc_directory(
         self,
         directory: Union[str, Path],
-        recursive: bool = True
+        recursive: bool = True,
+        file_index: Optional[ProjectFileIndex] = None,
+        skip: Collection[Path] = (),
     ) -> Dict[Path, List[Dict[str, Any]]]:
         """
         Klasördeki tüm .rpyc dosyalarından metin çıkar.
@@ -2003,13 +3638,18 @@ class RenPyParser:
         Args:
             directory: Klasör yolu
             recursive: Alt klasörleri de tara
+            file_index: Aynı klasör için önceden oluşturulmuş dosya listesi (opsiyonel)
+            skip: Okunmayacak .rpyc dosyaları (ör. ScriptSourcePlan.skipped)
             
         Returns:
             {dosya_yolu: [entry listesi]} dictionary
         """
         try:
             from .rpyc_reader import extract_texts_from_rpyc_directory
-            return extract_texts_from_rpyc_directory(directory, recursive)
+            return extract_texts_from_rpyc_directory(
+                directory, recursive, file_index=file_index, cache=self.get_extraction_cache(), skip=skip,
+                workers=self.pool_workers(),
+            )
         except ImportError:
             self.logger.warning("rpyc_reader module not available")
             return {}
@@ -2017,6 +3657,12 @@ class RenPyParser:
             self.logger.error("Error reading RPYC directory %s: %s", directory, exc)
             return {}
     
+    def script_source_mode(self) -> str:
+        """Configured .rpy/.rpyc pairing mode (``rpyc_source_mode``), SOURCE_MODE_AUTO by default."""
+        settings = getattr(self.config, 'translation_settings', None)
+        mode = getattr(settings, 'rpyc_source_mode', SOURCE_MODE_AUTO)
+        return mode if mode in SOURCE_MODES else SOURCE_MODE_AUTO
+
     def extract_combined(
         self,
         directory: Union[str, Path],
@@ -2041,13 +3687,26 @@ class RenPyParser:
         """
         results: Dict[Path, List[Dict[str, Any]]] = {}
         all_texts: Set[str] = set()
+        # List the project once for both the .rpy and .rpyc passes
+        file_index = ProjectFileIndex(self._resolve_search_root(Path(directory)), recursive=recursive)
+        # Aynı script'in .rpy ve .rpyc'si varsa yalnızca biri okunur (bkz. ScriptSourcePlan)
+        skipped: Collection[Path] = frozenset()
+        if include_rpy and include_rpyc:
+            plan = file_index.script_sources(self.script_source_mode())
+            skipped = plan.skipped
+            self.logger.info(
+                "Script sources (%s): %s .rpy/.rpyc pairs, %s read from .rpyc",
+                plan.mode, plan.pairs, plan.compiled,
+            )
         
         # .rpy dosyalarından çıkar
         if include_rpy:
             rpy_results = self.extract_from_directory_with_deep_scan(
                 directory,
                 include_deep_scan=include_deep_scan,
-                recursive=recursive
+                recursive=recursive,
+                file_index=file_index,
+                skip=skipped,
             )
             for file_path, entries in rpy_results.items():
                 results[file_path] = entries
@@ -2057,7 +3716,9 @@ class RenPyParser:
         # .rpyc dosyalarından çıkar (opsiyonel)
         if include_rpyc:
             try:
-                rpyc_results = self.extract_from_rpyc_directory(directory, recursive)
+                rpyc_results = self.extract_from_rpyc_directory(
+                    directory, recursive, file_index=file_index, skip=skipped
+                )
                 
                 # RPYC sonuçlarını ekle (duplicate'leri atla)
                 for file_path, entries in rpyc_results.items():
@@ -2133,3 +3794,21 @@ class RenPyParser:
 
         return True
 
+
+# ========== PROCESS POOL WORKERS ==========
+# Module-level so they can be pickled by ProcessPoolExecutor (spawn on Windows).
+
+_WORKER_PARSER: Optional[RenPyParser] = None
+
+
+def _init_parser_worker(config_manager=None) -> None:
+    """Create one parser per worker process instead of one per file."""
+    global _WORKER_PARSER
+    _WORKER_PARSER = RenPyParser(config_manager)
+
+
+def _extract_file_worker(file_path: str) -> Set[str]:
+    parser = _WORKER_PARSER
+    if parser is None:
+        parser = RenPyParser()
+    return parser.extract_translatable_text(file_path)
@@ -0,0 +1,222 @@
+"""
+Watch mode for projects that are still being written.
+
+Translators working next to an active developer used to re-run the whole
+scan after every script drop. ``ProjectWatcher`` polls the project folder
+instead and re-extracts only the scripts that were added, modified or
+deleted since the previous poll. Per-file results feed a
+``ProjectTextIndex`` (text -> number of files producing it), so each poll
+returns a ``TextDelta`` holding only strings that are new to the project or
+no longer produced by any file.
+
+Polling uses the same single ``os.scandir`` walk as ``ProjectFileIndex`` plus
+one ``stat`` per script, so it works the same on every platform and costs a
+few milliseconds per poll when nothing changed.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Mapping, Optional, Set, Tuple, Union
+
+from .parser import ProjectFileIndex, RenPyParser
+
+logger = logging.getLogger(__name__)
+
+SCRIPT_SUFFIXES = ('.rpy', '.rpym')
+COMPILED_SCRIPT_SUFFIXES = ('.rpyc', '.rpymc')
+DEFAULT_POLL_INTERVAL = 1.0
+
+
+@dataclass
+class TextDelta:
+    """Change of a project's text set between two polls."""
+    added: List[Dict[str, Any]] = field(default_factory=list)  # Projede ilk kez görülen metinler (ilk girişleri)
+    removed: List[str] = field(default_factory=list)  # Artık hiçbir dosyanın üretmediği metinler
+    files: List[Path] = field(default_factory=list)  # Yeniden çıkarılan veya silinen dosyalar
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed)
+
+
+class ProjectTextIndex:
+    """
+    Unique texts of a project, kept as per-file results.
+
+    A text stays in the index while at least one file produces it, so moving a
+    line to another file or deleting one of two copies emits nothing.
+    """
+
+    def __init__(self):
+        self._file_texts: Dict[Path, Tuple[str, ...]] = {}
+        self._counts: Dict[str, int] = {}
+
+    def apply(self, changes: Mapping[Path, Optional[List[Dict[str, Any]]]]) -> TextDelta:
+        """
+        Replace the results of the given files and return the resulting delta.
+
+        ``changes`` maps a file to its new entries, or to ``None`` when the
+        file was deleted.
+        """
+        # Metnin bu çağrıdan önce indekste olup olmadığı (ilk görüldüğü anda kaydedilir)
+        existed: Dict[str, bool] = {}
+        first_entries: Dict[str, Dict[str, Any]] = {}
+        counts = self._counts
+
+        for path, entries in changes.items():
+            for text in self._file_texts.pop(path, ()):
+                existed.setdefault(text, True)
+                remaining = counts[text] - 1
+                if remaining:
+                    counts[text] = remaining
+                else:
+                    del counts[text]
+
+            file_entries: Dict[str, Dict[str, Any]] = {}
+            for entry in entries or ():
+                text = entry.get('text', '')
+                if text and text not in file_entries:
+                    file_entries[text] = entry
+            for text, entry in file_entries.items():
+                existed.setdefault(text, text in counts)
+                counts[text] = counts.get(text, 0) + 1
+                first_entries.setdefault(text, entry)
+            if file_entries:
+                self._file_texts[path] = tuple(file_entries)
+
+        return TextDelta(
+            added=[entry for text, entry in first_entries.items() if not existed[text] and text in counts],
+            removed=[text for text, was_there in existed.items() if was_there and text not in counts],
+            files=list(changes),
+        )
+
+    def __contains__(self, text: str) -> bool:
+        return text in self._counts
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def texts(self) -> List[str]:
+        return list(self._counts)
+
+    def files(self) -> List[Path]:
+        return list(self._file_texts)
+
+
+class ProjectWatcher:
+    """
+    Polls a project folder and keeps a ``ProjectTextIndex`` in sync with it.
+
+    Change detection compares ``(size, mtime_ns)`` of every .rpy/.rpym file
+    (and .rpyc/.rpymc when the RPYC reader is enabled) with the previous
+    poll. .rpy/.rpyc pairs are read from one source (``ScriptSourcePlan``),
+    and the plan is only rebuilt when something changed.
+
+    The first ``poll()`` indexes the whole project and returns every text as
+    ``added``; later polls return deltas only.
+    """
+
+    def __init__(
+        self,
+        parser: RenPyParser,
+        root: Union[str, Path],
+        include_deep_scan: Optional[bool] = None,
+        include_rpyc: Optional[bool] = None,
+        interval: float = DEFAULT_POLL_INTERVAL,
+    ):
+        self.parser = parser
+        self.root = Path(root)
+        settings = getattr(parser.config, 'translation_settings', None)
+        if include_deep_scan is None:
+            include_deep_scan = getattr(settings, 'enable_deep_scan', True)
+        if include_rpyc is None:
+            include_rpyc = getattr(settings, 'enable_rpyc_reader', False)
+        self.include_deep_scan = bool(include_deep_scan)
+        self.include_rpyc = bool(include_rpyc)
+        self.interval = max(0.05, float(interval or DEFAULT_POLL_INTERVAL))
+        self.index = ProjectTextIndex()
+        self._suffixes = SCRIPT_SUFFIXES + (COMPILED_SCRIPT_SUFFIXES if self.include_rpyc else ())
+        # path -> (size, mtime_ns) of every watched file seen by the last poll
+        self._stats: Dict[Path, Tuple[int, int]] = {}
+        # Files whose results are in the index (pairs skipped by the source plan are not)
+        self._active: Set[Path] = set()
+        self._stop = threading.Event()
+
+    def poll(self) -> TextDelta:
+        """Re-extract added/modified files, drop deleted ones and return the delta."""
+        listing = ProjectFileIndex(self.root, suffixes=self._suffixes)
+        stats: Dict[Path, Tuple[int, int]] = {}
+        for path in listing:
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            stats[path] = (stat.st_size, stat.st_mtime_ns)
+        if stats == self._stats:
+            return TextDelta()
+
+        previous = self._stats
+        active = set(listing.files(*SCRIPT_SUFFIXES))
+        if self.include_rpyc:
+            active.update(listing.files(*COMPILED_SCRIPT_SUFFIXES))
+            active -= listing.script_sources(self.parser.script_source_mode()).skipped
+        active &= stats.keys()
+
+        changes: Dict[Path, Optional[List[Dict[str, Any]]]] = {}
+        for path in sorted(self._active - active):
+            changes[path] = None
+        for path in sorted(active):
+            if path in self._active and previous.get(path) == stats[path]:
+                continue
+            entries = self._extract(path)
+            if entries is None:
+                # Okunamadı (ör. yazılırken yakalandı); sonraki yoklamada tekrar denenir
+                stats.pop(path, None)
+                continue
+            changes[path] = entries
+
+        self._stats = stats
+        self._active = active
+        delta = self.index.apply(changes)
+        if changes:
+            logger.debug(
+                "Watch: %d file(s) re-extracted, +%d / -%d texts",
+                len(changes), len(delta.added), len(delta.removed),
+            )
+        return delta
+
+    def _extract(self, path: Path) -> Optional[List[Dict[str, Any]]]:
+        try:
+            if path.suffix.lower() in COMPILED_SCRIPT_SUFFIXES:
+                entries = self.parser.extract_from_rpyc(path)
+            elif self.include_deep_scan:
+                entries = self.parser.extract_with_deep_scan(path, include_deep_scan=True)
+            else:
+                entries = self.parser.extract_text_entries(path)
+        except Exception as exc:
+            logger.warning("Watch: %s okunamadı: %s", path, exc)
+            return None
+        path_str = str(path)
+        for entry in entries:
+            entry['file_path'] = path_str
+        return entries
+
+    def watch(self, callback: Callable[[TextDelta], None], stop_event: Optional[threading.Event] = None) -> None:
+        """Poll every ``interval`` seconds and pass non-empty deltas to ``callback`` until stopped."""
+        stop_event = stop_event or self._stop
+        while not stop_event.is_set():
+            try:
+                delta = self.poll()
+                if delta:
+                    callback(delta)
+            except Exception as exc:
+                # Tek bir başarısız yoklama izlemeyi durdurmaz
+                logger.error("Watch poll failed for %s: %s", self.root, exc)
+            stop_event.wait(self.interval)
+
+    def stop(self) -> None:
+        self._stop.set()
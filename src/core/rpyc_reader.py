@@ -16,18 +16,33 @@ Implementation based on Ren'Py's internal pickle format (MIT licensed).
 
 from __future__ import annotations
 
+import hashlib
 import logging
+import mmap
+import os
 import pickle
 import struct
+import threading
+import time
 import zlib
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass
+from itertools import chain
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple, Union
+from typing import TYPE_CHECKING, Any, Callable, Collection, Dict, FrozenSet, Iterator, List, Optional, Set, Tuple, Union
 
 logger = logging.getLogger(__name__)
 
+if TYPE_CHECKING:
+    from .extraction_cache import ExtractionCache
+
 # Import the whitelist and parser utilities from parser.py
-from .parser import DATA_KEY_WHITELIST, RenPyParser
+from .parser import (
+    DATA_KEY_WHITELIST, ProjectFileIndex, RenPyParser, TextEntry, get_file_index, intern_context_path,
+    is_technical_string,
+)
 import ast
 import re
 import io
@@ -35,6 +50,13 @@ import traceback
 import binascii
 import sys
 
+# Compact form of one RPYC entry, also what pool workers send back:
+# (text, line_number, text_type, character, context_path, source_file)
+RpycRecord = Tuple[str, int, str, str, Tuple[str, ...], str]
+
+# Hashable copy for the memoized technical-string check
+_DATA_KEY_WHITELIST = frozenset(DATA_KEY_WHITELIST)
+
 
 # ============================================================================
 # FAKE REN'PY MODULE SYSTEM
@@ -65,6 +87,9 @@ class FakeModuleRegistry:
 
 class FakeASTBase:
     """Base class for fake Ren'Py AST nodes."""
+    # Attributes ASTTextExtractor reads; selective unpickling drops the rest
+    # of the pickled state (see selective_class). Subclasses declare their own.
+    KEEP_STATE = frozenset({'linenumber'})
     
     def __init__(self):
         self.linenumber: int = 0
@@ -90,6 +115,7 @@ class FakeASTBase:
 
 class FakeSay(FakeASTBase):
     """Represents dialogue: character "text" """
+    KEEP_STATE = frozenset({'linenumber', 'who', 'what'})
     def __init__(self):
         super().__init__()
         self.who: Optional[str] = None  # Character speaking
@@ -109,6 +135,7 @@ class FakeTranslateSay(FakeSay):
     A node that combines a translate and a say statement.
     This is used in newer Ren'Py versions for translatable dialogue.
     """
+    KEEP_STATE = frozenset({'linenumber', 'who', 'what', 'identifier'})
     def __init__(self):
         super().__init__()
         self.identifier: Optional[str] = None
@@ -128,6 +155,7 @@ class FakeTranslateSay(FakeSay):
 
 class FakeMenu(FakeASTBase):
     """Represents menu statement with choices."""
+    KEEP_STATE = frozenset({'linenumber', 'items'})
     def __init__(self):
         super().__init__()
         self.items: List[Tuple[str, Any, Any]] = []  # (label, condition, block)
@@ -141,6 +169,7 @@ class FakeMenu(FakeASTBase):
 
 class FakeLabel(FakeASTBase):
     """Represents label statement."""
+    KEEP_STATE = frozenset({'name', 'block'})
     def __init__(self):
         super().__init__()
         self.name: str = ""
@@ -151,6 +180,7 @@ class FakeLabel(FakeASTBase):
 
 class FakeInit(FakeASTBase):
     """Represents init block."""
+    KEEP_STATE = frozenset({'block'})
     def __init__(self):
         super().__init__()
         self.block: List[Any] = []
@@ -159,6 +189,7 @@ class FakeInit(FakeASTBase):
 
 class FakePython(FakeASTBase):
     """Represents python/$ code block."""
+    KEEP_STATE = frozenset({'linenumber', 'code'})
     def __init__(self):
         super().__init__()
         self.code: Optional[Any] = None
@@ -246,6 +277,7 @@ class FakePyExpr(str):
 
 class FakeScreen(FakeASTBase):
     """Represents screen definition."""
+    KEEP_STATE = frozenset({'name', 'screen'})
     def __init__(self):
         super().__init__()
         self.name: str = ""
@@ -255,6 +287,7 @@ class FakeScreen(FakeASTBase):
 
 class FakeTranslate(FakeASTBase):
     """Represents translate block."""
+    KEEP_STATE = frozenset({'language', 'block'})
     def __init__(self):
         super().__init__()
         self.identifier: str = ""
@@ -264,6 +297,7 @@ class FakeTranslate(FakeASTBase):
 
 class FakeTranslateString(FakeASTBase):
     """Represents string translation."""
+    KEEP_STATE = frozenset({'linenumber', 'old'})
     def __init__(self):
         super().__init__()
         self.language: Optional[str] = None
@@ -273,6 +307,7 @@ class FakeTranslateString(FakeASTBase):
 
 class FakeTranslateBlock(FakeASTBase):
     """Represents translate block (style/python)."""
+    KEEP_STATE = frozenset({'block'})
     def __init__(self):
         super().__init__()
         self.language: Optional[str] = None
@@ -281,6 +316,7 @@ class FakeTranslateBlock(FakeASTBase):
 
 class FakeUserStatement(FakeASTBase):
     """Represents user-defined statement (like nvl, music, etc.)."""
+    KEEP_STATE = frozenset({'linenumber', 'line'})
     def __init__(self):
         super().__init__()
         self.line: str = ""
@@ -297,6 +333,7 @@ class FakeUserStatement(FakeASTBase):
 
 class FakePostUserStatement(FakeASTBase):
     """Post-execution node for user statements."""
+    KEEP_STATE = frozenset({'block'})
     def __init__(self):
         super().__init__()
         self.parent: Optional[Any] = None
@@ -304,6 +341,7 @@ class FakePostUserStatement(FakeASTBase):
 
 class FakeIf(FakeASTBase):
     """Represents if/elif/else statement."""
+    KEEP_STATE = frozenset({'entries'})
     def __init__(self):
         super().__init__()
         self.entries: List[Tuple[Any, List[Any]]] = []  # (condition, block)
@@ -311,6 +349,7 @@ class FakeIf(FakeASTBase):
 
 class FakeWhile(FakeASTBase):
     """Represents while loop."""
+    KEEP_STATE = frozenset({'block'})
     def __init__(self):
         super().__init__()
         self.condition: Any = None
@@ -319,6 +358,7 @@ class FakeWhile(FakeASTBase):
 
 class FakeDefine(FakeASTBase):
     """Represents define statement."""
+    KEEP_STATE = frozenset({'linenumber', 'code'})
     def __init__(self):
         super().__init__()
         self.varname: str = ""
@@ -330,6 +370,7 @@ class FakeDefine(FakeASTBase):
 
 class FakeDefault(FakeASTBase):
     """Represents default statement."""
+    KEEP_STATE = frozenset({'block'})
     def __init__(self):
         super().__init__()
         self.varname: str = ""
@@ -409,6 +450,7 @@ class FakePass(FakeASTBase):
 
 class FakeGeneric(FakeASTBase):
     """Generic fallback for unknown AST nodes."""
+    KEEP_STATE = frozenset({'block'})
     def __init__(self):
         super().__init__()
         self._unknown_type: str = ""
@@ -455,6 +497,7 @@ class FakeParameterInfo:
 
 class FakeATLTransformBase:
     """Base for ATL transform objects."""
+    KEEP_STATE = frozenset()
     def __init__(self):
         self.atl: Optional[Any] = None
         self.parameters: Optional[Any] = None
@@ -467,6 +510,7 @@ class FakeATLTransformBase:
 
 class FakeRawBlock:
     """ATL raw block."""
+    KEEP_STATE = frozenset()
     def __init__(self):
         self.statements: List[Any] = []
         self.animation: bool = False
@@ -479,6 +523,7 @@ class FakeRawBlock:
 
 class FakeNode:
     """Generic node from renpy.ast.Node."""
+    KEEP_STATE = frozenset({'block'})
     def __init__(self):
         self.filename: str = ""
         self.linenumber: int = 0
@@ -500,6 +545,7 @@ class FakeNode:
 # SL2 (Screen Language 2) fake classes
 class FakeSLScreen:
     """Screen Language 2 screen object."""
+    KEEP_STATE = frozenset({'name', 'children'})
     def __init__(self):
         self.name: str = ""
         self.children: List[Any] = []
@@ -514,6 +560,7 @@ class FakeSLScreen:
 
 class FakeSLDisplayable:
     """Screen Language displayable (text, textbutton, etc.)."""
+    KEEP_STATE = frozenset({'positional', 'keyword', 'children', 'location'})
     def __init__(self):
         self.displayable: Any = None
         self.style: Optional[str] = None
@@ -529,6 +576,7 @@ class FakeSLDisplayable:
 
 class FakeSLIf:
     """Screen Language if statement."""
+    KEEP_STATE = frozenset({'entries'})
     def __init__(self):
         self.entries: List[tuple] = []
         self.location: tuple = ()
@@ -540,6 +588,7 @@ class FakeSLIf:
 
 class FakeSLFor:
     """Screen Language for loop."""
+    KEEP_STATE = frozenset({'children'})
     def __init__(self):
         self.variable: str = ""
         self.expression: str = ""
@@ -553,6 +602,7 @@ class FakeSLFor:
 
 class FakeSLBlock:
     """Screen Language block."""
+    KEEP_STATE = frozenset({'children'})
     def __init__(self):
         self.children: List[Any] = []
         self.keyword: List[tuple] = []
@@ -565,6 +615,7 @@ class FakeSLBlock:
 
 class FakeSLUse:
     """Screen Language use statement."""
+    KEEP_STATE = frozenset({'block'})
     def __init__(self):
         self.target: str = ""
         self.args: Optional[Any] = None
@@ -578,6 +629,7 @@ class FakeSLUse:
 
 class FakeSLPython:
     """Screen Language python block."""
+    KEEP_STATE = frozenset()
     def __init__(self):
         self.code: Optional[Any] = None
         self.location: tuple = ()
@@ -589,6 +641,7 @@ class FakeSLPython:
 
 class FakeSLDefault:
     """Screen Language default statement."""
+    KEEP_STATE = frozenset()
     def __init__(self):
         self.variable: str = ""
         self.expression: str = ""
@@ -677,6 +730,80 @@ class FakeSentinel:
         self.name = name
 
 
+# ============================================================================
+# SELECTIVE UNPICKLING
+# ============================================================================
+# Text extraction reads a handful of attributes per node, but a pickled node
+# carries its whole state: ATL blocks, image specs, argument infos, node names,
+# store objects. In selective mode the unpickler hands out variants of the
+# fake classes that keep only ``KEEP_STATE``, so the dropped objects are freed
+# as soon as loading ends instead of living (and being traversed by the GC)
+# for the whole walk.
+
+_SELECTIVE_CLASSES: Dict[type, type] = {}
+
+
+def _filter_state(state: Any, keep: FrozenSet[str]) -> Any:
+    if isinstance(state, dict):
+        return {key: state[key] for key in keep if key in state}
+    if isinstance(state, tuple):
+        return tuple(_filter_state(part, keep) if isinstance(part, dict) else part for part in state)
+    return state
+
+
+def selective_class(klass: type) -> type:
+    """
+    Variant of a fake class whose ``__setstate__`` keeps only ``KEEP_STATE``.
+
+    The variant is a subclass, so isinstance checks and handler lookups still
+    match. Classes without ``KEEP_STATE`` (containers, code objects, argument
+    infos) are returned unchanged.
+    """
+    lean = _SELECTIVE_CLASSES.get(klass)
+    if lean is None:
+        keep = getattr(klass, 'KEEP_STATE', None)
+        if keep is None:
+            lean = klass
+        else:
+            restore = klass.__setstate__
+
+            def __setstate__(self, state: Any) -> None:
+                restore(self, _filter_state(state, keep))
+
+            lean = type(klass.__name__, (klass,), {'__setstate__': __setstate__, '__module__': klass.__module__})
+        _SELECTIVE_CLASSES[klass] = lean
+    return lean
+
+
+class FakeDiscarded:
+    """
+    Shared stateless stand-in for unknown store/engine objects (selective mode).
+
+    Every instance is the same object and ignores its state, so a game that
+    pickles thousands of store objects into its scripts costs nothing here.
+    """
+    __slots__ = ()
+    _instance: Optional['FakeDiscarded'] = None
+
+    def __new__(cls, *args: Any, **kwargs: Any) -> 'FakeDiscarded':
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __setstate__(self, state: Any) -> None:
+        pass
+
+    # List/dict subclasses are filled through these while unpickling
+    def append(self, item: Any) -> None:
+        pass
+
+    def extend(self, items: Any) -> None:
+        pass
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        pass
+
+
 # ============================================================================
 # CUSTOM UNPICKLER
 # ============================================================================
@@ -814,8 +941,24 @@ class RenpyUnpickler(pickle.Unpickler):
         ("collections", "OrderedDict"): FakeOrderedDict,
     }
     
+    def __init__(self, file: Any, *, selective: bool = False, **kwargs: Any):
+        super().__init__(file, **kwargs)
+        # Seçici mod: düğümler yalnızca KEEP_STATE özniteliklerini tutar
+        self.selective = selective
+
     def find_class(self, module: str, name: str) -> type:
         """Override to redirect Ren'Py classes to our fakes."""
+        klass = self._find_fake_class(module, name)
+        if not self.selective:
+            return klass
+        if klass is FakeGeneric and (module, name) not in self.CLASS_MAP and module != "renpy.ast" and (
+            module == "store" or module.startswith(("store.", "renpy."))
+        ):
+            # Unknown game/engine objects are never read; unknown AST nodes may still hold a block
+            return FakeDiscarded
+        return selective_class(klass)
+
+    def _find_fake_class(self, module: str, name: str) -> type:
         key = (module, name)
         
         if key in self.CLASS_MAP:
@@ -857,7 +1000,7 @@ class RpycReadError(Exception):
     pass
 
 
-def read_rpyc_header(data: bytes) -> RpycHeader:
+def read_rpyc_header(data: Union[bytes, memoryview, mmap.mmap]) -> RpycHeader:
     """
     Parse .rpyc file header.
     
@@ -869,11 +1012,13 @@ def read_rpyc_header(data: bytes) -> RpycHeader:
     RPYC v1 format:
     - Just zlib-compressed pickle data (no header)
     """
+    # bytes, memoryview veya mmap olabilir; sadece imza kopyalanır
+    magic = bytes(data[:10])
     # Eğer RPC2 değilse hemen pes etme, belki de RPC3'tür ama yapısı benzerdir.
-    if data.startswith(b"RENPY RPC"):
+    if magic.startswith(b"RENPY RPC"):
         # RPC2 veya RPC3 fark etmeksizin işlemeyi dene
         pass
-    elif not data.startswith(b"RENPY RPC2"):
+    elif not magic.startswith(b"RENPY RPC2"):
         # V1 (Sıkıştırılmış pickle) varsayımı
         return RpycHeader(version=1, slot_count=0, slots={})
     
@@ -882,7 +1027,7 @@ def read_rpyc_header(data: bytes) -> RpycHeader:
     slots = {}
     
     while position + 12 <= len(data):
-        slot_id, start, length = struct.unpack("<III", data[position:position + 12])
+        slot_id, start, length = struct.unpack_from("<III", data, position)
         
         if slot_id == 0:
             break
@@ -893,12 +1038,40 @@ def read_rpyc_header(data: bytes) -> RpycHeader:
     return RpycHeader(version=2, slot_count=len(slots), slots=slots)
 
 
-def read_rpyc_file(file_path: Union[str, Path]) -> List[Any]:
+# Ren'Py, .rpyc'nin sonuna derlendiği .rpy'nin MD5'ini ekler (yeniden derleme kontrolü)
+SOURCE_DIGEST_SIZE = 16
+RPYC_HEADER_READ = 1024
+
+
+def read_rpyc_source_digest(file_path: Union[str, Path]) -> Optional[bytes]:
+    """
+    MD5 digest of the .rpy source that Ren'Py appends after the data slots.
+
+    Only the header and the trailing bytes are read. Returns None for RPYC v1
+    files, files without a trailing digest and unreadable files.
+    """
+    try:
+        with open(file_path, 'rb') as f:
+            header = read_rpyc_header(f.read(RPYC_HEADER_READ))
+            if header.version != 2 or not header.slots:
+                return None
+            data_end = max(start + length for start, length in header.slots.values())
+            if f.seek(0, 2) - data_end != SOURCE_DIGEST_SIZE:
+                return None
+            f.seek(data_end)
+            return f.read(SOURCE_DIGEST_SIZE)
+    except OSError:
+        return None
+
+
+def read_rpyc_file(file_path: Union[str, Path], selective: bool = False) -> List[Any]:
     """
     Read .rpyc file and return AST nodes.
     
     Args:
         file_path: Path to .rpyc file
+        selective: Keep only the node attributes text extraction reads
+            (``KEEP_STATE``); unknown store/engine objects become ``FakeDiscarded``
         
     Returns:
         List of AST nodes
@@ -916,31 +1089,95 @@ def read_rpyc_file(file_path: Union[str, Path]) -> List[Any]:
     
     try:
         with open(file_path, 'rb') as f:
-            data = f.read()
-    except IOError as e:
+            if os.fstat(f.fileno()).st_size == 0:
+                raise RpycReadError("Decompression failed: empty file")
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError) as e:
         raise RpycReadError(f"Cannot read file: {e}")
-    
-    header = read_rpyc_header(data)
-    
-    # Get the compressed data
-    if header.version == 1:
-        compressed = data
-    else:
-        if 1 not in header.slots:
-            raise RpycReadError("No data slot found in RPYC v2 file")
-        
-        start, length = header.slots[1]
-        compressed = data[start:start + length]
-    
-    # Decompress
+
+    view = memoryview(mapped)
+    compressed = None
     try:
-        decompressed = zlib.decompress(compressed)
-    except zlib.error as e:
-        raise RpycReadError(f"Decompression failed: {e}")
-    
+        header = read_rpyc_header(view)
+
+        # Get the compressed data (a view into the mapping, not a copy)
+        if header.version == 1:
+            compressed = view[:]
+        else:
+            if 1 not in header.slots:
+                raise RpycReadError("No data slot found in RPYC v2 file")
+
+            start, length = header.slots[1]
+            compressed = view[start:start + length]
+
+        stream = _InflateReader(compressed)
+        return _unpickle_statements(file_path, header, stream, selective)
+    finally:
+        # Görünümler serbest bırakılmadan mmap kapatılamaz
+        if compressed is not None:
+            compressed.release()
+        view.release()
+        mapped.close()
+
+
+# Compressed bytes fed to the inflater per step / decompressed bytes produced per step
+RPYC_INFLATE_INPUT_CHUNK = 64 * 1024
+RPYC_INFLATE_OUTPUT_CHUNK = 256 * 1024
+
+
+class _InflateReader(io.RawIOBase):
+    """
+    Read-only stream that inflates a zlib buffer on demand.
+
+    The unpickler reads the pickle straight from here, so the decompressed
+    script never exists as one bytes object. The first 512 bytes are kept
+    for diagnostics.
+    """
+
+    def __init__(self, compressed: memoryview):
+        self._source = compressed
+        self._position = 0
+        self._inflater = zlib.decompressobj()
+        self._pending = b""
+        self._offset = 0
+        self.head = b""
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while self._offset >= len(self._pending):
+            if not self._fill():
+                return 0
+        size = min(len(buffer), len(self._pending) - self._offset)
+        buffer[:size] = self._pending[self._offset:self._offset + size]
+        self._offset += size
+        return size
+
+    def _fill(self) -> bool:
+        inflater = self._inflater
+        if inflater.eof:
+            return False
+        if inflater.unconsumed_tail:
+            self._pending = inflater.decompress(inflater.unconsumed_tail, RPYC_INFLATE_OUTPUT_CHUNK)
+        else:
+            if self._position >= len(self._source):
+                raise zlib.error("Error -5 while decompressing data: incomplete or truncated stream")
+            end = self._position + RPYC_INFLATE_INPUT_CHUNK
+            # Dilim hata durumunda da bırakılmalı, yoksa mmap kapatılamaz
+            with self._source[self._position:end] as data:
+                self._pending = inflater.decompress(data, RPYC_INFLATE_OUTPUT_CHUNK)
+            self._position = min(end, len(self._source))
+        self._offset = 0
+        if len(self.head) < 512:
+            self.head += self._pending[:512 - len(self.head)]
+        return True
+
+
+def _unpickle_statements(file_path: Path, header: RpycHeader, stream: _InflateReader, selective: bool = False) -> List[Any]:
     # Unpickle using our custom unpickler
     try:
-        unpickler = RenpyUnpickler(io.BytesIO(decompressed))
+        unpickler = RenpyUnpickler(io.BufferedReader(stream, RPYC_INFLATE_OUTPUT_CHUNK), selective=selective)
         result = unpickler.load()
 
         # Result is typically (data, stmts) tuple
@@ -949,6 +1186,9 @@ def read_rpyc_file(file_path: Union[str, Path]) -> List[Any]:
 
         return result if isinstance(result, list) else [result]
 
+    except zlib.error as e:
+        raise RpycReadError(f"Decompression failed: {e}")
+
     except Exception as e:
         # Log detailed diagnostics to help identify problematic pickle state
         tb = traceback.format_exc()
@@ -960,10 +1200,9 @@ def read_rpyc_file(file_path: Union[str, Path]) -> List[Any]:
 
         # Provide a hex snippet of the decompressed pickle to aid debugging
         try:
-            snippet = decompressed[:512]
-            snippet_hex = binascii.hexlify(snippet).decode('ascii')
+            snippet_hex = binascii.hexlify(stream.head).decode('ascii')
         except Exception:
-            snippet_hex = repr(decompressed[:200])
+            snippet_hex = repr(stream.head[:200])
 
         msg = (
             f"Unpickle failed for {file_path}: {e}\n"
@@ -997,16 +1236,228 @@ def read_rpyc_file(file_path: Union[str, Path]) -> List[Any]:
 # ============================================================================
 
 
-@dataclass
+# Nodes whose subtrees never hold translatable text: image/show/scene
+# statements (their ATL lives in .atl, which is never walked), ATL blocks and
+# control flow without a block. They are not even probed for a .block.
+# (Subclasses included: selective unpickling hands out subclasses.)
+_TEXTLESS_NODE_CLASSES = (
+    FakeImage, FakeShow, FakeScene, FakeHide, FakeWith, FakeCall, FakeJump, FakeReturn, FakePass,
+    FakeRawBlock, FakeATLTransformBase, FakeSLPython, FakeSLDefault, FakeDiscarded,
+)
+
+
+# One string found in a Python code block: (text, text_type, context, placeholder_map)
+CodeString = Tuple[str, str, str, Dict[str, str]]
+
+# Code blocks whose strings are kept per process (digest -> strings)
+CODE_STRINGS_MEMO_SIZE = 4096
+_CODE_STRINGS_MEMO: 'OrderedDict[bytes, Tuple[CodeString, ...]]' = OrderedDict()
+_CODE_STRINGS_LOCK = threading.Lock()
+
+# Regex fallback for code that does not parse: (pattern, text_type, context),
+# run one after another in this order. Separate precompiled passes, not one
+# alternation: matches of different patterns overlap (``__(`` also matches
+# ``_(``, gui.*text* both gui patterns), and each literal-prefixed pattern is
+# found with a fast prefix search, which a fused scan measured slower than.
+_CODE_CALL_PATTERNS = tuple((re.compile(pattern), text_type, context) for pattern, text_type, context in (
+    (r'_\s*\(\s*["\'](.+?)["\']\s*\)', 'string', 'python/_'),  # _("text")
+    (r'__\s*\(\s*["\'](.+?)["\']\s*\)', 'string', 'python/__'),  # __("text")
+    (r'renpy\.notify\s*\(\s*["\'](.+?)["\']\s*\)', 'ui', 'notify'),
+    (r'Character\s*\(\s*["\'](.+?)["\']\s*[\),]', 'string', 'character_define'),
+    (r'DynamicCharacter\s*\(\s*["\'](.+?)["\']\s*[\),]', 'string', 'character_define'),
+    (r'renpy\.say\s*\([^,]*,\s*["\'](.+?)["\']\s*[\),]', 'dialogue', 'python/say'),
+    (r'Text\s*\(\s*["\'](.+?)["\']\s*[\),]', 'ui', 'displayable'),  # Text displayable
+    (r'config\.(?:name|version)\s*=\s*["\'](.+?)["\']', 'string', 'config'),
+    (r'gui\.\w*text\w*\s*=\s*["\'](.+?)["\']', 'ui', 'gui'),
+    (r'gui\.\w*\s*=\s*["\'](.+?)["\']', 'ui', 'gui'),
+    (r'renpy\.show\s*\(\s*["\'](.+?)["\']\s*\)', 'ui', 'show'),
+))
+# Supports optional prefixes like f, r, b, u, fr, rf etc. and escaped quotes
+_PY_STRING_LITERAL_RE = re.compile(r'''(?P<quote>(?:[rRuUbBfF]{,2})?(?:"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*'))''')
+# Context: var = [  OR  var = {  OR  "key":  OR var = "string" (assignment)
+_CODE_LIST_CONTEXT_RE = re.compile(r'(?P<var>[a-zA-Z_]\w*)\s*(?:=\s*[\[\(\{]|\+=\s*[\[\(]|\.(?:append|extend|insert)\s*\()|["\'](?P<key>\w+)["\']\s*[:=]')
+_CODE_CONTEXT_LOOKBACK = 1000
+_PYTHON_BLOCK_HEADER_RE = re.compile(r'^(?:\s*init\s+python\s*:|\s*python\s*:)', flags=re.I)
+
+
+class _CodeStringVisitor(ast.NodeVisitor):
+    """Reports the strings of a parsed code block through ``add_text_val`` (see _collect_code_strings_ast)."""
+
+    def __init__(self, code: str, add_text_val: Callable[..., None]):
+        super().__init__()
+        self.code = code
+        self.add_text_val = add_text_val
+        self.current_assign_ctx = ''
+
+    def visit_Constant(self, node):
+        if isinstance(node.value, str):
+            self.add_text_val(node.value)
+        self.generic_visit(node)
+
+    def visit_JoinedStr(self, node):
+        parts = []
+        for v in node.values:
+            if isinstance(v, ast.Constant) and isinstance(v.value, str):
+                parts.append(v.value)
+            elif isinstance(v, ast.FormattedValue):
+                # Try to extract the source segment text for the expression when possible
+                try:
+                    expr_src = ast.get_source_segment(self.code, v) or 'expr'
+                except Exception:
+                    expr_src = 'expr'
+                parts.append('{' + expr_src + '}')
+        self.add_text_val(''.join(parts))
+        self.generic_visit(node)
+
+    def visit_Call(self, node):
+        # Detect join calls like ", ".join(['a','b']) where value is a constant string
+        try:
+            func = node.func
+            # joined string: Attribute(value=Constant(', '), attr='join')
+            if isinstance(func, ast.Attribute) and func.attr == 'join':
+                val = func.value
+                if isinstance(val, ast.Constant) and isinstance(val.value, str):
+                    self.add_text_val(val.value)
+            # format call: "{}".format(...)
+            if isinstance(func, ast.Attribute) and func.attr == 'format':
+                val = func.value
+                if isinstance(val, ast.Constant) and isinstance(val.value, str):
+                    self.add_text_val(val.value)
+            # _p() call or renpy.notify call (not exhaustive)
+            if isinstance(func, ast.Name) and func.id in {'_p', 'renpy', 'notify'}:
+                # get constants in args
+                for a in node.args:
+                    if isinstance(a, ast.Constant) and isinstance(a.value, str):
+                        self.add_text_val(a.value)
+                    elif isinstance(a, ast.List):
+                        for el in a.elts:
+                            if isinstance(el, ast.Constant) and isinstance(el.value, str):
+                                self.add_text_val(el.value)
+        except Exception:
+            pass
+        self.generic_visit(node)
+
+    def visit_List(self, node):
+        for elt in node.elts:
+            if isinstance(elt, ast.Constant) and isinstance(elt.value, str):
+                self.add_text_val(elt.value, ctx=self.current_assign_ctx, text_type='data_string' if self.current_assign_ctx else 'python_string')
+            elif isinstance(elt, ast.JoinedStr):
+                # If part of an assignment context, we should consider it data_string
+                parts = []
+                for v in elt.values:
+                    if isinstance(v, ast.Constant) and isinstance(v.value, str):
+                        parts.append(v.value)
+                    elif isinstance(v, ast.FormattedValue):
+                        try:
+                            expr_src = ast.get_source_segment(self.code, v) or 'expr'
+                        except Exception:
+                            expr_src = 'expr'
+                        parts.append('{' + expr_src + '}')
+                self.add_text_val(''.join(parts), ctx=self.current_assign_ctx, text_type='data_string' if self.current_assign_ctx else 'python_string')
+        self.generic_visit(node)
+
+    def visit_Dict(self, node):
+        for v in node.values:
+            if isinstance(v, ast.Constant) and isinstance(v.value, str):
+                self.add_text_val(v.value, ctx=self.current_assign_ctx, text_type='data_string' if self.current_assign_ctx else 'python_string')
+            elif isinstance(v, ast.JoinedStr):
+                self.visit_JoinedStr(v)
+        self.generic_visit(node)
+
+    def visit_Assign(self, node):
+        # capture variable context by name if possible
+        try:
+            if isinstance(node.targets[0], ast.Name):
+                varname = node.targets[0].id
+        except Exception:
+            varname = None
+        val = node.value
+        ctx = ''
+        if varname and varname.lower() in DATA_KEY_WHITELIST:
+            ctx = f'rpyc_val:{varname}'
+        if isinstance(val, ast.Constant) and isinstance(val.value, str):
+            self.add_text_val(val.value, ctx=ctx, text_type='data_string' if ctx else 'python_string')
+        elif isinstance(val, ast.JoinedStr):
+            # pass context for formats
+            parts = []
+            for v in val.values:
+                if isinstance(v, ast.Constant) and isinstance(v.value, str):
+                    parts.append(v.value)
+                elif isinstance(v, ast.FormattedValue):
+                    try:
+                        expr_src = ast.get_source_segment(self.code, v) or 'expr'
+                    except Exception:
+                        expr_src = 'expr'
+                    parts.append('{' + expr_src + '}')
+            self.add_text_val(''.join(parts), ctx=ctx, text_type='data_string' if ctx else 'python_string')
+        else:
+            # Set a context to allow nested lists/dicts to be processed with variable context
+            prev_ctx = self.current_assign_ctx
+            self.current_assign_ctx = ctx
+            self.generic_visit(node)
+            self.current_assign_ctx = prev_ctx
+
+    def visit_BinOp(self, node):
+        # Extract strings from concatenations and % formatting
+        try:
+            if isinstance(node.op, ast.Add):
+                left = node.left
+                right = node.right
+                if isinstance(left, ast.Constant) and isinstance(left.value, str):
+                    self.add_text_val(left.value)
+                if isinstance(right, ast.Constant) and isinstance(right.value, str):
+                    self.add_text_val(right.value)
+            if isinstance(node.op, ast.Mod):
+                # % formatting: left is constant string
+                left = node.left
+                if isinstance(left, ast.Constant) and isinstance(left.value, str):
+                    self.add_text_val(left.value)
+        except Exception:
+            pass
+        self.generic_visit(node)
+
+
 class ExtractedText:
-    """Represents text extracted from AST."""
-    text: str
-    line_number: int
-    source_file: str
-    text_type: str  # 'dialogue', 'menu', 'ui', 'string', etc.
-    character: str = ""
-    context: str = ""
-    placeholder_map: Dict[str, str] = None
+    """Represents text extracted from AST (slotted: one record per extracted string)."""
+
+    FIELDS = ('text', 'line_number', 'source_file', 'text_type', 'character', 'context', 'placeholder_map')
+    __slots__ = FIELDS
+
+    def __init__(
+        self,
+        text: str,
+        line_number: int,
+        source_file: str,
+        text_type: str,  # 'dialogue', 'menu', 'ui', 'string', etc.
+        character: str = "",
+        context: str = "",
+        placeholder_map: Dict[str, str] = None,
+    ):
+        self.text = text
+        self.line_number = line_number
+        self.source_file = source_file
+        self.text_type = text_type
+        self.character = character
+        self.context = context
+        self.placeholder_map = placeholder_map
+
+    def as_record(self) -> RpycRecord:
+        """Plain tuple form used by the cache and the process pool (see ``_record_entry``)."""
+        return (
+            self.text, self.line_number, self.text_type, self.character,
+            (self.context,) if self.context else (), self.source_file,
+        )
+
+    def __eq__(self, other: Any) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.FIELDS)
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        fields = ', '.join(f"{name}={getattr(self, name)!r}" for name in self.FIELDS)
+        return f"ExtractedText({fields})"
 
 
 class ASTTextExtractor:
@@ -1015,7 +1466,9 @@ class ASTTextExtractor:
     """
     
     def __init__(self):
-        self.extracted: List[ExtractedText] = []
+        # Results of the current file, text -> ExtractedText in extraction order.
+        # A dict instead of a list: replacing a duplicate is O(1) (see _add_text).
+        self._results: Dict[str, ExtractedText] = {}
         # Map text -> (context, ExtractedText) to handle deduplication and prefer more specific
         self.seen_map: Dict[str, ExtractedText] = {}
         self.current_file: str = ""
@@ -1023,6 +1476,18 @@ class ASTTextExtractor:
         self.DATA_KEY_WHITELIST = DATA_KEY_WHITELIST
         # Instantiate parser once for performance (placeholder preservation, etc.)
         self.parser = RenPyParser()
+        # Walker statistics (all files read by this extractor)
+        self.nodes_visited = 0
+        self.walk_seconds = 0.0
+
+    @property
+    def extracted(self) -> List[ExtractedText]:
+        """Texts extracted from the current file, in extraction order."""
+        return list(self._results.values())
+
+    @extracted.setter
+    def extracted(self, entries: List[ExtractedText]) -> None:
+        self._results = {entry.text: entry for entry in entries}
     
     def extract_from_file(self, file_path: Union[str, Path]) -> List[ExtractedText]:
         """
@@ -1039,8 +1504,17 @@ class ASTTextExtractor:
         self.current_file = str(file_path)
         
         try:
-            ast_nodes = read_rpyc_file(file_path)
+            ast_nodes = read_rpyc_file(file_path, selective=True)
+            visited = self.nodes_visited
+            started = time.perf_counter()
             self._walk_nodes(ast_nodes)
+            elapsed = time.perf_counter() - started
+            self.walk_seconds += elapsed
+            visited = self.nodes_visited - visited
+            logger.debug(
+                "Walked %d AST nodes of %s in %.3fs (%.0f nodes/s)",
+                visited, file_path, elapsed, visited / elapsed if elapsed > 0 else 0.0,
+            )
         except RpycReadError as e:
             logger.exception(f"Failed to read {file_path}: {e}")
         
@@ -1064,12 +1538,9 @@ class ASTTextExtractor:
         if existing:
             # If existing has no context but new context exists, replace existing
             if context and not existing.context:
-                # Remove existing from list
-                try:
-                    self.extracted.remove(existing)
-                except ValueError:
-                    pass
-                # continue to add new
+                # Remove existing from results (it may belong to a previous file)
+                # and continue to add new; re-inserted at the end like before
+                self._results.pop(text, None)
             else:
                 return
         
@@ -1078,60 +1549,19 @@ class ASTTextExtractor:
             return
         
         # store in seen_map
-        self.seen_map[text] = ExtractedText(
-            text=text,
-            line_number=line_number,
-            source_file=self.current_file,
-            text_type=text_type,
-            character=character,
-            context=context,
-            placeholder_map=placeholder_map or {}
+        self.seen_map[text] = self._results[text] = ExtractedText(
+            text,
+            line_number,
+            self.current_file,
+            text_type,
+            character,
+            context,
+            placeholder_map or {},
         )
-        self.extracted.append(self.seen_map[text])
     
     def _is_technical_string(self, text: str, context: str = "") -> bool:
         """Check if string is technical (not translatable)."""
-        import re
-        p = self.parser
-
-        text_strip = text.strip()
-        text_lower = text_strip.lower()
-
-        # Skip if too short
-        if len(text_strip) < 2:
-            return True
-
-        # Skip file paths
-        extensions = ('.png', '.jpg', '.jpeg', '.gif', '.webp', '.mp3', '.ogg', 
-                      '.wav', '.ttf', '.otf', '.rpy', '.rpyc', '.json')
-        if any(text_lower.endswith(ext) for ext in extensions):
-            return True
-
-        # Skip paths
-        if text_strip.startswith(('images/', 'audio/', 'gui/', 'fonts/')):
-            return True
-
-        # Skip color codes
-        if re.match(r'^#[0-9a-fA-F]{3,8}$', text_strip):
-            return True
-
-        # Skip pure numbers
-        if re.match(r'^-?\d+\.?\d*$', text_strip):
-            return True
-
-        # Skip snake_case identifiers
-        if re.match(r'^[a-z][a-z0-9]*(_[a-z0-9]+)+$', text_strip):
-            return True
-
-        # Must contain at least one letter
-        if not re.search(r'[a-zA-Z\u00C0-\u024F\u0400-\u04FF]', text):
-            return True
-
-        # Check against the whitelist
-        if context and not any(key in context for key in DATA_KEY_WHITELIST):
-            return True
-
-        return False
+        return is_technical_string(text, context, _DATA_KEY_WHITELIST)
 
     def _extract_string_content(self, quoted_string: str) -> str:
         """Helper to clean quotes and unescape characters.
@@ -1161,297 +1591,308 @@ class ASTTextExtractor:
         content = content.replace('\\n', '\n').replace('\\t', '\t')
         return content
     
+    # ========== AST WALKER ==========
+    # Explicit-stack, depth-first walk. The stack holds one frame per open
+    # block: (iterator over its nodes, context, handler table). Sibling nodes
+    # are consumed straight from the iterator; a handler that opens a child
+    # block pushes a frame and returns True, and the walk continues there.
+    # Handlers are looked up per node class in a table that is filled once
+    # per class, instead of running the whole isinstance chain for every node.
+
     def _walk_nodes(self, nodes: List[Any], context: str = "") -> None:
-        """Recursively walk AST nodes and extract text."""
-        if not isinstance(nodes, (list, tuple)):
-            nodes = [nodes]
-        
-        for node in nodes:
-            self._process_node(node, context)
-    
-    def _process_node(self, node: Any, context: str = "") -> None:
-        """Process a single AST node."""
-        if node is None:
-            return
-        
-        node_type = type(node).__name__
-        
+        """Walk AST nodes depth-first and extract text (no recursion, any nesting depth)."""
+        stack: List[Tuple[Iterator[Any], str, Dict[type, Optional[Callable]]]] = []
+        self._push_block(stack, nodes, context, self._AST_HANDLERS)
+
+        while stack:
+            nodes_iter, context, handlers = stack[-1]
+            for node in nodes_iter:
+                node_class = type(node)
+                try:
+                    handler = handlers[node_class]
+                except KeyError:
+                    handler = self._resolve_handler(handlers, node_class)
+                # Alt blok açan işleyici True döner; önce o blok yürünür
+                if handler is not None and handler(self, node, context, stack):
+                    break
+            else:
+                stack.pop()
+
+    def _push_block(self, stack: list, block: Any, context: str, handlers: Dict[type, Optional[Callable]]) -> bool:
+        """Open a block (or single node) so its first node is processed next."""
+        if type(block) is not list and not isinstance(block, (list, tuple)):
+            block = (block,)
+        # Düğümler açılırken sayılır (döngüde sayaç yok)
+        self.nodes_visited += len(block)
+        stack.append((iter(block), context, handlers))
+        return True
+
+    def _push_node(self, stack: list, node: Any, context: str, handlers: Dict[type, Optional[Callable]]) -> bool:
+        """Open a single node, even if it is a list (screen objects are never iterated)."""
+        return self._push_block(stack, (node,), context, handlers)
+
+    @classmethod
+    def _resolve_handler(cls, handlers: Dict[type, Optional[Callable]], node_class: type) -> Optional[Callable]:
+        """Handler of the first matching class in the table order (same as the old isinstance chain)."""
+        if handlers is cls._AST_HANDLERS:
+            order, handler = cls._AST_HANDLER_ORDER, cls._visit_generic
+        else:
+            order, handler = cls._SCREEN_HANDLER_ORDER, None
+        if node_class is type(None) or issubclass(node_class, _TEXTLESS_NODE_CLASSES):
+            handler = None
+        else:
+            for base, candidate in order:
+                if issubclass(node_class, base):
+                    handler = candidate
+                    break
+        handlers[node_class] = handler
+        return handler
+
+    # ---------- Script statements ----------
+    def _visit_translate_say(self, node: Any, context: str, stack: list) -> Optional[bool]:
         # TranslateSay (combined translate+say in newer Ren'Py)
-        if isinstance(node, FakeTranslateSay):
-            character = getattr(node, 'who', '') or ""
-            what = getattr(node, 'what', '')
-            if what:
-                self._add_text(
-                    what,
-                    getattr(node, 'linenumber', 0),
-                    'dialogue',
-                    character=character,
-                    context=f"translate:{getattr(node, 'identifier', '')}"
-                )
-        
-        # Dialogue (Say statement)
-        elif isinstance(node, FakeSay):
-            character = getattr(node, 'who', '') or ""
-            what = getattr(node, 'what', '')
-            if what:
-                self._add_text(
-                    what,
-                    getattr(node, 'linenumber', 0),
-                    'dialogue',
-                    character=character,
-                    context=context
-                )
-        
-        # Menu choices
-        elif isinstance(node, FakeMenu):
-            for item in getattr(node, 'items', []):
-                if isinstance(item, (list, tuple)) and len(item) >= 1:
-                    label = item[0]
-                    if label and isinstance(label, str):
-                        self._add_text(
-                            label,
-                            getattr(node, 'linenumber', 0),
-                            'menu',
-                            context=context
-                        )
-                    # Process menu item block
-                    if len(item) >= 3 and item[2]:
-                        self._walk_nodes(item[2], f"{context}/menu_item")
-        
-        # Label block
-        elif isinstance(node, FakeLabel):
-            label_name = getattr(node, 'name', '')
-            new_context = f"label:{label_name}"
-            if getattr(node, 'block', None):
-                self._walk_nodes(node.block, new_context)
-        
-        # Init block
-        elif isinstance(node, FakeInit):
-            if getattr(node, 'block', None):
-                self._walk_nodes(node.block, f"{context}/init")
-        
-        # If statement
-        elif isinstance(node, FakeIf):
-            for entry in getattr(node, 'entries', []):
-                if isinstance(entry, (list, tuple)) and len(entry) >= 2:
-                    if entry[1]:
-                        self._walk_nodes(entry[1], context)
-        
+        what = getattr(node, 'what', '')
+        if what:
+            self._add_text(
+                what,
+                getattr(node, 'linenumber', 0),
+                'dialogue',
+                character=getattr(node, 'who', '') or "",
+                context=f"translate:{getattr(node, 'identifier', '')}"
+            )
+
+    def _visit_say(self, node: Any, context: str, stack: list) -> Optional[bool]:
+        what = getattr(node, 'what', '')
+        if what:
+            self._add_text(
+                what,
+                getattr(node, 'linenumber', 0),
+                'dialogue',
+                character=getattr(node, 'who', '') or "",
+                context=context
+            )
+
+    def _visit_menu(self, node: Any, context: str, stack: list) -> Optional[bool]:
+        items = getattr(node, 'items', None)
+        if not items:
+            return None
+        # Üreteç çerçevesi: seçenek metni, sırası geldiğinde kendi bloğundan önce çıkarılır
+        stack.append((self._iter_menu(items, getattr(node, 'linenumber', 0), context), f"{context}/menu_item", self._AST_HANDLERS))
+        return True
+
+    def _iter_menu(self, items: List[Any], line_number: int, context: str) -> Iterator[Any]:
+        for item in items:
+            if isinstance(item, (list, tuple)) and len(item) >= 1:
+                label = item[0]
+                if label and isinstance(label, str):
+                    self._add_text(label, line_number, 'menu', context=context)
+                if len(item) >= 3 and item[2]:
+                    block = item[2] if isinstance(item[2], (list, tuple)) else (item[2],)
+                    self.nodes_visited += len(block)
+                    yield from block
+
+    def _visit_label(self, node: Any, context: str, stack: list) -> Optional[bool]:
+        if getattr(node, 'block', None):
+            return self._push_block(stack, node.block, f"label:{getattr(node, 'name', '')}", self._AST_HANDLERS)
+
+    def _visit_init(self, node: Any, context: str, stack: list) -> Optional[bool]:
+        if getattr(node, 'block', None):
+            return self._push_block(stack, node.block, f"{context}/init", self._AST_HANDLERS)
+
+    def _visit_if(self, node: Any, context: str, stack: list) -> Optional[bool]:
+        blocks = [
+            entry[1] if isinstance(entry[1], (list, tuple)) else (entry[1],)
+            for entry in getattr(node, 'entries', None) or ()
+            if isinstance(entry, (list, tuple)) and len(entry) >= 2 and entry[1]
+        ]
+        if not blocks:
+            return None
+        # Tüm dallar tek çerçevede, kaynak sırasıyla
+        self.nodes_visited += sum(map(len, blocks))
+        stack.append((chain.from_iterable(blocks), context, self._AST_HANDLERS))
+        return True
+
+    def _visit_block(self, node: Any, context: str, stack: list) -> Optional[bool]:
         # While loop
-        elif isinstance(node, FakeWhile):
-            if getattr(node, 'block', None):
-                self._walk_nodes(node.block, context)
-        
-        # Translate block - extract both old and new
-        elif isinstance(node, FakeTranslateString):
-            if getattr(node, 'old', ''):
-                self._add_text(
-                    node.old,
-                    getattr(node, 'linenumber', 0),
-                    'string',
-                    context='translate'
-                )
-        
+        if getattr(node, 'block', None):
+            return self._push_block(stack, node.block, context, self._AST_HANDLERS)
+
+    def _visit_translate_string(self, node: Any, context: str, stack: list) -> Optional[bool]:
+        if getattr(node, 'old', ''):
+            self._add_text(
+                node.old,
+                getattr(node, 'linenumber', 0),
+                'string',
+                context='translate'
+            )
+
+    def _visit_translate(self, node: Any, context: str, stack: list) -> Optional[bool]:
         # Translate (dialogue) block
-        elif isinstance(node, FakeTranslate):
-            block = getattr(node, 'block', None)
-            if block:
-                lang = getattr(node, 'language', None)
-                self._walk_nodes(block, f"translate:{lang or 'None'}")
-        
-        # Screen
-        elif isinstance(node, FakeScreen):
-            screen_obj = getattr(node, 'screen', None)
-            screen_name = getattr(node, 'name', getattr(screen_obj, 'name', 'unknown') if screen_obj else 'unknown')
-            if screen_obj:
-                self._process_screen_node(screen_obj, f"screen:{screen_name}")
-        
-        # Define statement - check for translatable strings
-        elif isinstance(node, FakeDefine):
-            code = getattr(node, 'code', None)
-            if code and hasattr(code, 'source'):
-                self._extract_strings_from_code(code.source, getattr(node, 'linenumber', 0))
-        
-        # Python block - look for strings
-        elif isinstance(node, FakePython):
-            code = getattr(node, 'code', None)
-            if code and hasattr(code, 'source'):
-                self._extract_strings_from_code(code.source, getattr(node, 'linenumber', 0))
-        
-        # User statement - may contain text
-        elif isinstance(node, FakeUserStatement):
-            line = getattr(node, 'line', '')
-            if line:
-                self._extract_strings_from_line(line, getattr(node, 'linenumber', 0))
-        
+        block = getattr(node, 'block', None)
+        if block:
+            lang = getattr(node, 'language', None)
+            return self._push_block(stack, block, f"translate:{lang or 'None'}", self._AST_HANDLERS)
+
+    def _visit_screen(self, node: Any, context: str, stack: list) -> Optional[bool]:
+        screen_obj = getattr(node, 'screen', None)
+        screen_name = getattr(node, 'name', getattr(screen_obj, 'name', 'unknown') if screen_obj else 'unknown')
+        if screen_obj:
+            return self._push_node(stack, screen_obj, f"screen:{screen_name}", self._SCREEN_HANDLERS)
+
+    def _visit_code(self, node: Any, context: str, stack: list) -> Optional[bool]:
+        # Define statement / Python block - look for strings
+        code = getattr(node, 'code', None)
+        if code and hasattr(code, 'source'):
+            self._extract_strings_from_code(code.source, getattr(node, 'linenumber', 0))
+
+    def _visit_user_statement(self, node: Any, context: str, stack: list) -> Optional[bool]:
+        line = getattr(node, 'line', '')
+        if line:
+            self._extract_strings_from_line(line, getattr(node, 'linenumber', 0))
+
+    def _visit_generic(self, node: Any, context: str, stack: list) -> Optional[bool]:
         # Generic block handling
-        elif hasattr(node, 'block') and node.block:
-            self._walk_nodes(node.block, context)
-    
-    def _process_screen_node(self, node: Any, context: str = "") -> None:
-        """Process Screen Language nodes."""
-        if node is None:
-            return
-        
-        # SL2 Screen
-        if isinstance(node, FakeSLScreen):
-            # Process children
-            for child in getattr(node, 'children', []):
-                self._process_screen_node(child, context)
-        
-        # SL2 Displayable (text, textbutton, etc.)
-        elif isinstance(node, FakeSLDisplayable):
-            # Check positional arguments for text
-            for pos in getattr(node, 'positional', []):
-                if isinstance(pos, str) and pos.strip():
-                    # Remove quotes if present
-                    text = pos.strip()
-                    if (text.startswith('"') and text.endswith('"')) or \
-                       (text.startswith("'") and text.endswith("'")):
-                        text = text[1:-1]
-                    
-                    if text and not self._is_technical_string(text):
-                        self._add_text(
-                            text,
-                            getattr(node, 'location', (0, 0))[1] if hasattr(node, 'location') else 0,
-                            'ui',
-                            context=context
-                        )
-            
-            # Check keyword arguments for text-related properties
-            for kw in getattr(node, 'keyword', []):
-                if isinstance(kw, (list, tuple)) and len(kw) >= 2:
-                    key, value = kw[0], kw[1]
-                    if key in ('text', 'alt', 'tooltip', 'caption', 'title') and value:
-                        if isinstance(value, str):
-                            self._extract_strings_from_line(value, 0)
-                        elif isinstance(value, FakePyExpr):
-                            self._extract_strings_from_code(str(value), 0)
-            
-            # Process children
-            for child in getattr(node, 'children', []):
-                self._process_screen_node(child, context)
-        
+        if hasattr(node, 'block') and node.block:
+            return self._push_block(stack, node.block, context, self._AST_HANDLERS)
+
+    # ---------- Screen language ----------
+    def _visit_sl_children(self, node: Any, context: str, stack: list) -> Optional[bool]:
+        # SLScreen / SLFor / SLBlock
+        children = getattr(node, 'children', None)
+        if children:
+            if type(children) is list:
+                # Sık yol: çağrı yükü olmadan çerçeve aç
+                self.nodes_visited += len(children)
+                stack.append((iter(children), context, self._SCREEN_HANDLERS))
+                return True
+            return self._push_block(stack, children, context, self._SCREEN_HANDLERS)
+
+    def _visit_sl_displayable(self, node: Any, context: str, stack: list) -> Optional[bool]:
+        # Check positional arguments for text
+        for pos in getattr(node, 'positional', []):
+            if isinstance(pos, str) and pos.strip():
+                # Remove quotes if present
+                text = pos.strip()
+                if (text.startswith('"') and text.endswith('"')) or \
+                   (text.startswith("'") and text.endswith("'")):
+                    text = text[1:-1]
+
+                if text and not self._is_technical_string(text):
+                    self._add_text(
+                        text,
+                        getattr(node, 'location', (0, 0))[1] if hasattr(node, 'location') else 0,
+                        'ui',
+                        context=context
+                    )
+
+        # Check keyword arguments for text-related properties
+        for kw in getattr(node, 'keyword', []):
+            if isinstance(kw, (list, tuple)) and len(kw) >= 2:
+                key, value = kw[0], kw[1]
+                if key in ('text', 'alt', 'tooltip', 'caption', 'title') and value:
+                    if isinstance(value, str):
+                        self._extract_strings_from_line(value, 0)
+                    elif isinstance(value, FakePyExpr):
+                        self._extract_strings_from_code(str(value), 0)
+
+        children = getattr(node, 'children', None)
+        if children:
+            return self._push_block(stack, children, context, self._SCREEN_HANDLERS)
+
+    def _visit_sl_if(self, node: Any, context: str, stack: list) -> Optional[bool]:
         # SL2 If/ShowIf
-        elif isinstance(node, FakeSLIf):
-            for entry in getattr(node, 'entries', []):
-                if isinstance(entry, (list, tuple)) and len(entry) >= 2:
-                    self._process_screen_node(entry[1], context)
-        
-        # SL2 For
-        elif isinstance(node, FakeSLFor):
-            for child in getattr(node, 'children', []):
-                self._process_screen_node(child, context)
-        
-        # SL2 Block
-        elif isinstance(node, FakeSLBlock):
-            for child in getattr(node, 'children', []):
-                self._process_screen_node(child, context)
-        
-        # SL2 Use
-        elif isinstance(node, FakeSLUse):
-            block = getattr(node, 'block', None)
-            if block:
-                self._process_screen_node(block, context)
-    
+        blocks = [
+            entry[1] for entry in getattr(node, 'entries', [])
+            if isinstance(entry, (list, tuple)) and len(entry) >= 2
+        ]
+        if blocks:
+            return self._push_block(stack, blocks, context, self._SCREEN_HANDLERS)
+
+    def _visit_sl_use(self, node: Any, context: str, stack: list) -> Optional[bool]:
+        block = getattr(node, 'block', None)
+        if block:
+            return self._push_node(stack, block, context, self._SCREEN_HANDLERS)
+
+    # Sıra önemli: ilk eşleşen sınıf kazanır (FakeTranslateSay, FakeSay'den önce)
+    _AST_HANDLER_ORDER = (
+        (FakeTranslateSay, _visit_translate_say),
+        (FakeSay, _visit_say),
+        (FakeMenu, _visit_menu),
+        (FakeLabel, _visit_label),
+        (FakeInit, _visit_init),
+        (FakeIf, _visit_if),
+        (FakeWhile, _visit_block),
+        (FakeTranslateString, _visit_translate_string),
+        (FakeTranslate, _visit_translate),
+        (FakeScreen, _visit_screen),
+        (FakeDefine, _visit_code),
+        (FakePython, _visit_code),
+        (FakeUserStatement, _visit_user_statement),
+    )
+    _SCREEN_HANDLER_ORDER = (
+        (FakeSLScreen, _visit_sl_children),
+        (FakeSLDisplayable, _visit_sl_displayable),
+        (FakeSLIf, _visit_sl_if),
+        (FakeSLFor, _visit_sl_children),
+        (FakeSLBlock, _visit_sl_children),
+        (FakeSLUse, _visit_sl_use),
+    )
+    # node class -> handler (None: nothing to extract); filled by _resolve_handler
+    _AST_HANDLERS: Dict[type, Optional[Callable]] = {}
+    _SCREEN_HANDLERS: Dict[type, Optional[Callable]] = {}
+
+    # ========== PYTHON CODE STRINGS ==========
+    # The same init python blocks recur across files and SDK copies, so the
+    # strings of a code block are computed once per process (keyed by a
+    # digest of the code text) and replayed with the caller's line number.
+
     def _extract_strings_from_code(self, code: str, line_number: int) -> None:
         """Extract string literals from Python code with enhanced pattern matching."""
-        import re
-        p = self.parser
+        for text, text_type, context, placeholder_map in self._code_strings(code):
+            self._add_text(text, line_number, text_type, context=context, placeholder_map=placeholder_map)
+
+    def _code_strings(self, code: str) -> Tuple[CodeString, ...]:
+        """Strings of a code block, memoized per code text."""
+        if self.DATA_KEY_WHITELIST is not DATA_KEY_WHITELIST:
+            # Özelleştirilmiş beyaz liste: paylaşılan önbellek sonuçları geçersiz
+            return self._collect_code_strings(code)
+        key = hashlib.sha1(code.encode('utf-8', 'surrogatepass')).digest()
+        with _CODE_STRINGS_LOCK:
+            strings = _CODE_STRINGS_MEMO.get(key)
+            if strings is not None:
+                _CODE_STRINGS_MEMO.move_to_end(key)
+                return strings
+        strings = self._collect_code_strings(code)
+        with _CODE_STRINGS_LOCK:
+            _CODE_STRINGS_MEMO[key] = strings
+            if len(_CODE_STRINGS_MEMO) > CODE_STRINGS_MEMO_SIZE:
+                _CODE_STRINGS_MEMO.popitem(last=False)
+        return strings
+
+    def _collect_code_strings(self, code: str) -> Tuple[CodeString, ...]:
+        found: List[CodeString] = []
         # Try AST-based parsing first — this is more robust for Python code
         try:
-            if self._extract_strings_from_code_ast(code, line_number):
-                return
+            if self._collect_code_strings_ast(code, found):
+                return tuple(found)
         except Exception:
             pass
-        
-        # Match _("text") pattern - standard translation function
-        translatable_pattern = r'_\s*\(\s*["\'](.+?)["\']\s*\)'
-        for match in re.finditer(translatable_pattern, code):
-            text = match.group(1)
-            processed_text, placeholder_map = p.preserve_placeholders(text)
-            self._add_text(processed_text, line_number, 'string', context='python/_', placeholder_map=placeholder_map)
-        
-        # Match __("text") pattern - double underscore translation
-        double_under_pattern = r'__\s*\(\s*["\'](.+?)["\']\s*\)'
-        for match in re.finditer(double_under_pattern, code):
-            text = match.group(1)
-            processed_text, placeholder_map = p.preserve_placeholders(text)
-            self._add_text(processed_text, line_number, 'string', context='python/__', placeholder_map=placeholder_map)
-        
-        # Match renpy.notify("text") pattern
-        notify_pattern = r'renpy\.notify\s*\(\s*["\'](.+?)["\']\s*\)'
-        for match in re.finditer(notify_pattern, code):
-            text = match.group(1)
-            processed_text, placeholder_map = p.preserve_placeholders(text)
-            self._add_text(processed_text, line_number, 'ui', context='notify', placeholder_map=placeholder_map)
-        
-        # Match Character("Name", ...) pattern
-        char_pattern = r'Character\s*\(\s*["\'](.+?)["\']\s*[\),]'
-        for match in re.finditer(char_pattern, code):
-            text = match.group(1)
-            processed_text, placeholder_map = p.preserve_placeholders(text)
-            self._add_text(processed_text, line_number, 'string', context='character_define', placeholder_map=placeholder_map)
-        
-        # Match DynamicCharacter("Name", ...) pattern
-        dyn_char_pattern = r'DynamicCharacter\s*\(\s*["\'](.+?)["\']\s*[\),]'
-        for match in re.finditer(dyn_char_pattern, code):
-            text = match.group(1)
-            processed_text, placeholder_map = p.preserve_placeholders(text)
-            self._add_text(processed_text, line_number, 'string', context='character_define', placeholder_map=placeholder_map)
-        
-        # Match renpy.say(who, "text") pattern
-        say_pattern = r'renpy\.say\s*\([^,]*,\s*["\'](.+?)["\']\s*[\),]'
-        for match in re.finditer(say_pattern, code):
-            text = match.group(1)
-            processed_text, placeholder_map = p.preserve_placeholders(text)
-            self._add_text(processed_text, line_number, 'dialogue', context='python/say', placeholder_map=placeholder_map)
-        
-        # Match Text("content") pattern (displayable)
-        text_display_pattern = r'Text\s*\(\s*["\'](.+?)["\']\s*[\),]'
-        for match in re.finditer(text_display_pattern, code):
-            text = match.group(1)
-            processed_text, placeholder_map = p.preserve_placeholders(text)
-            self._add_text(processed_text, line_number, 'ui', context='displayable', placeholder_map=placeholder_map)
-        
-        # Match config.name = "Game Name" pattern
-        config_name_pattern = r'config\.(name|version)\s*=\s*["\'](.+?)["\']'
-        for match in re.finditer(config_name_pattern, code):
-            text = match.group(2)
-            processed_text, placeholder_map = p.preserve_placeholders(text)
-            self._add_text(processed_text, line_number, 'string', context='config', placeholder_map=placeholder_map)
-        
-        # Match gui.text_* = "..." patterns
-        gui_text_pattern = r'gui\.\w*text\w*\s*=\s*["\'](.+?)["\']'
-        for match in re.finditer(gui_text_pattern, code):
-            text = match.group(1)
-            processed_text, placeholder_map = p.preserve_placeholders(text)
-            self._add_text(processed_text, line_number, 'ui', context='gui', placeholder_map=placeholder_map)
-        
-        # Match gui.* patterns for text extraction
-        gui_variable_pattern = r'gui\.\w*\s*=\s*["\'](.+?)["\']'
-        for match in re.finditer(gui_variable_pattern, code):
-            text = match.group(1)
-            processed_text, placeholder_map = p.preserve_placeholders(text)
-            self._add_text(processed_text, line_number, 'ui', context='gui', placeholder_map=placeholder_map)
-        
-        # Match renpy.show("image") pattern
-        show_pattern = r'renpy\.show\s*\(\s*["\'](.+?)["\']\s*\)'
-        for match in re.finditer(show_pattern, code):
-            text = match.group(1)
-            processed_text, placeholder_map = p.preserve_placeholders(text)
-            self._add_text(processed_text, line_number, 'ui', context='show', placeholder_map=placeholder_map)
-        
+        self._collect_code_calls(code, found)
+        self._collect_code_literals(code, found)
+        return tuple(found)
+
+    def _collect_code_calls(self, code: str, found: List[CodeString]) -> None:
+        """Regex fallback for translatable calls and assignments (``_CODE_CALL_PATTERNS``)."""
+        protect = self.parser.preserve_placeholders
+        for pattern, text_type, context in _CODE_CALL_PATTERNS:
+            for match in pattern.finditer(code):
+                processed_text, placeholder_map = protect(match.group(1))
+                found.append((processed_text, text_type, context, placeholder_map))
+
+    def _collect_code_literals(self, code: str, found: List[CodeString]) -> None:
         # --- UPDATED: Generic "Smart Key" Scanner ---
-        # Use robust regex that handles escaped quotes
-        # Support optional prefixes like f, r, b, u, fr, rf etc.
-        generic_string_re = re.compile(r'''(?P<quote>(?:[rRuUbBfF]{,2})?(?:"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*'))''')
-
-        # Regex for context: var = [  OR  var = {  OR  "key":  OR var = "string" (assignment)
-        list_context_re = re.compile(r'(?P<var>[a-zA-Z_]\w*)\s*(?:=\s*[\[\(\{]|\+=\s*[\[\(]|\.(?:append|extend|insert)\s*\()|["\'](?P<key>\w+)["\']\s*[:=]')
-        assignment_context_re = re.compile(r'(?P<var>[a-zA-Z_]\w*)\s*=\s*')
-
-        for match in generic_string_re.finditer(code):
+        p = self.parser
+        for match in _PY_STRING_LITERAL_RE.finditer(code):
             raw_text = match.group('quote')
             text = self._extract_string_content(raw_text)
 
@@ -1462,38 +1903,37 @@ class ASTTextExtractor:
 
             # Look backwards for context (multiple lines/1000 chars)
             start_pos = match.start()
-            lookback_len = 1000
-            lookback = code[max(0, start_pos-lookback_len):start_pos]
+            lookback = code[max(0, start_pos - _CODE_CONTEXT_LOOKBACK):start_pos]
 
             found_key = None
-            key_match = list(list_context_re.finditer(lookback))
-            if key_match:
-                last = key_match[-1]
-                found_key = last.groupdict().get('var') or last.groupdict().get('key')
-
-            is_whitelisted = found_key and found_key.lower() in self.DATA_KEY_WHITELIST
+            last = None
+            for last in _CODE_LIST_CONTEXT_RE.finditer(lookback):
+                pass
+            if last is not None:
+                found_key = last.group('var') or last.group('key')
 
-            if found_key:
-                if is_whitelisted:
-                    processed_text, placeholder_map = p.preserve_placeholders(text)
-                    self._add_text(processed_text, line_number, 'data_string', context=f"rpyc_val:{found_key}", placeholder_map=placeholder_map)
-                else:
-                    # Not whitelisted, but was assigned to a var - add cautiously as generic string
-                    # Use empty context to avoid whitelist-based rejection; context holds var name in metadata
-                    processed_text, placeholder_map = p.preserve_placeholders(text)
-                    self._add_text(processed_text, line_number, 'string', context='', placeholder_map=placeholder_map)
+            processed_text, placeholder_map = p.preserve_placeholders(text)
+            if found_key and found_key.lower() in self.DATA_KEY_WHITELIST:
+                found.append((processed_text, 'data_string', f"rpyc_val:{found_key}", placeholder_map))
             else:
-                # No variable found - treat as a generic string in code (non-whitelisted context)
+                # Not whitelisted (or no variable found) - add cautiously as generic string.
                 # Use empty context so technical string heuristics only filter out technical values
-                processed_text, placeholder_map = p.preserve_placeholders(text)
-                self._add_text(processed_text, line_number, 'string', context='', placeholder_map=placeholder_map)
-    
-    def _extract_strings_from_code_ast(self, code: str, line_number: int) -> None:
+                found.append((processed_text, 'string', '', placeholder_map))
+
+    def _extract_strings_from_code_ast(self, code: str, line_number: int) -> bool:
         """AST-based extraction for Python code blocks, focusing on string constants, f-strings, lists and dicts."""
+        found: List[CodeString] = []
+        try:
+            return self._collect_code_strings_ast(code, found)
+        finally:
+            for text, text_type, context, placeholder_map in found:
+                self._add_text(text, line_number, text_type, context=context, placeholder_map=placeholder_map)
+
+    def _collect_code_strings_ast(self, code: str, found: List[CodeString]) -> bool:
         import textwrap
         clean_code = code
         # Strip leading Ren'Py python block header: init python: or python:
-        header_re = re.compile(r'^(?:\s*init\s+python\s*:|\s*python\s*:)', flags=re.I)
+        header_re = _PYTHON_BLOCK_HEADER_RE
         if header_re.match(code.strip().splitlines()[0]) if code.strip() else False:
             # Remove the first header line and dedent the rest
             lines = code.splitlines()
@@ -1518,140 +1958,9 @@ class ASTTextExtractor:
             processed_text, placeholder_map = p.preserve_placeholders(raw_text)
             if self._is_technical_string(raw_text, context=ctx):
                 return
-            self._add_text(processed_text, line_number, text_type, context=ctx or '', character='', placeholder_map=placeholder_map)
-
-        class Visitor(ast.NodeVisitor):
-            def __init__(self):
-                super().__init__()
-                self.current_assign_ctx = ''
-            def visit_Constant(self, node):
-                if isinstance(node.value, str):
-                    add_text_val(node.value)
-                self.generic_visit(node)
-
-            def visit_JoinedStr(self, node):
-                parts = []
-                for v in node.values:
-                    if isinstance(v, ast.Constant) and isinstance(v.value, str):
-                        parts.append(v.value)
-                    elif isinstance(v, ast.FormattedValue):
-                        # Try to extract the source segment text for the expression when possible
-                        try:
-                            expr_src = ast.get_source_segment(code, v) or 'expr'
-                        except Exception:
-                            expr_src = 'expr'
-                        parts.append('{' + expr_src + '}')
-                add_text_val(''.join(parts))
-                self.generic_visit(node)
-
-            def visit_Call(self, node):
-                # Detect join calls like ", ".join(['a','b']) where value is a constant string
-                try:
-                    func = node.func
-                    # joined string: Attribute(value=Constant(', '), attr='join')
-                    if isinstance(func, ast.Attribute) and func.attr == 'join':
-                        val = func.value
-                        if isinstance(val, ast.Constant) and isinstance(val.value, str):
-                            add_text_val(val.value)
-                    # format call: "{}".format(...)
-                    if isinstance(func, ast.Attribute) and func.attr == 'format':
-                        val = func.value
-                        if isinstance(val, ast.Constant) and isinstance(val.value, str):
-                            add_text_val(val.value)
-                    # _p() call or renpy.notify call (not exhaustive)
-                    if isinstance(func, ast.Name) and func.id in {'_p', 'renpy', 'notify'}:
-                        # get constants in args
-                        for a in node.args:
-                            if isinstance(a, ast.Constant) and isinstance(a.value, str):
-                                add_text_val(a.value)
-                            elif isinstance(a, ast.List):
-                                for el in a.elts:
-                                    if isinstance(el, ast.Constant) and isinstance(el.value, str):
-                                        add_text_val(el.value)
-                except Exception:
-                    pass
-                self.generic_visit(node)
-
-            def visit_List(self, node):
-                for elt in node.elts:
-                    if isinstance(elt, ast.Constant) and isinstance(elt.value, str):
-                        add_text_val(elt.value, ctx=self.current_assign_ctx, text_type='data_string' if self.current_assign_ctx else 'python_string')
-                    elif isinstance(elt, ast.JoinedStr):
-                        # If part of an assignment context, we should consider it data_string
-                        parts = []
-                        for v in elt.values:
-                            if isinstance(v, ast.Constant) and isinstance(v.value, str):
-                                parts.append(v.value)
-                            elif isinstance(v, ast.FormattedValue):
-                                try:
-                                    expr_src = ast.get_source_segment(code, v) or 'expr'
-                                except Exception:
-                                    expr_src = 'expr'
-                                parts.append('{' + expr_src + '}')
-                        add_text_val(''.join(parts), ctx=self.current_assign_ctx, text_type='data_string' if self.current_assign_ctx else 'python_string')
-                self.generic_visit(node)
-
-            def visit_Dict(self, node):
-                for v in node.values:
-                    if isinstance(v, ast.Constant) and isinstance(v.value, str):
-                        add_text_val(v.value, ctx=self.current_assign_ctx, text_type='data_string' if self.current_assign_ctx else 'python_string')
-                    elif isinstance(v, ast.JoinedStr):
-                        self.visit_JoinedStr(v)
-                self.generic_visit(node)
-
-            def visit_Assign(self, node):
-                # capture variable context by name if possible
-                try:
-                    if isinstance(node.targets[0], ast.Name):
-                        varname = node.targets[0].id
-                except Exception:
-                    varname = None
-                val = node.value
-                ctx = ''
-                if varname and varname.lower() in DATA_KEY_WHITELIST:
-                    ctx = f'rpyc_val:{varname}'
-                if isinstance(val, ast.Constant) and isinstance(val.value, str):
-                    add_text_val(val.value, ctx=ctx, text_type='data_string' if ctx else 'python_string')
-                elif isinstance(val, ast.JoinedStr):
-                    # pass context for formats
-                    parts = []
-                    for v in val.values:
-                        if isinstance(v, ast.Constant) and isinstance(v.value, str):
-                            parts.append(v.value)
-                        elif isinstance(v, ast.FormattedValue):
-                            try:
-                                expr_src = ast.get_source_segment(code, v) or 'expr'
-                            except Exception:
-                                expr_src = 'expr'
-                            parts.append('{' + expr_src + '}')
-                    add_text_val(''.join(parts), ctx=ctx, text_type='data_string' if ctx else 'python_string')
-                else:
-                    # Set a context to allow nested lists/dicts to be processed with variable context
-                    prev_ctx = self.current_assign_ctx
-                    self.current_assign_ctx = ctx
-                    self.generic_visit(node)
-                    self.current_assign_ctx = prev_ctx
-
-            def visit_BinOp(self, node):
-                # Extract strings from concatenations and % formatting
-                try:
-                    if isinstance(node.op, ast.Add):
-                        left = node.left
-                        right = node.right
-                        if isinstance(left, ast.Constant) and isinstance(left.value, str):
-                            add_text_val(left.value)
-                        if isinstance(right, ast.Constant) and isinstance(right.value, str):
-                            add_text_val(right.value)
-                    if isinstance(node.op, ast.Mod):
-                        # % formatting: left is constant string
-                        left = node.left
-                        if isinstance(left, ast.Constant) and isinstance(left.value, str):
-                            add_text_val(left.value)
-                except Exception:
-                    pass
-                self.generic_visit(node)
+            found.append((processed_text, text_type, ctx or '', placeholder_map))
 
-        Visitor().visit(tree)
+        _CodeStringVisitor(code, add_text_val).visit(tree)
         return True
 
     def _extract_strings_from_line(self, line: str, line_number: int) -> None:
@@ -1696,37 +2005,301 @@ class ASTTextExtractor:
 
 
 def extract_texts_from_rpyc(
-    file_path: Union[str, Path]
+    file_path: Union[str, Path],
+    cache: Optional[ExtractionCache] = None,
 ) -> List[Dict[str, Any]]:
     """
     Extract translatable texts from a .rpyc file.
     
     Args:
         file_path: Path to .rpyc file
+        cache: Persistent extraction cache; unchanged files are not unpickled again
         
     Returns:
         List of dicts with text, line_number, text_type, etc.
     """
+    if cache is not None:
+        return [_record_entry(record) for record in _rpyc_records(file_path, cache)]
+    return _extract_texts_from_rpyc_uncached(file_path)
+
+
+def _rpyc_records(file_path: Union[str, Path], cache: ExtractionCache) -> List[RpycRecord]:
+    """
+    Records of one file through both cache levels.
+
+    The project store answers for files whose size/mtime (or SHA-1) is
+    unchanged; otherwise the shared content store is asked for the same
+    compressed AST seen in any other project, and only then is the file
+    unpickled.
+    """
+    from .extraction_cache import settings_fingerprint
+    # AST extraction does not depend on the type filters
+    fingerprint = settings_fingerprint(None)
+    cached = cache.lookup(file_path, 'rpyc', fingerprint)
+    if cached is not None:
+        return [_entry_record(entry) for entry in cached]
+
+    digest = rpyc_content_digest(file_path)
+    records = None
+    if digest is not None:
+        rows = cache.lookup_content('rpyc', digest, fingerprint)
+        if rows is not None:
+            source_file = str(file_path)
+            records = [
+                (text, line_number, text_type, character, tuple(context_path), source_file)
+                for text, line_number, text_type, character, context_path in rows
+            ]
+    if records is None:
+        records = _extract_rpyc_records(file_path)
+        # Okunamayan dosyalar da boş sonuç verir; paylaşılan depoya yalnızca gerçek sonuçlar girer
+        if digest is not None and records:
+            cache.store_content('rpyc', digest, fingerprint, [record[:5] for record in records])
+    cache.store(file_path, 'rpyc', fingerprint, [_record_dict(record) for record in records])
+    return records
+
+
+def rpyc_content_digest(file_path: Union[str, Path]) -> Optional[str]:
+    """
+    SHA-1 of the compressed AST (data slot 1; the whole file for RPYC v1).
+
+    The source digest Ren'Py appends and the header are left out, so the
+    same script compiled into two games hashes the same. Returns None for
+    unreadable files.
+    """
+    try:
+        with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            with memoryview(mapped) as view:
+                header = read_rpyc_header(view)
+                if header.version == 1:
+                    return hashlib.sha1(view).hexdigest()
+                if 1 not in header.slots:
+                    return None
+                start, length = header.slots[1]
+                with view[start:start + length] as data:
+                    return hashlib.sha1(data).hexdigest()
+    except (OSError, ValueError):
+        return None
+
+
+def _extract_texts_from_rpyc_uncached(file_path: Union[str, Path]) -> List[Dict[str, Any]]:
+    return [_record_entry(record) for record in _extract_rpyc_records(file_path)]
+
+
+def _extract_rpyc_records(file_path: Union[str, Path]) -> List[RpycRecord]:
     extractor = ASTTextExtractor()
     results = extractor.extract_from_file(file_path)
-    
-    return [
-        {
-            'text': r.text,
-            'line_number': r.line_number,
-            'text_type': r.text_type,
-            'character': r.character,
-            'context_path': [r.context] if r.context else [],
-            'source_file': r.source_file,
-            'is_rpyc': True,
+
+    return [result.as_record() for result in results]
+
+
+# ============================================================================
+# PARALLEL DIRECTORY EXTRACTION
+# ============================================================================
+# Unpickling and walking the AST is CPU bound, so big projects spread their
+# .rpyc files over a process pool. Files are grouped into tasks of similar
+# compressed size, and workers send back plain tuples instead of pickled
+# entry dicts (a fraction of the IPC payload). Each file keeps its own error
+# slot, so one broken file only empties its own result.
+
+# Below this many compressed bytes a pool costs more than it saves
+RPYC_PARALLEL_MIN_BYTES = 2 * 1024 * 1024
+# Upper bound of compressed bytes per pool task
+RPYC_CHUNK_MAX_BYTES = 8 * 1024 * 1024
+
+_WORKER_CACHE: Optional[ExtractionCache] = None
+# ExtractionCache counters reported back from the workers
+_CACHE_COUNTERS = ('hits', 'misses', 'shared_hits')
+
+
+def _entry_record(entry: Dict[str, Any]) -> RpycRecord:
+    return (
+        entry.get('text', ''),
+        entry.get('line_number', 0),
+        entry.get('text_type', ''),
+        entry.get('character', ''),
+        tuple(entry.get('context_path', ()) or ()),
+        entry.get('source_file', ''),
+    )
+
+
+def _record_entry(record: RpycRecord) -> TextEntry:
+    """Build the entry for one record (same normalization as ``TextEntry(...)``, without the kwargs loop)."""
+    text, line_number, text_type, character, context_path, source_file = record
+    entry = TextEntry.__new__(TextEntry)
+    entry._extra = None
+    entry.text = text
+    entry.line_number = line_number
+    entry.text_type = sys.intern(text_type) if type(text_type) is str else text_type
+    entry.character = sys.intern(character) if type(character) is str else character
+    entry.context_path = intern_context_path(context_path)
+    entry.source_file = sys.intern(source_file) if type(source_file) is str else source_file
+    entry.is_rpyc = True
+    return entry
+
+
+def _record_dict(record: RpycRecord) -> Dict[str, Any]:
+    """Plain-dict form of a record, as ``dict(_record_entry(record))`` (key order included) but cheaper."""
+    text, line_number, text_type, character, context_path, source_file = record
+    return {
+        'text': text,
+        'line_number': line_number,
+        'character': character,
+        'text_type': text_type,
+        'context_path': context_path,
+        'source_file': source_file,
+        'is_rpyc': True,
+    }
+
+
+def _init_rpyc_worker(cache_dir: Optional[str] = None) -> None:
+    """Open the extraction cache once per worker process (connections are not picklable)."""
+    global _WORKER_CACHE
+    if cache_dir:
+        from .extraction_cache import ExtractionCache
+        _WORKER_CACHE = ExtractionCache(cache_dir)
+
+
+def _extract_rpyc_chunk_worker(
+    paths: List[str],
+) -> Tuple[List[Tuple[str, Optional[str], Tuple[RpycRecord, ...]]], Dict[str, int]]:
+    """Extract one task; returns ``[(path, error, records)]`` and the cache counter deltas by name."""
+    cache = _WORKER_CACHE
+    before = {name: getattr(cache, name) for name in _CACHE_COUNTERS} if cache is not None else {}
+    results = []
+    for path in paths:
+        try:
+            records = _rpyc_records(path, cache) if cache is not None else _extract_rpyc_records(path)
+            results.append((path, None, tuple(records)))
+        except Exception as exc:
+            results.append((path, f"{type(exc).__name__}: {exc}", ()))
+    if cache is None:
+        return results, {}
+    return results, {name: getattr(cache, name) - before[name] for name in _CACHE_COUNTERS}
+
+
+def _file_size(path: Path) -> int:
+    try:
+        return path.stat().st_size
+    except OSError:
+        return 0
+
+
+def plan_rpyc_chunks(files: List[Path], workers: int) -> List[List[Path]]:
+    """
+    Group files into pool tasks of roughly equal compressed size.
+
+    Largest files come first (LPT), so a single huge script starts early
+    instead of becoming the tail of the run; small files are batched until a
+    task reaches about 1/4 of a worker's share. Returns no tasks when the
+    files are too few or too small for a pool to pay off.
+    """
+    if workers <= 1 or len(files) <= 1:
+        return []
+    sizes = {path: _file_size(path) for path in files}
+    total = sum(sizes.values())
+    if total < RPYC_PARALLEL_MIN_BYTES:
+        return []
+
+    target = max(1, min(RPYC_CHUNK_MAX_BYTES, total // (workers * 4)))
+    chunks: List[List[Path]] = []
+    current: List[Path] = []
+    current_bytes = 0
+    for path in sorted(files, key=sizes.__getitem__, reverse=True):
+        current.append(path)
+        current_bytes += sizes[path]
+        if current_bytes >= target:
+            chunks.append(current)
+            current, current_bytes = [], 0
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def iter_rpyc_results(
+    files: List[Path],
+    cache: Optional[ExtractionCache] = None,
+    workers: int = 1,
+    extract: Optional[Callable[[Path], List[Dict[str, Any]]]] = None,
+) -> Iterator[Tuple[Path, List[Dict[str, Any]]]]:
+    """
+    Yield ``(path, entries)`` for every file, in the order given.
+
+    With ``workers`` > 1 and enough data (see ``plan_rpyc_chunks``) the files
+    are extracted in a process pool; otherwise ``extract`` (default:
+    ``extract_texts_from_rpyc`` with ``cache``) runs file by file. A file
+    that fails to extract yields an empty list.
+    """
+    chunks = plan_rpyc_chunks(files, workers)
+    done: Dict[Path, List[Dict[str, Any]]] = {}
+    position = 0
+
+    if chunks:
+        try:
+            for path, entries in _run_rpyc_pool(chunks, min(workers, len(chunks)), cache):
+                done[path] = entries
+                # Sıra korunur: önceki dosyalar bitene kadar sonuçlar bekletilir
+                while position < len(files) and files[position] in done:
+                    yield files[position], done.pop(files[position])
+                    position += 1
+        except (BrokenProcessPool, OSError, RuntimeError, TypeError, AttributeError) as exc:
+            # Pool could not start or died (frozen build, killed worker, ...)
+            logger.warning("RPYC process pool unavailable, continuing sequentially: %s", exc)
+
+    for path in files[position:]:
+        if path in done:
+            yield path, done.pop(path)
+            continue
+        try:
+            entries = extract(path) if extract is not None else extract_texts_from_rpyc(path, cache=cache)
+        except Exception as exc:
+            logger.exception(f"Error extracting from {path}: {exc}")
+            entries = []
+        yield path, entries
+
+
+def _run_rpyc_pool(
+    chunks: List[List[Path]],
+    workers: int,
+    cache: Optional[ExtractionCache],
+) -> Iterator[Tuple[Path, List[Dict[str, Any]]]]:
+    cache_dir = str(cache.cache_dir) if cache is not None else None
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_rpyc_worker,
+        initargs=(cache_dir,),
+    ) as executor:
+        futures = {
+            executor.submit(_extract_rpyc_chunk_worker, [str(path) for path in chunk]): chunk
+            for chunk in chunks
         }
-        for r in results
-    ]
+        for future in as_completed(futures):
+            chunk = futures[future]
+            try:
+                results, counts = future.result()
+            except BrokenProcessPool:
+                raise
+            except Exception as exc:
+                logger.error("RPYC task of %d files failed: %s", len(chunk), exc)
+                for path in chunk:
+                    yield path, []
+                continue
+            if cache is not None:
+                # İşçilerdeki önbellek istatistikleri ana süreçte raporlanır
+                for name, value in counts.items():
+                    setattr(cache, name, getattr(cache, name) + value)
+            for path, (_, error, records) in zip(chunk, results):
+                if error is not None:
+                    logger.error(f"Error extracting from {path}: {error}")
+                yield path, [_record_entry(record) for record in records]
 
 
 def extract_texts_from_rpyc_directory(
     directory: Union[str, Path],
-    recursive: bool = True
+    recursive: bool = True,
+    file_index: Optional[ProjectFileIndex] = None,
+    cache: Optional[ExtractionCache] = None,
+    skip: Collection[Path] = (),
+    workers: int = 1,
 ) -> Dict[Path, List[Dict[str, Any]]]:
     """
     Extract translatable texts from all .rpyc files in a directory.
@@ -1734,6 +2307,10 @@ def extract_texts_from_rpyc_directory(
     Args:
         directory: Directory path (should be the game folder directly)
         recursive: Search subdirectories
+        file_index: Listing of the same directory to reuse instead of walking it again
+        cache: Persistent extraction cache shared by every file of the scan
+        skip: Files not to read, e.g. ``ScriptSourcePlan.skipped`` (.rpy parsed instead)
+        workers: Process pool size for large directories (1 = sequential)
 
     Returns:
         Dict mapping file paths to extracted texts
@@ -1741,47 +2318,23 @@ def extract_texts_from_rpyc_directory(
     directory = Path(directory)
     results = {}
 
-    # Use directory directly - caller should pass game folder
-    search_root = directory
-
-    # Find .rpyc and .rpymc files
-    pattern_rpyc = "**/*.rpyc" if recursive else "*.rpyc"
-    pattern_rpymc = "**/*.rpymc" if recursive else "*.rpymc"
-    rpyc_files = list(search_root.glob(pattern_rpyc)) + list(search_root.glob(pattern_rpymc))
-
-    # Exclude tl/ folder and renpy engine files, except renpy/common
-    filtered_files = []
-    for f in rpyc_files:
-        try:
-            rel_path = f.relative_to(search_root)
-            rel_str = str(rel_path).lower()
-            # Skip if in tl/ subdirectory
-            if rel_str.startswith('tl\\') or rel_str.startswith('tl/'):
-                continue
-            # Allow renpy/common and project-copied renpy under subfolders
-            # Exclude only if renpy/ sits at the root of the search (engine files)
-            if rel_str.startswith('renpy/') and 'common' not in rel_str:
-                continue
-            filtered_files.append(f)
-        except ValueError:
-            # If relative_to fails, include the file
-            filtered_files.append(f)
-
-    rpyc_files = filtered_files
+    # Use directory directly - caller should pass game folder.
+    # The walker already skips tl/ and engine renpy/ (except renpy/common).
+    index = get_file_index(directory, file_index, recursive)
+    rpyc_files = [path for path in index.files('.rpyc', '.rpymc') if path not in skip]
 
     logger.info(f"Found {len(rpyc_files)} .rpyc/.rpymc files")
 
-    for rpyc_file in rpyc_files:
-        try:
-            texts = extract_texts_from_rpyc(rpyc_file)
-            results[rpyc_file] = texts
-            logger.debug(f"Extracted {len(texts)} texts from {rpyc_file}")
-        except Exception as e:
-            logger.exception(f"Error extracting from {rpyc_file}: {e}")
-            results[rpyc_file] = []
+    for rpyc_file, texts in iter_rpyc_results(rpyc_files, cache=cache, workers=workers):
+        results[rpyc_file] = texts
+        logger.debug(f"Extracted {len(texts)} texts from {rpyc_file}")
 
     total = sum(len(texts) for texts in results.values())
     logger.info(f"Total extracted from RPYC: {total} texts from {len(results)} files")
+    if cache is not None:
+        logger.info(
+            "RPYC extraction cache: %d hits, %d misses (%d shared)", cache.hits, cache.misses, cache.shared_hits
+        )
 
     return results
 
@@ -0,0 +1,261 @@
+"""
+Disk-backed working set for very large translation runs.
+
+The pipeline normally keeps every extracted entry, the globally unique
+string map and the translation results in memory. Big VN compilations
+produce millions of strings, which pushes the desktop app into swap. Above
+``AppSettings.out_of_core_threshold`` entries the working set moves into a
+throw-away SQLite file instead:
+
+- ``SourceTextCollector`` deduplicates extracted entries (same preference
+  rules as the in-memory path) and spills to disk once it grows too big.
+- ``SpillStore`` also holds the queue of untranslated strings and the
+  translations, so translation and saving read them back in chunks.
+
+The file lives in the system temp folder and is deleted on ``close``.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import tempfile
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Rows read per round trip; also the IN (...) list size (SQLite parameter limit is 999)
+SPILL_CHUNK_SIZE = 500
+# SQLite page cache per spill file (KiB); keeps RSS flat regardless of row count
+SPILL_CACHE_KIB = 16384
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS texts (
+    text TEXT PRIMARY KEY,
+    seq INTEGER NOT NULL,
+    engine_common INTEGER NOT NULL,
+    deep_scan INTEGER NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS pending (
+    original TEXT PRIMARY KEY,
+    seq INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS translations (
+    original TEXT PRIMARY KEY,
+    translated TEXT NOT NULL
+);
+"""
+
+
+def _encode(entry: Dict[str, Any]) -> str:
+    # Entries may be TextEntry mappings; rows hold plain JSON objects
+    return json.dumps(dict(entry), ensure_ascii=False, default=str)
+
+
+def prefers_entry(existing: Dict[str, Any], entry: Dict[str, Any]) -> bool:
+    """
+    Aynı metin iki kez çıkarıldığında yenisi eskisinin yerine geçmeli mi?
+
+    engine_common girişler önceliklidir; aksi halde deep scan girişi genel
+    girişin yerine geçer. Metin ilk görüldüğü sırada kalır.
+    """
+    if not existing.get('is_engine_common') and entry.get('is_engine_common'):
+        return True
+    return not existing.get('is_deep_scan') and bool(entry.get('is_deep_scan'))
+
+
+class SpillStore:
+    """Temporary SQLite file holding unique entries, pending strings and translations."""
+
+    def __init__(self, directory: Optional[str] = None):
+        handle, self.path = tempfile.mkstemp(prefix='renlocalizer-spill-', suffix='.sqlite', dir=directory)
+        os.close(handle)
+        self._conn = sqlite3.connect(self.path)
+        # Atılacak dosya: journal ve fsync gereksiz
+        self._conn.execute('PRAGMA journal_mode=OFF')
+        self._conn.execute('PRAGMA synchronous=OFF')
+        self._conn.execute(f'PRAGMA cache_size=-{SPILL_CACHE_KIB}')
+        self._conn.executescript(_SCHEMA)
+        self._next_seq = 0
+        self._pending_seq = 0
+
+    # ========== UNIQUE SOURCE ENTRIES ==========
+    def put_entry(self, entry: Dict[str, Any]) -> None:
+        """Add an extracted entry, keeping one entry per text (see ``prefers_entry``)."""
+        text = entry.get('text', '')
+        if not text:
+            return
+        engine_common = int(bool(entry.get('is_engine_common')))
+        deep_scan = int(bool(entry.get('is_deep_scan')))
+        data = _encode(entry)
+        cursor = self._conn.execute(
+            'INSERT OR IGNORE INTO texts (text, seq, engine_common, deep_scan, data) VALUES (?, ?, ?, ?, ?)',
+            (text, self._next_seq, engine_common, deep_scan, data),
+        )
+        if cursor.rowcount:
+            self._next_seq += 1
+            return
+        row = self._conn.execute(
+            'SELECT engine_common, deep_scan FROM texts WHERE text = ?', (text,)
+        ).fetchone()
+        if prefers_entry({'is_engine_common': row[0], 'is_deep_scan': row[1]}, entry):
+            self._conn.execute(
+                'UPDATE texts SET engine_common = ?, deep_scan = ?, data = ? WHERE text = ?',
+                (engine_common, deep_scan, data, text),
+            )
+
+    def has_text(self, text: str) -> bool:
+        return self._conn.execute('SELECT 1 FROM texts WHERE text = ?', (text,)).fetchone() is not None
+
+    def entry_count(self) -> int:
+        return self._conn.execute('SELECT COUNT(*) FROM texts').fetchone()[0]
+
+    def iter_entries(self) -> Iterator[Dict[str, Any]]:
+        """Unique entries in first-seen order, read ``SPILL_CHUNK_SIZE`` rows at a time."""
+        cursor = self._conn.execute('SELECT data FROM texts ORDER BY seq')
+        while True:
+            rows = cursor.fetchmany(SPILL_CHUNK_SIZE)
+            if not rows:
+                break
+            for (data,) in rows:
+                yield json.loads(data)
+
+    # ========== TRANSLATION QUEUE ==========
+    def add_pending(self, originals: Iterable[str]) -> None:
+        """Queue untranslated strings; duplicates are translated once."""
+        for original in originals:
+            if not original:
+                continue
+            cursor = self._conn.execute(
+                'INSERT OR IGNORE INTO pending (original, seq) VALUES (?, ?)',
+                (original, self._pending_seq),
+            )
+            if cursor.rowcount:
+                self._pending_seq += 1
+
+    def pending_count(self) -> int:
+        return self._conn.execute('SELECT COUNT(*) FROM pending').fetchone()[0]
+
+    def iter_pending(self, size: int) -> Iterator[List[str]]:
+        """Queued strings in chunks of ``size`` (keyset paging, safe while translations are written)."""
+        last_seq = -1
+        size = max(1, size)
+        while True:
+            rows = self._conn.execute(
+                'SELECT seq, original FROM pending WHERE seq > ? ORDER BY seq LIMIT ?',
+                (last_seq, size),
+            ).fetchall()
+            if not rows:
+                break
+            last_seq = rows[-1][0]
+            yield [original for _, original in rows]
+
+    def put_translations(self, pairs: Iterable[Tuple[str, str]]) -> None:
+        self._conn.executemany(
+            'INSERT OR REPLACE INTO translations (original, translated) VALUES (?, ?)', pairs
+        )
+
+    def translation_count(self) -> int:
+        return self._conn.execute('SELECT COUNT(*) FROM translations').fetchone()[0]
+
+    def lookup_translations(self, originals: Iterable[str]) -> Dict[str, str]:
+        """Translations for the given strings (missing ones are left out)."""
+        found: Dict[str, str] = {}
+        chunk: List[str] = []
+        for original in originals:
+            if original in found:
+                continue
+            chunk.append(original)
+            if len(chunk) >= SPILL_CHUNK_SIZE:
+                found.update(self._lookup_chunk(chunk))
+                chunk = []
+        if chunk:
+            found.update(self._lookup_chunk(chunk))
+        return found
+
+    def _lookup_chunk(self, chunk: List[str]) -> List[Tuple[str, str]]:
+        placeholders = ','.join('?' * len(chunk))
+        return self._conn.execute(
+            f'SELECT original, translated FROM translations WHERE original IN ({placeholders})', chunk
+        ).fetchall()
+
+    def close(self) -> None:
+        try:
+            self._conn.close()
+        finally:
+            try:
+                os.remove(self.path)
+            except OSError as exc:
+                logger.debug("Spill dosyası silinemedi %s: %s", self.path, exc)
+
+    def __enter__(self) -> 'SpillStore':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class SourceTextCollector:
+    """
+    Globally unique source entries for ``strings.rpy``.
+
+    Behaves like the in-memory ``text -> entry`` map of the pipeline until it
+    holds more than ``threshold`` unique texts; from then on every entry lives
+    in a ``SpillStore``. ``threshold`` 0 keeps everything in memory.
+    """
+
+    def __init__(self, threshold: int = 0, directory: Optional[str] = None):
+        self.threshold = max(0, int(threshold or 0))
+        self.directory = directory
+        self.total = 0  # Boş metinler dahil eklenen tüm girişler
+        self._seen: Optional[Dict[str, Dict[str, Any]]] = {}
+        self._store: Optional[SpillStore] = None
+
+    @property
+    def spilled(self) -> bool:
+        return self._store is not None
+
+    def add(self, entry: Dict[str, Any]) -> None:
+        self.total += 1
+        if self._store is not None:
+            self._store.put_entry(entry)
+            return
+        text = entry.get('text', '')
+        if not text:
+            return
+        existing = self._seen.get(text)
+        if existing is None or prefers_entry(existing, entry):
+            self._seen[text] = entry
+        if self.threshold and len(self._seen) > self.threshold:
+            self._spill()
+
+    def _spill(self) -> None:
+        logger.info("Out-of-core mod: %d benzersiz metin diske taşınıyor", len(self._seen))
+        self._store = SpillStore(self.directory)
+        for entry in self._seen.values():
+            self._store.put_entry(entry)
+        self._seen = None
+
+    def __contains__(self, text: str) -> bool:
+        if self._store is not None:
+            return self._store.has_text(text)
+        return text in self._seen
+
+    def __len__(self) -> int:
+        if self._store is not None:
+            return self._store.entry_count()
+        return len(self._seen)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        if self._store is not None:
+            return self._store.iter_entries()
+        return iter(self._seen.values())
+
+    def close(self) -> None:
+        if self._store is not None:
+            self._store.close()
+            self._store = None
+        self._seen = {}
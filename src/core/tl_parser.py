@@ -13,10 +13,12 @@ Ren'Py translate dosyalarını (tl/<dil>/*.rpy) parse eder ve çevirir.
 import os
 import re
 import logging
-from typing import List, Dict, Tuple, Optional
+from typing import List, Dict, Tuple, Optional, Iterable, Iterator
 from dataclasses import dataclass, field
 from pathlib import Path
 
+from .parser import is_trivial
+
 
 @dataclass
 class TranslationEntry:
@@ -113,21 +115,8 @@ class TLParser:
         self._source_comment_re = re.compile(r'^\s*#\s*([^:]+:\d+)\s*$')
     
     def should_skip_text(self, text: str) -> bool:
-        """Boş veya anlamsız metin mi kontrol et"""
-        if not text or not text.strip():
-            return True
-        
-        text = text.strip()
-        
-        # Çok kısa metinleri atla (tek karakter)
-        if len(text) <= 1:
-            return True
-        
-        # Sadece sayı olanları atla
-        if text.replace('.', '').replace(',', '').isdigit():
-            return True
-        
-        return False
+        """Boş veya anlamsız metin mi kontrol et (tek karakter, sadece sayı)"""
+        return is_trivial(text)
     
     def parse_file(self, file_path: str) -> Optional[TranslationFile]:
         """
@@ -377,7 +366,24 @@ class TLParser:
             self.logger.warning(f"Dil klasörü bulunamadı: {lang_dir}")
             return []
         
-        files = []
+        files = list(self.iter_directory(tl_dir, language))
+        
+        self.logger.info(f"Toplam {len(files)} dosya parse edildi: {lang_dir}")
+        
+        return files
+    
+    def iter_directory(self, tl_dir: str, language: str) -> Iterator[TranslationFile]:
+        """
+        parse_directory ile aynı dosyalar, ama tek tek üretilir.
+        
+        Çok büyük projelerde (out-of-core mod) aynı anda yalnızca bir dosyanın
+        girişleri bellekte tutulur.
+        """
+        lang_dir = os.path.join(tl_dir, language)
+        
+        if not os.path.isdir(lang_dir):
+            self.logger.warning(f"Dil klasörü bulunamadı: {lang_dir}")
+            return
         
         for root, dirs, filenames in os.walk(lang_dir):
             for filename in filenames:
@@ -385,11 +391,7 @@ class TLParser:
                     file_path = os.path.join(root, filename)
                     tl_file = self.parse_file(file_path)
                     if tl_file:
-                        files.append(tl_file)
-        
-        self.logger.info(f"Toplam {len(files)} dosya parse edildi: {lang_dir}")
-        
-        return files
+                        yield tl_file
     
     def update_translations(
         self,
@@ -525,7 +527,7 @@ class TLParser:
             return False
 
 
-def get_translation_stats(tl_files: List[TranslationFile]) -> Dict:
+def get_translation_stats(tl_files: Iterable[TranslationFile]) -> Dict:
     """Çeviri istatistikleri"""
     total_entries = 0
     translated_entries = 0
@@ -12,7 +12,7 @@ import os
 import logging
 import asyncio
 import re
-from typing import Optional, List, Dict, Callable
+from typing import Optional, List, Dict, Callable, Iterable, Iterator, TextIO, Tuple
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
@@ -26,6 +26,8 @@ except ImportError:
 from src.utils.config import ConfigManager
 from src.utils.sdk_finder import find_renpy_sdks
 from src.utils.unren_manager import UnRenManager
+from src.core.parser import ADMIT_SKIP, ProjectFileIndex, get_file_index
+from src.core.spill_store import SourceTextCollector, SpillStore
 from src.core.tl_parser import TLParser, TranslationFile, TranslationEntry, get_translation_stats
 from src.core.translator import TranslationManager, TranslationRequest, TranslationEngine
 
@@ -147,6 +149,9 @@ class TranslationPipeline(QObject):
         self.engine: TranslationEngine = TranslationEngine.GOOGLE
         self.auto_unren: bool = True
         self.use_proxy: bool = False
+        
+        # Watch mode: tl/<dil> altında tanımlı metinler (append_new_strings ilk çağrıda doldurur)
+        self._tl_known_texts: Optional[set] = None
     
     def configure(
         self,
@@ -195,6 +200,7 @@ class TranslationPipeline(QObject):
         self.engine = engine
         self.auto_unren = auto_unren
         self.use_proxy = use_proxy
+        self._tl_known_texts = None
     
     def stop(self):
         """Pipeline'ı durdur"""
@@ -301,7 +307,9 @@ class TranslationPipeline(QObject):
         
         # 2.5. Kaynak dosyaları çevrilebilir hale getir
         self._set_stage(PipelineStage.GENERATING, self.config.get_ui_text("stage_generating"))
-        self._make_source_translatable(game_dir)
+        # Projeyi tek seferde listele; sonraki tüm aşamalar bu listeyi kullanır
+        file_index = ProjectFileIndex(game_dir)
+        self._make_source_translatable(game_dir, file_index=file_index)
         
         if self.should_stop:
             return self._stopped_result()
@@ -313,7 +321,7 @@ class TranslationPipeline(QObject):
         
         # Zaten varsa atla
         if not os.path.isdir(tl_dir) or not self._has_rpy_files(tl_dir):
-            success = self._run_translate_command(project_path)
+            success = self._run_translate_command(project_path, file_index=file_index)
             
             if not success:
                 return PipelineResult(
@@ -331,19 +339,39 @@ class TranslationPipeline(QObject):
         self._set_stage(PipelineStage.PARSING, self.config.get_ui_text("stage_parsing"))
         
         tl_path = os.path.join(game_dir, 'tl')
-        tl_files = self.tl_parser.parse_directory(tl_path, self.target_language)
         
-        if not tl_files:
+        # Çevrilmemiş girişleri topla; dosyalar tek tek okunur ve eşik aşılırsa
+        # kalan iş diske (SpillStore) taşınır, dosya içerikleri bellekte tutulmaz
+        threshold = self._out_of_core_threshold()
+        tl_files = []
+        all_entries = []
+        spill = None
+        file_count = 0
+        for tl_file in self.tl_parser.iter_directory(tl_path, self.target_language):
+            file_count += 1
+            if spill is not None:
+                spill.add_pending(entry.original_text for entry in tl_file.get_untranslated())
+                continue
+            tl_files.append(tl_file)
+            all_entries.extend(tl_file.get_untranslated())
+            if threshold and len(all_entries) > threshold:
+                self.log_message.emit("info", f"Out-of-core mod: {len(all_entries)} giriş eşiği ({threshold}) aştı, çeviri kuyruğu diske taşınıyor")
+                spill = SpillStore()
+                spill.add_pending(entry.original_text for entry in all_entries)
+                tl_files, all_entries = [], []
+        
+        if not file_count:
             return PipelineResult(
                 success=False,
                 message=self.config.get_ui_text("pipeline_files_not_found_parse"),
                 stage=PipelineStage.ERROR
             )
         
-        # Çevrilmemiş girişleri topla
-        all_entries = []
-        for tl_file in tl_files:
-            all_entries.extend(tl_file.get_untranslated())
+        if spill is not None:
+            try:
+                return self._run_out_of_core_stages(spill, game_dir, tl_path, tl_dir)
+            finally:
+                spill.close()
         
         if not all_entries:
             stats = get_translation_stats(tl_files)
@@ -411,6 +439,70 @@ class TranslationPipeline(QObject):
             output_path=tl_dir
         )
     
+    def _run_out_of_core_stages(self, spill: SpillStore, game_dir: str, tl_path: str, tl_dir: str) -> PipelineResult:
+        """
+        Out-of-core çeviri ve kaydetme (5-7. adımlar).
+        
+        Çevrilmemiş metinler ve çeviriler spill dosyasında tutulur; çeviri
+        parça parça yapılır, kaydederken her tl dosyası yeniden okunup
+        yalnızca kendi çevirileri sorgulanır.
+        """
+        pending = spill.pending_count()
+        self.log_message.emit("info", self.config.get_ui_text("pipeline_entries_to_translate").replace("{count}", str(pending)))
+        
+        if self.should_stop:
+            return self._stopped_result()
+        
+        # 5. Çeviri
+        self._set_stage(PipelineStage.TRANSLATING, self.config.get_ui_text("stage_translating"))
+        
+        batch_size = self.config.translation_settings.max_batch_size
+        batches = ([(text, {}) for text in chunk] for chunk in spill.iter_pending(batch_size))
+        self._translate_batches(batches, pending, spill.put_translations)
+        translated_count = spill.translation_count()
+        
+        if self.should_stop:
+            return self._stopped_result()
+        
+        if not translated_count:
+            return PipelineResult(
+                success=False,
+                message=self.config.get_ui_text("pipeline_translate_failed"),
+                stage=PipelineStage.ERROR
+            )
+        
+        # 6. Kaydetme
+        self._set_stage(PipelineStage.SAVING, self.config.get_ui_text("stage_saving"))
+        
+        saved_count = 0
+        for tl_file in self.tl_parser.iter_directory(tl_path, self.target_language):
+            file_translations = spill.lookup_translations(entry.original_text for entry in tl_file.entries)
+            if file_translations and self.tl_parser.save_translations(tl_file, file_translations):
+                saved_count += 1
+        
+        # 7. Dil başlatma kodu oluştur (game/ klasörüne)
+        self._create_language_init_file(game_dir)
+        
+        stats = get_translation_stats(self.tl_parser.iter_directory(tl_path, self.target_language))
+        
+        self._set_stage(PipelineStage.COMPLETED, self.config.get_ui_text("stage_completed"))
+        
+        return PipelineResult(
+            success=True,
+            message=self.config.get_ui_text("pipeline_completed_summary").replace("{translated}", str(translated_count)).replace("{saved}", str(saved_count)),
+            stage=PipelineStage.COMPLETED,
+            stats=stats,
+            output_path=tl_dir
+        )
+    
+    def _out_of_core_threshold(self) -> int:
+        """AppSettings.out_of_core_threshold (0 = out-of-core mod kapalı)"""
+        app_settings = getattr(self.config, 'app_settings', None)
+        try:
+            return max(0, int(getattr(app_settings, 'out_of_core_threshold', 0) or 0))
+        except (TypeError, ValueError):
+            return 0
+    
     def _stopped_result(self) -> PipelineResult:
         """Durduruldu sonucu"""
         return PipelineResult(
@@ -542,7 +634,7 @@ init python:
         except Exception as e:
             self.log_message.emit("warning", f"Could not create date translations: {e}")
     
-    def _make_source_translatable(self, game_dir: str) -> int:
+    def _make_source_translatable(self, game_dir: str, file_index: Optional[ProjectFileIndex] = None) -> int:
         """
         Kaynak .rpy dosyalarındaki UI metinlerini çevrilebilir hale getirir.
         textbutton "Text" -> textbutton _("Text")
@@ -648,70 +740,69 @@ init python:
             rpy_dir = game_dir
         
         try:
-            for root, dirs, files in os.walk(rpy_dir):
-                # tl klasörünü atla
-                if 'tl' in dirs:
-                    dirs.remove('tl')
-                
-                for filename in files:
-                    if not filename.endswith('.rpy'):
-                        continue
+            # tl/ ve motor klasörleri yürüyücü tarafından zaten budanır
+            for rpy_path in get_file_index(rpy_dir, file_index).files('.rpy'):
+                filepath = str(rpy_path)
+                filename = rpy_path.name
 
-                    filepath = os.path.join(root, filename)
+                # İç içe tl klasörlerini de atla
+                rel_parts = [part.lower() for part in rpy_path.relative_to(rpy_dir).parts[:-1]]
+                if 'tl' in rel_parts:
+                    continue
 
-                    # GÜVENLİK: 'renpy/' klasörü altındaki dosyaları ASLA değiştirme!
-                    if os.path.sep + 'renpy' + os.path.sep in filepath or filepath.endswith(os.path.sep + 'renpy'):
-                        self.log_message.emit("debug", f"Motor dosyası atlanıyor (Write Protection): {filename}")
-                        continue
+                # GÜVENLİK: 'renpy/' klasörü altındaki dosyaları ASLA değiştirme!
+                if os.path.sep + 'renpy' + os.path.sep in filepath or filepath.endswith(os.path.sep + 'renpy'):
+                    self.log_message.emit("debug", f"Motor dosyası atlanıyor (Write Protection): {filename}")
+                    continue
+                
+                try:
+                    # Her dosya için yedek oluştur
+                    # GÜVENLİK YAMASI: Yedekleme
+                    backup_path = filepath + ".bak"
+                    if not os.path.exists(backup_path):
+                        try:
+                            shutil.copy2(filepath, backup_path)
+                        except Exception as e:
+                            self.log_message.emit("warning", f"Yedek alınamadı, işlem atlanıyor: {filename}")
+                            continue  # Dosya işlenmeden atlanıyor
                     
-                    try:
-                        # Her dosya için yedek oluştur
-                        # GÜVENLİK YAMASI: Yedekleme
-                        backup_path = filepath + ".bak"
-                        if not os.path.exists(backup_path):
-                            try:
-                                shutil.copy2(filepath, backup_path)
-                            except Exception as e:
-                                self.log_message.emit("warning", f"Yedek alınamadı, işlem atlanıyor: {filename}")
-                                continue  # Dosya işlenmeden atlanıyor
-                        
-                        with open(filepath, 'r', encoding='utf-8-sig') as f:
-                            content = f.read()
-                        
-                        original_content = content
+                    with open(filepath, 'r', encoding='utf-8-sig') as f:
+                        content = f.read()
+                    
+                    original_content = content
+                    
+                    # Her pattern için değiştir
+                    for pattern, replacement in patterns:
+                        # Satır satır işle
+                        lines = content.split('\n')
+                        new_lines = []
                         
-                        # Her pattern için değiştir
-                        for pattern, replacement in patterns:
-                            # Satır satır işle
-                            lines = content.split('\n')
-                            new_lines = []
+                        for line in lines:
+                            # Atlanacak satırları kontrol et
+                            should_skip = False
+                            for skip in skip_patterns:
+                                if re.search(skip, line):
+                                    should_skip = True
+                                    break
                             
-                            for line in lines:
-                                # Atlanacak satırları kontrol et
-                                should_skip = False
-                                for skip in skip_patterns:
-                                    if re.search(skip, line):
-                                        should_skip = True
-                                        break
-                                
-                                if not should_skip:
-                                    line = re.sub(pattern, replacement, line)
-                                
-                                new_lines.append(line)
+                            if not should_skip:
+                                line = re.sub(pattern, replacement, line)
                             
-                            content = '\n'.join(new_lines)
+                            new_lines.append(line)
                         
-                        # Değişiklik olduysa kaydet
-                        if content != original_content:
-                            with open(filepath, 'w', encoding='utf-8-sig', newline='\n') as f:
-                                f.write(content)
-                            modified_count += 1
-                            self.log_message.emit("debug", f"Çevrilebilir yapıldı: {filename}")
+                        content = '\n'.join(new_lines)
                     
-                    except Exception as e:
-                        self.log_message.emit("warning", f"Dosya işlenemedi {filename}: {e}")
-                        continue
-            
+                    # Değişiklik olduysa kaydet
+                    if content != original_content:
+                        with open(filepath, 'w', encoding='utf-8-sig', newline='\n') as f:
+                            f.write(content)
+                        modified_count += 1
+                        self.log_message.emit("debug", f"Çevrilebilir yapıldı: {filename}")
+                
+                except Exception as e:
+                    self.log_message.emit("warning", f"Dosya işlenemedi {filename}: {e}")
+                    continue
+        
             if modified_count > 0:
                 self.log_message.emit("info", f"{modified_count} kaynak dosya çevrilebilir hale getirildi")
             
@@ -810,13 +901,18 @@ init python:
             self.log_message.emit("error", f"UnRen hatası: {e}")
             return False
     
-    def _run_translate_command(self, project_path: str) -> bool:
+    def _run_translate_command(self, project_path: str, file_index: Optional[ProjectFileIndex] = None) -> bool:
         """Kaynak dosyaları parse edip tl/ klasörüne çeviri şablonları oluştur
         
+        file_index verilirse 'game' klasörü yeniden listelenmez.
+        
         ÖNEMLİ: Ren'Py String Translation sistemi kullanılıyor.
         Bu sistemde aynı string sadece BİR KERE tanımlanabilir (global tekil).
         Bu nedenle tüm stringler (diyalog + UI) tek bir dosyada toplanıyor.
+        Büyük projelerde tekil metin haritası diske taşınır (out_of_core_threshold).
         """
+        # Metin -> giriş haritası (global tekil); eşik aşılırsa geçici SQLite dosyasına taşınır
+        source_texts = SourceTextCollector(self._out_of_core_threshold())
         try:
             self.log_message.emit("info", f"Çeviri dosyaları oluşturuluyor: {self.target_language}")
             
@@ -829,15 +925,8 @@ init python:
             # Kaynak dosyaları parse et
             from src.core.parser import RenPyParser
             parser = RenPyParser(self.config)
-            
-            # 1. Parse 'game' directory
-            # Parse 'game' directory and flatten results
-            parse_results = parser.parse_directory(game_dir)
-            source_texts = []
-            for file_path, entries in parse_results.items():
-                for entry in entries:
-                    entry['file_path'] = str(file_path)
-                    source_texts.append(entry)
+            # 'game' klasörünü bir kez listele (parse, deep scan ve RPYC ortak kullanır)
+            file_index = get_file_index(game_dir, file_index)
 
             # Resolve feature flags once so they can be reused for engine/common scanning
             use_deep = True
@@ -847,20 +936,43 @@ init python:
                 use_deep = getattr(settings, 'enable_deep_scan', getattr(settings, 'use_deep_scan', True))
                 use_rpyc = getattr(settings, 'enable_rpyc_reader', getattr(settings, 'use_rpyc', False))
 
-            # Remove any entries that originate from game/renpy/common — we'll re-parse them with
+            # .rpy + .rpyc çiftlerinde her script tek kaynaktan okunur; 1., 3. ve 4. adım aynı planı kullanır
+            source_mode = None
+            if use_rpyc:
+                source_mode = parser.script_source_mode()
+                plan = file_index.script_sources(source_mode)
+                if plan.pairs:
+                    self.log_message.emit(
+                        "info",
+                        f"Kaynak seçimi ({plan.mode}): {plan.pairs} script hem .rpy hem .rpyc, "
+                        f"{plan.compiled} tanesi .rpyc'den okunacak",
+                    )
+            
+            # Skip any entries that originate from game/renpy/common — we'll re-parse them with
             # a temporary parser that forces UI scanning for engine common strings.
             renpy_common_path = os.path.normpath(os.path.abspath(os.path.join(game_dir, 'renpy', 'common')))
-            if os.path.isdir(renpy_common_path):
-                before_len = len(source_texts)
-                def abs_path(p):
-                    try:
-                        return os.path.normpath(os.path.abspath(str(p)))
-                    except Exception:
-                        return ''
-                source_texts = [e for e in source_texts if not abs_path(e.get('file_path', '')).startswith(renpy_common_path)]
-                after_len = len(source_texts)
-                if before_len != after_len:
-                    self.log_message.emit('debug', f'Removed {before_len - after_len} entries from initial game parse that belong to renpy/common to avoid duplicates')
+            has_game_common = os.path.isdir(renpy_common_path)
+            def abs_path(p):
+                try:
+                    return os.path.normpath(os.path.abspath(str(p)))
+                except Exception:
+                    return ''
+
+            # 1. Parse 'game' directory (entries stream in file by file, file_path already set)
+            removed_common = 0
+            for entry in parser.iter_text_entries(game_dir, file_index=file_index, source_mode=source_mode):
+                if has_game_common and abs_path(entry.get('file_path', '')).startswith(renpy_common_path):
+                    removed_common += 1
+                    continue
+                source_texts.add(entry)
+            for data_path, decision in parser.admission_report:
+                self.log_message.emit(
+                    "warning" if decision.action == ADMIT_SKIP else "info",
+                    f"Veri dosyası {'atlandı' if decision.action == ADMIT_SKIP else 'kısmen tarandı'}: "
+                    f"{os.path.relpath(data_path, game_dir)} ({decision.reason})",
+                )
+            if removed_common:
+                self.log_message.emit('debug', f'Removed {removed_common} entries from initial game parse that belong to renpy/common to avoid duplicates')
 
             # Explicitly scan 'renpy/common' if it exists in project root
             renpy_dir = os.path.join(project_path, 'renpy')
@@ -878,19 +990,20 @@ init python:
                 temp_conf.translation_settings.translate_ui = True
                 temp_parser = RenPyParser(temp_conf)
                 try:
-                    common_results = temp_parser.parse_directory(renpy_common)
+                    common_entries = list(temp_parser.iter_text_entries(renpy_common))
                 except Exception:
-                    common_results = parser.parse_directory(renpy_common)
-                for file_path, entries in common_results.items():
-                    for entry in entries:
-                        entry['file_path'] = str(file_path)
-                        entry['is_engine_common'] = True
-                        source_texts.append(entry)
+                    common_entries = list(parser.iter_text_entries(renpy_common))
+                for entry in common_entries:
+                    entry['is_engine_common'] = True
+                    source_texts.add(entry)
                 # If engine/common ships only .rpyc files, optionally parse them too
                 if use_rpyc:
                     try:
                         from src.core.rpyc_reader import extract_texts_from_rpyc_directory
-                        rpyc_results = extract_texts_from_rpyc_directory(renpy_common)
+                        rpyc_results = extract_texts_from_rpyc_directory(
+                            renpy_common, cache=parser.get_extraction_cache(),
+                            workers=parser.pool_workers(),
+                        )
                         for file_path, entries in rpyc_results.items():
                             for entry in entries:
                                 patched = dict(entry)
@@ -898,7 +1011,7 @@ init python:
                                 patched['is_engine_common'] = True
                                 if 'text_type' in patched and 'type' not in patched:
                                     patched['type'] = patched.get('text_type')
-                                source_texts.append(patched)
+                                source_texts.add(patched)
                     except Exception as exc:
                         self.log_message.emit("warning", f"Engine common RPYC taraması başarısız: {exc}")
             # Optionally scan installed Ren'Py SDKs' renpy/common directories
@@ -922,20 +1035,21 @@ init python:
                                     temp_conf.translation_settings.translate_ui = True
                                     temp_parser = RenPyParser(temp_conf)
                                     try:
-                                        sdk_results = temp_parser.parse_directory(sdk_common)
+                                        sdk_entries = list(temp_parser.iter_text_entries(sdk_common))
                                     except Exception:
                                         # Fallback to project parser if temp parsing fails
-                                        sdk_results = parser.parse_directory(sdk_common)
-                                    for file_path, entries in sdk_results.items():
-                                        for entry in entries:
-                                            entry['file_path'] = str(file_path)
-                                            # Mark that this entry came from engine SDK common
-                                            entry['is_engine_common'] = True
-                                            source_texts.append(entry)
+                                        sdk_entries = list(parser.iter_text_entries(sdk_common))
+                                    for entry in sdk_entries:
+                                        # Mark that this entry came from engine SDK common
+                                        entry['is_engine_common'] = True
+                                        source_texts.add(entry)
                                     if use_rpyc:
                                         try:
                                             from src.core.rpyc_reader import extract_texts_from_rpyc_directory
-                                            sdk_rpyc = extract_texts_from_rpyc_directory(sdk_common)
+                                            sdk_rpyc = extract_texts_from_rpyc_directory(
+                                                sdk_common, cache=parser.get_extraction_cache(),
+                                                workers=parser.pool_workers(),
+                                            )
                                             for file_path, entries in sdk_rpyc.items():
                                                 for entry in entries:
                                                     patched = dict(entry)
@@ -943,7 +1057,7 @@ init python:
                                                     patched['is_engine_common'] = True
                                                     if 'text_type' in patched and 'type' not in patched:
                                                         patched['type'] = patched.get('text_type')
-                                                    source_texts.append(patched)
+                                                    source_texts.add(patched)
                                         except Exception as exc:
                                             self.log_message.emit("warning", f"SDK engine RPYC taraması başarısız: {exc}")
                 except Exception as exc:
@@ -952,95 +1066,68 @@ init python:
                  # Handle case where renpy is inside game folder (rare but possible)
                  pass # Already handled by recursive scan of game_dir
 
-            # --- FIX START: Initialize and Populate Results ---
-            deep_results = {}
-            rpyc_results = {}
-            existing_texts = {e['text'] for e in source_texts} # For dedup
-            deep_count = 0
-
-            # 3. Deep Scan Execution
-            # Check config (default to True if not set)
+            # 3. Deep Scan: only the deep entries are merged, normal ones came from step 1
             if use_deep:
                 self.log_message.emit("info", "Deep Scan çalıştırılıyor...")
-                deep_results = parser.extract_from_directory_with_deep_scan(game_dir)
+                deep_count = 0
+                for entry in parser.iter_text_entries(
+                    game_dir,
+                    include_rpy=False,
+                    include_deep_scan=True,
+                    include_data_files=False,
+                    file_index=file_index,
+                    source_mode=source_mode,
+                ):
+                    if entry.get('is_deep_scan'):
+                        source_texts.add(entry)
+                        deep_count += 1
+                self.log_message.emit("info", f"Deep Scan: {deep_count} ek metin birleştirildi")
 
-            # 4. RPYC Execution
+            # 4. RPYC: only texts that no earlier stage produced (tekrarı önlemek için)
             if use_rpyc:
                 self.log_message.emit("info", "RPYC taraması yapılıyor...")
-                # Import here to avoid circular imports if any
-                try:
-                    from src.core.rpyc_reader import extract_texts_from_rpyc_directory
-                    rpyc_results = extract_texts_from_rpyc_directory(game_dir)
-                except ImportError:
-                    self.log_message.emit("warning", "RPYC modülü bulunamadı, atlanıyor.")
-            # --- FIX END ---
-            
-            # --- EKSİK OLAN BİRLEŞTİRME KODU BAŞLANGICI ---
-
-            # Deep Scan Sonuçlarını Birleştir
-            if deep_results:
-                self.log_message.emit("info", f"Deep Scan verileri birleştiriliyor...")
-                for file_path, entries in deep_results.items():
-                    for entry in entries:
-                        if entry.get('is_deep_scan'):
-                            entry['file_path'] = str(file_path)
-                            source_texts.append(entry)
-
-            # RPYC Sonuçlarını Birleştir
-            if rpyc_results:
-                self.log_message.emit("info", f"RPYC verileri birleştiriliyor...")
-                # Mevcut metinleri kontrol et (tekrarı önlemek için)
-                existing_texts = {e.get('text') for e in source_texts}
-
-                for file_path, entries in rpyc_results.items():
-                    for entry in entries:
-                        text = entry.get('text', '')
-                        if text and text not in existing_texts:
-                            entry['file_path'] = str(file_path)
-                            source_texts.append(entry)
-                            existing_texts.add(text)
-
-            # --- EKSİK OLAN BİRLEŞTİRME KODU BİTİŞİ ---
+                for entry in parser.iter_text_entries(
+                    game_dir,
+                    include_rpy=False,
+                    include_data_files=False,
+                    include_rpyc=True,
+                    file_index=file_index,
+                    source_mode=source_mode,
+                ):
+                    text = entry.get('text', '')
+                    if text and text not in source_texts:
+                        source_texts.add(entry)
             
-            if not source_texts:
+            if not source_texts.total:
                 self.log_message.emit("warning", "Kaynak dosyalarda çevrilecek metin bulunamadı")
                 return False
             
-            self.log_message.emit("info", f"{len(source_texts)} metin bulundu, çeviri dosyaları oluşturuluyor...")
+            self.log_message.emit("info", f"{source_texts.total} metin bulundu, çeviri dosyaları oluşturuluyor...")
+            extraction_cache = parser.get_extraction_cache()
+            if extraction_cache is not None:
+                cache_stats = extraction_cache.stats()
+                self.log_message.emit(
+                    "info",
+                    f"Extraction cache: {cache_stats['hits']} dosya önbellekten, {cache_stats['misses']} dosya yeniden tarandı",
+                )
             
-            # TÜM metinleri GLOBAL olarak tekil tut
+            # TÜM metinler GLOBAL olarak tekil tutuldu (SourceTextCollector)
             # Ren'Py String Translation'da aynı string sadece 1 kere tanımlanabilir
             # Prefers entries marked as engine_common if duplicates occur
-            seen_map = {}
-            for entry in source_texts:
-                text = entry.get('text', '')
-                if not text:
-                    continue
-                existing = seen_map.get(text)
-                if not existing:
-                    seen_map[text] = entry
-                else:
-                    # If the existing one is not engine_common but the new one is, prefer the new
-                    if not existing.get('is_engine_common') and entry.get('is_engine_common'):
-                        seen_map[text] = entry
-                    # Prefer deep_scan or contextful entries over generic ones if needed
-                    elif not existing.get('is_deep_scan') and entry.get('is_deep_scan'):
-                        seen_map[text] = entry
-
-            all_entries = list(seen_map.values())
+            unique_count = len(source_texts)
+            if source_texts.spilled:
+                self.log_message.emit("info", f"Out-of-core mod: tekil metinler diskte tutuluyor (eşik {source_texts.threshold})")
             
-            self.log_message.emit("info", f"{len(all_entries)} benzersiz metin bulundu")
+            self.log_message.emit("info", f"{unique_count} benzersiz metin bulundu")
             
-            # Tüm stringleri tek strings.rpy dosyasına yaz
-            if all_entries:
+            # Tüm stringleri tek strings.rpy dosyasına yaz (satır satır, içerik bellekte birikmez)
+            if unique_count:
                 try:
-                    strings_content = self._generate_all_strings_file(all_entries, game_dir)
-                    if strings_content:
-                        strings_path = os.path.join(tl_dir, 'strings.rpy')
-                        with open(strings_path, 'w', encoding='utf-8-sig', newline='\n') as f:
-                            f.write(strings_content)
-                        self.log_message.emit("info", f"strings.rpy oluşturuldu: {len(all_entries)} string")
-                        return True
+                    strings_path = os.path.join(tl_dir, 'strings.rpy')
+                    with open(strings_path, 'w', encoding='utf-8-sig', newline='\n') as f:
+                        self._write_all_strings_file(f, source_texts, game_dir)
+                    self.log_message.emit("info", f"strings.rpy oluşturuldu: {unique_count} string")
+                    return True
                 except Exception as e:
                     self.log_message.emit("error", f"strings.rpy oluşturulamadı: {e}")
                     return False
@@ -1050,8 +1137,10 @@ init python:
         except Exception as e:
             self.log_message.emit("error", f"Çeviri dosyası oluşturma hatası: {e}")
             return False
+        finally:
+            source_texts.close()
     
-    def _generate_all_strings_file(self, entries: List[dict], game_dir: str) -> str:
+    def _generate_all_strings_file(self, entries: Iterable[dict], game_dir: str) -> str:
         """
         Tüm çevrilecek metinleri (diyalog + UI) tek bir strings.rpy dosyasında topla.
         
@@ -1062,39 +1151,108 @@ init python:
         
         Bu format ID gerektirmez ve her yerde çalışır.
         """
-        lines = []
-        lines.append("# Translation strings file")
-        lines.append("# Auto-generated by RenLocalizer")
-        lines.append("# Using Ren'Py String Translation format for maximum compatibility")
-        lines.append("")
-        lines.append(f"translate {self.target_language} strings:")
-        lines.append("")
+        return '\n'.join(self._iter_strings_file_lines(entries, game_dir))
+    
+    def _write_all_strings_file(self, handle: TextIO, entries: Iterable[dict], game_dir: str) -> None:
+        """_generate_all_strings_file ile aynı içerik, ama satır satır dosyaya yazılır (out-of-core)."""
+        first = True
+        for line in self._iter_strings_file_lines(entries, game_dir):
+            if not first:
+                handle.write('\n')
+            handle.write(line)
+            first = False
+    
+    def _iter_strings_file_lines(self, entries: Iterable[dict], game_dir: str) -> Iterator[str]:
+        """strings.rpy satırları (satır sonu olmadan)"""
+        yield "# Translation strings file"
+        yield "# Auto-generated by RenLocalizer"
+        yield "# Using Ren'Py String Translation format for maximum compatibility"
+        yield ""
+        yield f"translate {self.target_language} strings:"
+        yield ""
+        
+        for entry in entries:
+            yield from self._strings_entry_lines(entry, game_dir)
+            yield ""
+    
+    def _strings_entry_lines(self, entry: dict, game_dir: str) -> List[str]:
+        """Tek bir strings.rpy girişi: kaynak yorumu, old ve boş new satırı"""
+        text = entry.get('text', '')
+        file_path = entry.get('file_path', '')
+        line_num = entry.get('line_number', 0)
+        character = entry.get('character', '')
+        text_type = entry.get('type', 'unknown')
+        
+        escaped_text = self._escape_rpy_string(text)
+        rel_path = os.path.relpath(file_path, game_dir) if file_path else 'unknown'
+        
+        # Kaynak bilgisi ve karakter adını yorum olarak ekle
+        comment_parts = [f"{rel_path}:{line_num}"]
+        if character:
+            comment_parts.append(f"({character})")
+        if text_type and text_type != 'dialogue':
+            comment_parts.append(f"[{text_type}]")
+        if entry.get('is_engine_common'):
+            comment_parts.append('[engine_common]')
+        
+        return [
+            f"    # {' '.join(comment_parts)}",
+            f'    old "{escaped_text}"',
+            f'    new ""',
+        ]
+    
+    def append_new_strings(self, entries: Iterable[dict], game_dir: str) -> int:
+        """
+        Watch mode: yeni metinleri tl/<dil>/strings.rpy sonuna ekle.
         
+        tl klasöründe zaten tanımlı metinler atlanır (Ren'Py aynı string'in iki
+        kez tanımlanmasına izin vermez). tl klasörü yalnızca ilk çağrıda okunur.
+        Kaldırılan metinlerin çevirilerine dokunulmaz; Ren'Py kullanılmayan
+        çevirileri yok sayar ve çevirmenin emeği kaybolmaz.
+        
+        Returns:
+            Eklenen string sayısı
+        """
+        tl_path = os.path.join(game_dir, 'tl')
+        if self._tl_known_texts is None:
+            self._tl_known_texts = {
+                entry.original_text
+                for tl_file in self.tl_parser.iter_directory(tl_path, self.target_language)
+                for entry in tl_file.entries
+            }
+        known = self._tl_known_texts
+        
+        new_entries = []
         for entry in entries:
             text = entry.get('text', '')
-            file_path = entry.get('file_path', '')
-            line_num = entry.get('line_number', 0)
-            character = entry.get('character', '')
-            text_type = entry.get('type', 'unknown')
-            
-            escaped_text = self._escape_rpy_string(text)
-            rel_path = os.path.relpath(file_path, game_dir) if file_path else 'unknown'
-            
-            # Kaynak bilgisi ve karakter adını yorum olarak ekle
-            comment_parts = [f"{rel_path}:{line_num}"]
-            if character:
-                comment_parts.append(f"({character})")
-            if text_type and text_type != 'dialogue':
-                comment_parts.append(f"[{text_type}]")
-            if entry.get('is_engine_common'):
-                comment_parts.append('[engine_common]')
-            
-            lines.append(f"    # {' '.join(comment_parts)}")
-            lines.append(f'    old "{escaped_text}"')
-            lines.append(f'    new ""')
-            lines.append("")
+            if text and text not in known:
+                known.add(text)
+                new_entries.append(entry)
+        if not new_entries:
+            return 0
+        
+        strings_path = os.path.join(tl_path, self.target_language, 'strings.rpy')
+        os.makedirs(os.path.dirname(strings_path), exist_ok=True)
+        try:
+            with open(strings_path, 'rb') as f:
+                f.seek(-1, os.SEEK_END)
+                needs_newline = f.read(1) != b'\n'
+        except OSError:
+            # Dosya yok veya boş: başlıkla birlikte yazılır
+            needs_newline = None
         
-        return '\n'.join(lines)
+        # utf-8-sig: BOM yalnızca yeni dosyanın başına yazılır, eklemede atlanır
+        with open(strings_path, 'a', encoding='utf-8-sig', newline='\n') as f:
+            if needs_newline is None:
+                self._write_all_strings_file(f, new_entries, game_dir)
+            else:
+                if needs_newline:
+                    f.write('\n')
+                for entry in new_entries:
+                    f.write('\n' + '\n'.join(self._strings_entry_lines(entry, game_dir)) + '\n')
+        
+        self.log_message.emit("info", f"strings.rpy: {len(new_entries)} yeni string eklendi ({self.target_language})")
+        return len(new_entries)
     
     def _escape_rpy_string(self, text: str) -> str:
         """Ren'Py string formatı için escape et"""
@@ -1116,7 +1274,26 @@ init python:
         
         # Batch çeviri için hazırla
         batch_size = self.config.translation_settings.max_batch_size
+        batches = (
+            [(entry.original_text, {'entry': entry}) for entry in entries[i:i + batch_size]]
+            for i in range(0, total, batch_size)
+        )
+        self._translate_batches(batches, total, translations.update)
         
+        return translations
+    
+    def _translate_batches(
+        self,
+        batches: Iterable[List[Tuple[str, dict]]],
+        total: int,
+        on_translated: Callable[[List[Tuple[str, str]]], None],
+    ) -> None:
+        """
+        (metin, metadata) batch'lerini sırayla çevir.
+        
+        Başarılı çeviriler her batch sonunda (orijinal, çeviri) listesi olarak
+        on_translated'a verilir; sonuçların nerede tutulacağına çağıran karar verir.
+        """
         # Ren'Py dil kodunu API dil koduna dönüştür
         api_target_lang = RENPY_TO_API_LANG.get(self.target_language, self.target_language)
         api_source_lang = RENPY_TO_API_LANG.get(self.source_language, self.source_language)
@@ -1127,26 +1304,25 @@ init python:
         asyncio.set_event_loop(loop)
         
         try:
-            for i in range(0, total, batch_size):
+            current = 0
+            for batch in batches:
                 if self.should_stop:
                     break
                 
-                batch = entries[i:i + batch_size]
-                
                 # Progress güncelle
-                current = min(i + batch_size, total)
+                current = min(current + len(batch), total)
                 if batch:
-                    self.progress_updated.emit(current, total, batch[0].original_text[:50])
+                    self.progress_updated.emit(current, total, batch[0][0][:50])
                 
                 # Çeviri istekleri oluştur
                 requests = []
-                for entry in batch:
+                for text, metadata in batch:
                     req = TranslationRequest(
-                        text=entry.original_text,  # original_text kullan
+                        text=text,  # original_text kullan
                         source_lang=api_source_lang,
                         target_lang=api_target_lang,  # API dil kodu kullan
                         engine=self.engine,
-                        metadata={'entry': entry}
+                        metadata=metadata
                     )
                     requests.append(req)
                 
@@ -1157,16 +1333,16 @@ init python:
                 )
                 
                 # Sonuçları kaydet
-                for result in results:
-                    if result.success and result.translated_text:
-                        translations[result.original_text] = result.translated_text
+                on_translated([
+                    (result.original_text, result.translated_text)
+                    for result in results
+                    if result.success and result.translated_text
+                ])
                 
                 self.log_message.emit("info", f"Çevrildi: {current}/{total}")
         
         finally:
             loop.close()
-        
-        return translations
 
     def validate_placeholders(self, original, translated):
         """
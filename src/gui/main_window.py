@@ -43,6 +43,7 @@ from src.utils.config import ConfigManager
 from src.utils.unren_manager import UnRenManager
 from src.version import VERSION
 from src.core.parser import RenPyParser
+from src.core.extraction_cache import kind_fingerprints
 from src.core.translator import TranslationManager, TranslationEngine, GoogleTranslator, DeepLTranslator
 from src.core.output_formatter import RenPyOutputFormatter
 from src.gui.translation_worker import TranslationWorker
@@ -65,6 +66,9 @@ class MainWindow(QMainWindow):
         self.parser = RenPyParser(config_manager=self.config_manager)
         self.unren_manager = UnRenManager(self.config_manager)
         self._last_scanned_dir: Optional[Path] = None
+        # Search root and extraction-store kinds of the last scan (used by the texts report)
+        self._last_scan_root: Optional[Path] = None
+        self._last_scan_kinds: Tuple[str, ...] = ('entries',)
         self._last_auto_unren_dir: Optional[Path] = None
         self._unren_progress_dialog: Optional[QProgressDialog] = None
         
@@ -92,6 +96,9 @@ class MainWindow(QMainWindow):
         self.pipeline = None
         self.pipeline_worker = None
 
+        # Watch mode: değişen scriptleri yeniden çıkarıp yeni metinleri strings.rpy'ye ekler
+        self._project_watcher = None
+
         # State
         self.current_directory = None
         self.extracted_texts = []
@@ -217,6 +224,13 @@ class MainWindow(QMainWindow):
         redownload_unren_action = QAction(self.config_manager.get_ui_text("redownload_unren_menu"), self)
         redownload_unren_action.triggered.connect(self.handle_unren_redownload)
         tools_menu.addAction(redownload_unren_action)
+
+        tools_menu.addSeparator()
+
+        self.watch_action = QAction(self.config_manager.get_ui_text("watch_project_menu"), self)
+        self.watch_action.setCheckable(True)
+        self.watch_action.toggled.connect(self.toggle_project_watch)
+        tools_menu.addAction(self.watch_action)
         
         # Help menu
         help_menu = menubar.addMenu(self.config_manager.get_ui_text("help_menu"))
@@ -657,6 +671,76 @@ class MainWindow(QMainWindow):
         # Process next language if any
         self._start_next_language()
     
+    def toggle_project_watch(self, enabled: bool):
+        """Tools > Watch project: yalnızca değişen scriptleri yeniden tarayıp yeni metinleri ekle."""
+        if not enabled:
+            self._stop_project_watch()
+            return
+
+        from src.core.project_watcher import ProjectWatcher
+        from src.core.translation_pipeline import TranslationPipeline
+
+        dir_path = self.directory_input.text().strip()
+        target_langs = self._get_selected_languages()
+        game_dir = None
+        writers = {}
+        if dir_path and os.path.isdir(dir_path) and target_langs:
+            # Her hedef dil için bir strings.rpy yazıcısı (proje yolu pipeline ile aynı şekilde normalize edilir)
+            for lang in target_langs:
+                writer = TranslationPipeline(self.config_manager, self.translation_manager)
+                writer.configure(game_exe_path=dir_path, target_language=lang)
+                writers[lang] = writer
+            game_dir = os.path.join(writers[target_langs[0]].project_path, 'game')
+        if not game_dir or not os.path.isdir(game_dir):
+            QMessageBox.warning(self, self.config_manager.get_ui_text("warning"), self.config_manager.get_ui_text("watch_no_project"))
+            self.watch_action.setChecked(False)
+            return
+
+        watcher = ProjectWatcher(
+            RenPyParser(config_manager=self.config_manager),
+            game_dir,
+            interval=self.config_manager.app_settings.watch_poll_interval,
+        )
+        self._project_watcher = watcher
+
+        def worker():
+            try:
+                # İlk yoklama mevcut durumu indeksler (cache'ten), tl klasörleri de bir kez okunur;
+                # bundan sonra yalnızca farklar işlenir
+                watcher.poll()
+                for writer in writers.values():
+                    writer.append_new_strings((), game_dir)
+            except Exception as exc:  # noqa: BLE001
+                self.logger.error("Watch mode failed to start: %s", exc)
+                self._post_to_main_thread(lambda: self.watch_action.setChecked(False))
+                return
+            message = (self.config_manager.get_ui_text("watch_started")
+                       .replace("{path}", game_dir)
+                       .replace("{count}", str(len(watcher.index))))
+            self._post_to_main_thread(lambda: self._add_log("info", message))
+            watcher.watch(lambda delta: self._apply_watch_delta(delta, writers, game_dir))
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def _apply_watch_delta(self, delta, writers, game_dir: str):
+        """Watch thread: yeni metinleri strings.rpy dosyalarına ekle, özeti ana thread'de logla."""
+        written = 0
+        for lang, writer in writers.items():
+            if os.path.isdir(os.path.join(game_dir, 'tl', lang)):
+                written += writer.append_new_strings(delta.added, game_dir)
+        message = (self.config_manager.get_ui_text("watch_delta")
+                   .replace("{files}", str(len(delta.files)))
+                   .replace("{added}", str(len(delta.added)))
+                   .replace("{removed}", str(len(delta.removed)))
+                   .replace("{written}", str(written)))
+        self._post_to_main_thread(lambda: self._add_log("info", message))
+
+    def _stop_project_watch(self):
+        if self._project_watcher is not None:
+            self._project_watcher.stop()
+            self._project_watcher = None
+            self._add_log("info", self.config_manager.get_ui_text("watch_stopped"))
+
     # Sonuç ve log panelleri artık ana pencerede gösterilmiyor.
     
     def populate_language_combo(self, combo: QComboBox, include_auto: bool = False):
@@ -926,29 +1010,34 @@ class MainWindow(QMainWindow):
             
             if use_deep_scan or use_rpyc:
                 self.status_label.setText(self.config_manager.get_ui_text("scanning_directory") + " (Deep/RPYC)...")
-                # Use combined extraction
-                combined_results = self.parser.extract_combined(
-                    target_dir,
-                    include_rpy=True,
-                    include_rpyc=use_rpyc,
-                    include_deep_scan=use_deep_scan,
-                    recursive=True
-                )
-                # Flatten results
-                self.extracted_texts = []
-                for file_entries in combined_results.values():
-                    self.extracted_texts.extend(file_entries)
                 processing_mode = "combined (Deep/RPYC)"
             else:
-                # Standard scan
-                self.extracted_texts = self.parser.parse_directory(target_dir)
                 processing_mode = "sequential"
 
+            # Stream entries file by file so the counter moves while large projects are scanned.
+            # Combined mode keeps to scripts (+ .rpyc); the standard scan also reads data files.
+            self.extracted_texts = []
+            for entry in self.parser.iter_text_entries(
+                target_dir,
+                include_deep_scan=use_deep_scan,
+                include_data_files=not (use_deep_scan or use_rpyc),
+                include_rpyc=use_rpyc,
+                recursive=True,
+            ):
+                self.extracted_texts.append(entry)
+                if len(self.extracted_texts) % 500 == 0:
+                    self.texts_label.setText(
+                        self.config_manager.get_ui_text("texts_status").format(count=len(self.extracted_texts))
+                    )
+                    self.texts_label.repaint()
+
             # Update status
             self.files_label.setText(self.config_manager.get_ui_text("files_status").format(count=len(rpy_files)))
             self.texts_label.setText(self.config_manager.get_ui_text("texts_status").format(count=len(self.extracted_texts)))
             self.status_label.setText(f"{self.config_manager.get_ui_text('directory_scanned')} ({processing_mode})")
             self._last_scanned_dir = self.current_directory
+            self._last_scan_root = Path(target_dir)
+            self._last_scan_kinds = ('entries',) + (('deep_scan',) if use_deep_scan else ()) + (('rpyc',) if use_rpyc else ())
             if self.extracted_texts and self._last_auto_unren_dir:
                 try:
                     if self.current_directory and self.current_directory.resolve() == self._last_auto_unren_dir:
@@ -1464,6 +1553,9 @@ class MainWindow(QMainWindow):
         """Write a simple extracted-texts report to a .txt file and return its path.
 
         This replaces the old 'Extracted Texts' tab with a file-based log.
+        Scanned scripts are listed from the extraction store (the rows the
+        translation pipeline reads too); files the store does not hold (data
+        files, or every file when the cache is off) come from the scan itself.
         """
         if not self.extracted_texts:
             return None
@@ -1474,23 +1566,43 @@ class MainWindow(QMainWindow):
             current_time = time.strftime("%Y%m%d_%H%M%S")
             report_file = logs_dir / f"extracted_texts_{current_time}.txt"
 
+            scanned = {os.path.normcase(os.path.abspath(str(item.get("file_path", "")))) for item in self.extracted_texts}
+            stored_paths = set()
+            total = 0
+            cache = self.parser.get_extraction_cache()
             with open(report_file, "w", encoding="utf-8") as f:
-                f.write("# Extracted texts report\n")
-                f.write(f"# Total texts: {len(self.extracted_texts)}\n\n")
+                f.write("# Extracted texts report\n\n")
+                if cache is not None and self._last_scan_root is not None:
+                    for fpath, line, ttype, text in cache.iter_project_texts(
+                        self._last_scan_root, kind_fingerprints(self.config_manager), self._last_scan_kinds
+                    ):
+                        if fpath not in scanned:
+                            continue
+                        stored_paths.add(fpath)
+                        f.write(self._format_report_line(fpath, line, ttype, text))
+                        total += 1
                 for item in self.extracted_texts:
-                    line = item.get("line_number", "?")
                     fpath = item.get("file_path", "?")
-                    ttype = item.get("type", "?")
-                    text = (item.get("text", "") or "").replace("\n", " ")
-                    if len(text) > 150:
-                        text = text[:150] + "..."
-                    f.write(f"{fpath}:{line} | {ttype} | {text}\n")
+                    if os.path.normcase(os.path.abspath(str(fpath))) in stored_paths:
+                        continue
+                    f.write(self._format_report_line(
+                        fpath, item.get("line_number"), item.get("type"), item.get("text", "")
+                    ))
+                    total += 1
+                f.write(f"\n# Total texts: {total}\n")
 
             return str(report_file)
         except Exception as e:
             self.logger.warning(f"Error writing extracted texts report: {e}")
             return None
     
+    @staticmethod
+    def _format_report_line(fpath, line, ttype, text) -> str:
+        text = (text or "").replace("\n", " ")
+        if len(text) > 150:
+            text = text[:150] + "..."
+        return f"{fpath}:{line if line is not None else '?'} | {ttype or '?'} | {text}\n"
+
     def auto_save_translations(self):
         """Automatically save translations to default location."""
         if not self.translation_results:
@@ -1751,6 +1863,9 @@ class MainWindow(QMainWindow):
         # Stop any running translation
         if self.translation_worker:
             self.stop_translation()
+
+        # Stop watch mode
+        self._stop_project_watch()
         
         # Save settings
         self.save_settings()
@@ -138,6 +138,7 @@ class TranslationWorker(QObject):
                         'original_text': original_text,  # Store original text
                         'placeholder_map': placeholder_map,  # Store placeholder mapping
                         'processed_text': processed_text,
+                        'translatable': text_data.get('translatable'),
                     }
                 )
                 requests.append(request)
@@ -175,27 +176,25 @@ class TranslationWorker(QObject):
                 
                 # No OPUS-MT model download handling — OPUS-MT engine removed
                 
-                # CRITICAL: Restore placeholders in translated text
+                # CRITICAL: Restore placeholders in translated text (whole batch at once)
+                to_restore = [
+                    result for result in batch_results
+                    if result.success and result.translated_text and result.metadata.get('placeholder_map')
+                ]
+                restored_texts = self.parser.restore_placeholders_batch(
+                    (result.translated_text, result.metadata['placeholder_map']) for result in to_restore
+                )
+                for result, restored_text in zip(to_restore, restored_texts):
+                    result.translated_text = restored_text
+                    # Update original text to the real original
+                    result.original_text = result.metadata.get('original_text', result.original_text)
+                if to_restore:
+                    self.logger.debug(f"Restored placeholders in {len(to_restore)} translated texts")
+
                 for result in batch_results:
                     if result.success and result.translated_text:
-                        # Get placeholder map from metadata
-                        placeholder_map = result.metadata.get('placeholder_map', {})
-                        original_text = result.metadata.get('original_text', result.original_text)
-                        
                         # Copy text_type from metadata to result
                         result.text_type = result.metadata.get('type', None)
-                        
-                        if placeholder_map:
-                            # Restore placeholders in translated text
-                            result.translated_text = self.parser.restore_placeholders(
-                                result.translated_text, placeholder_map
-                            )
-                            
-                            # Update original text to the real original
-                            result.original_text = original_text
-                            
-                            # Log restoration
-                            self.logger.debug(f"Restored {len(placeholder_map)} placeholders in translated text")
 
                         # Apply glossary replacements (post-processing)
                         if self.glossary:
@@ -132,6 +132,8 @@ class TranslationSettings:
     enable_deep_scan: bool = True  # Varsayılan artık açık (gizli string taraması)
     # RPYC Reader: Derlenmiş .rpyc dosyalarını AST ile doğrudan oku
     enable_rpyc_reader: bool = True  # Varsayılan artık açık (derlenmiş .rpyc okuma)
+    # .rpy ve .rpyc birlikteyse: 'auto' = script başına tek kaynak, 'both' = ikisi de (kapsam denetimi)
+    rpyc_source_mode: str = "auto"
     # Include renpy/common from installed Ren'Py SDKs (optional)
     include_engine_common: bool = True
 
@@ -159,6 +161,18 @@ class AppSettings:
     output_format: str = "old_new"
     # Parser workers for parallel file processing
     parser_workers: int = 4
+    # Persistent extraction cache (unchanged files are not parsed again)
+    extraction_cache_enabled: bool = True
+    extraction_cache_dir: str = ""  # Boşsa kullanıcı cache klasörü kullanılır
+    # Data file admission for directory scans (.txt/.csv/.json/.yaml/.xml/.ini); 0 = no ceiling
+    data_file_max_mb: float = 8.0  # Larger .txt/.csv files are only sampled
+    data_file_sample_mb: float = 1.0  # Head of an oversized .txt/.csv that is parsed
+    structured_data_max_mb: float = 64.0  # Larger .json/.yaml/.xml/.ini files are skipped
+    data_file_skip_patterns: list = None  # Boşsa varsayılan log/lisans/dump listesi kullanılır
+    # Out-of-core mode: above this many entries the pipeline spills to a temp SQLite file; 0 = never
+    out_of_core_threshold: int = 200000
+    # Watch mode (Tools > Watch project): seconds between polls of the game folder
+    watch_poll_interval: float = 1.0
     # UnRen integration
     unren_auto_download: bool = True
     unren_custom_path: str = ""
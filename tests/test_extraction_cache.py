@@ -0,0 +1,128 @@
+import os
+from types import SimpleNamespace
+
+from src.core.extraction_cache import ExtractionCache, get_extraction_cache, kind_fingerprints, settings_fingerprint
+from src.core.parser import RenPyParser
+from src.utils.config import AppSettings, TranslationSettings
+
+
+def _config(cache_dir, **filters):
+    return SimpleNamespace(
+        translation_settings=TranslationSettings(**filters),
+        app_settings=AppSettings(extraction_cache_dir=str(cache_dir)),
+        never_translate_rules={},
+    )
+
+
+def test_unchanged_file_is_served_from_cache(tmp_path):
+    script = tmp_path / "script.rpy"
+    script.write_text('label start:\n    e "Hello there, traveller."\n', encoding="utf-8")
+    parser = RenPyParser(_config(tmp_path / "cache"))
+    cache = parser.get_extraction_cache()
+
+    first = parser.extract_text_entries(script)
+    second = parser.extract_text_entries(script)
+    assert second == first
+    assert cache.stats() == {'hits': 1, 'misses': 1}
+
+    # Touched without changes: still a hit through the content hash
+    os.utime(script, ns=(0, 1))
+    assert parser.extract_text_entries(script) == first
+    assert cache.stats()['hits'] == 2
+
+    script.write_text('label start:\n    e "A different line entirely."\n', encoding="utf-8")
+    changed = parser.extract_text_entries(script)
+    assert [e['text'] for e in changed] == ["A different line entirely."]
+
+
+def test_filter_fingerprint_separates_results(tmp_path):
+    script = tmp_path / "screens.rpy"
+    script.write_text('screen test:\n    text "Quit the game now"\n', encoding="utf-8")
+    cache_dir = tmp_path / "cache"
+    hidden = RenPyParser(_config(cache_dir, translate_ui=False))
+    shown = RenPyParser(_config(cache_dir, translate_ui=True))
+    assert settings_fingerprint(hidden.config) != settings_fingerprint(shown.config)
+
+    assert hidden.extract_text_entries(script) == []
+    assert [e['text'] for e in shown.extract_text_entries(script)] == ["Quit the game now"]
+    assert hidden.extract_text_entries(script) == []
+
+
+def test_cache_disabled_without_config(tmp_path):
+    assert RenPyParser().get_extraction_cache() is None
+    conf = _config(tmp_path)
+    conf.app_settings.extraction_cache_enabled = False
+    assert get_extraction_cache(conf) is None
+
+
+def test_stale_record_is_not_served(tmp_path):
+    source = tmp_path / "data.rpy"
+    source.write_text("x", encoding="utf-8")
+    cache = ExtractionCache(tmp_path / "cache")
+    cache.store(source, 'entries', 'fp', [{'text': 'old', 'file_path': 'elsewhere'}])
+    assert cache.lookup(source, 'entries', 'fp') == [{'text': 'old', 'file_path': str(source)}]
+    assert cache.lookup(source, 'deep_scan', 'fp') is None
+    source.write_text("xy", encoding="utf-8")
+    assert cache.lookup(source, 'entries', 'fp') is None
+
+
+def test_legacy_encoding_is_remembered(tmp_path):
+    from src.core.parser import remembered_encoding
+
+    game = tmp_path / "game"
+    game.mkdir()
+    line = '    e "Çok güzel bir gün, değil mi? Şimdi öğretmen geliyor."\n'
+    first, second = game / "a.rpy", game / "b.rpy"
+    for script in (first, second):
+        script.write_bytes(('label start:\n' + line * 20).encode('cp1254'))
+    parser = RenPyParser(_config(tmp_path / "cache"))
+
+    texts = [e['text'] for e in parser.extract_text_entries(first)]
+    assert texts[0] == line.strip()[3:-1]
+    assert remembered_encoding(second) == 'cp1254'
+    # The decision survives in the cache record for the next run
+    assert ExtractionCache(tmp_path / "cache").encoding_hint(first) == 'cp1254'
+    assert parser.extract_text_entries(second) == [
+        dict(e, file_path=str(second)) for e in parser.extract_text_entries(first)
+    ]
+
+
+def test_project_store_is_shared_and_queryable(tmp_path, monkeypatch):
+    game = tmp_path / "MyGame" / "game"
+    game.mkdir(parents=True)
+    script = game / "script.rpy"
+    script.write_text('label start:\n    e "Hello there, traveller."\n    e "Second line here."\n', encoding="utf-8")
+    conf = _config(tmp_path / "cache")
+
+    gui = RenPyParser(conf)
+    entries = gui.extract_text_entries(script)
+    # A second parser (the pipeline) on a fresh cache object reads the same database
+    pipeline_cache = ExtractionCache(tmp_path / "cache")
+    cached = pipeline_cache.lookup(script, 'entries', settings_fingerprint(conf))
+    assert [e['text'] for e in cached] == [e['text'] for e in entries]
+    assert len(list((tmp_path / "cache" / "projects").glob("*.sqlite"))) == 1
+
+    rows = list(pipeline_cache.iter_project_texts(game.parent, settings_fingerprint(conf), kinds=('entries',)))
+    assert [(row[1], row[3]) for row in rows] == [(2, "Hello there, traveller."), (3, "Second line here.")]
+    assert rows[0][0] == os.path.normcase(str(script))
+    assert list(pipeline_cache.iter_project_texts(game, 'other-fingerprint')) == []
+
+    # RPYC results are stored under the default fingerprint whatever the filters are
+    from src.core import rpyc_reader
+
+    compiled = game / "screens.rpyc"
+    compiled.write_bytes(b"RENPY RPC2")
+    record = ("Start the game.", 4, "ui", "", ("screen:main_menu",), str(compiled))
+    monkeypatch.setattr(rpyc_reader, "_extract_rpyc_records", lambda path: [record])
+    rpyc_reader.extract_texts_from_rpyc(compiled, cache=pipeline_cache)
+    rows = list(pipeline_cache.iter_project_texts(game, kind_fingerprints(conf), kinds=('rpyc', 'entries')))
+    assert [(row[0], row[1], row[3]) for row in rows] == [
+        (os.path.normcase(str(compiled)), 4, "Start the game."),
+        (os.path.normcase(str(script)), 2, "Hello there, traveller."),
+        (os.path.normcase(str(script)), 3, "Second line here."),
+    ]
+
+    script.write_text('label start:\n    e "Changed."\n', encoding="utf-8")
+    compiled.write_bytes(b"RENPY RPC2 changed")
+    assert list(pipeline_cache.iter_project_texts(game, kind_fingerprints(conf))) == []
+    assert pipeline_cache.clear() == 1
@@ -1,4 +1,8 @@
-from src.core.parser import RenPyParser
+import pickle
+
+import pytest
+
+from src.core.parser import EMPTY_PLACEHOLDER_MAP, RenPyParser, TextEntry
 from src.core.output_formatter import RenPyOutputFormatter
 
 
@@ -20,3 +24,301 @@ def test_skip_extensions_removed():
     # These extensions should NOT be in the skip list (we removed them)
     for ext in ['.json', '.txt', '.xml', '.csv']:
         assert ext not in f.SKIP_FILE_EXTENSIONS
+
+
+def test_parallel_extraction_matches_sequential(tmp_path):
+    for i in range(3):
+        (tmp_path / f"script_{i}.rpy").write_text(
+            f'label start_{i}:\n    e "Hello there number {i}."\n    "The narrator speaks {i}."\n',
+            encoding="utf-8",
+        )
+    p = RenPyParser()
+    sequential = p.extract_from_directory(tmp_path)
+    files = list(sequential)
+    pooled = p._extract_with_process_pool(files, 2)
+    assert pooled == sequential
+    assert p.extract_from_directory_parallel(tmp_path, max_workers=2) == sequential
+
+
+def _first_quoted_match(descriptors, line):
+    for descriptor in descriptors:
+        match = descriptor['regex'].match(line)
+        if match and match.groupdict().get('quote'):
+            return descriptor['type'], match.group('quote')
+    return None
+
+
+def test_line_dispatch_matches_full_registry_scan():
+    p = RenPyParser()
+    lines = [
+        '    e "Hello there."',
+        '    "Narration line."',
+        '    "Go left" if seen:',
+        '    extend "and more."',
+        '    textbutton _("History") action ShowMenu("history")',
+        '    textbutton "Start" action Start()',
+        '    text _("Title") size 40',
+        '    text "Plain"',
+        '    $ renpy.notify("Saved!")',
+        '    $ renpy.say(e, "Said.")',
+        'renpy.notify("Gold: " + str(gold))',
+        '    menu "Where to?":',
+        '    menuf"Where now?":',
+        '_("Column zero")',
+        '    define e = Character(_("Eileen"))',
+        '    define config.name = "My Game"',
+        '    gui.text_font = "DejaVuSans.ttf"',
+        '    style.default = "x"',
+        '    $ e "not dialogue"',
+        '    imagebutton idle "a.png" alt "Open door"',
+        '    store.title = "Hero"',
+    ]
+    for line in lines:
+        assert _first_quoted_match(p._candidate_patterns(line), line) == \
+            _first_quoted_match(p.pattern_registry, line), line
+    assert len(p._candidate_patterns('    e "Hello there."')) < len(p.pattern_registry)
+
+
+def test_compiled_patterns_are_shared_between_parsers():
+    first, second = RenPyParser(), RenPyParser()
+    assert first.pattern_registry is second.pattern_registry
+    assert first.label_def_re is second.label_def_re
+    with pytest.raises(TypeError):
+        first.pattern_registry[0]['type'] = 'ui'
+    # Config-dependent state stays per instance
+    first.DATA_KEY_WHITELIST.add('custom_key')
+    assert 'custom_key' not in second.DATA_KEY_WHITELIST
+
+
+def test_deep_scan_line_numbers_and_python_blocks(tmp_path):
+    script = tmp_path / "deep.rpy"
+    script.write_text(
+        'label start:\n'
+        '    e "Plain dialogue line."\n'
+        'init python:\n'
+        '    intro_text = """Welcome to the valley\n'
+        '    of endless summer."""\n'
+        'label after:\n'
+        '    $ motto = """Stay curious, traveller."""\n',
+        encoding="utf-8",
+    )
+    p = RenPyParser()
+    deep = {e['text']: e for e in p.deep_scan_strings(script)}
+    intro = deep["Welcome to the valley\n    of endless summer."]
+    assert intro['line_number'] == 4
+    assert intro['text_type'] == 'python_string'
+    motto = deep["Stay curious, traveller."]
+    assert motto['line_number'] == 7
+    assert motto['text_type'] == 'deep_scan'
+
+    combined = p.extract_with_deep_scan(script)
+    assert combined == p.extract_text_entries(script) + p.deep_scan_strings(script)
+
+
+def test_iter_text_entries_streams_file_by_file(tmp_path):
+    (tmp_path / "a.rpy").write_text('label a:\n    e "First file line."\n', encoding="utf-8")
+    (tmp_path / "b.rpy").write_text(
+        'label b:\n    e "Second file line."\ninit python:\n    motto = """Hidden python motto."""\n',
+        encoding="utf-8",
+    )
+    (tmp_path / "data.json").write_text('{"title": "Data file title"}', encoding="utf-8")
+    p = RenPyParser()
+
+    stream = p.iter_text_entries(tmp_path)
+    first = next(stream)
+    assert first['text'] == "First file line."
+    assert first['file_path'] == str(tmp_path / "a.rpy")
+    rest = [e['text'] for e in stream]
+    assert rest == ["Second file line.", "Data file title"]
+
+    assert dict(p.iter_file_entries(tmp_path)) == p.parse_directory(tmp_path)
+
+    deep_only = list(p.iter_text_entries(tmp_path, include_rpy=False, include_deep_scan=True,
+                                         include_data_files=False))
+    assert "Hidden python motto." in [e['text'] for e in deep_only]
+    assert all(e['is_deep_scan'] for e in deep_only)
+
+
+def test_text_entries_are_compact_but_dict_compatible(tmp_path):
+    script = tmp_path / "script.rpy"
+    script.write_text('label start:\n    e "One line."\n    e "Two [name] line."\n', encoding="utf-8")
+    first, second = RenPyParser().extract_text_entries(script)
+
+    assert isinstance(first, TextEntry)
+    assert first['text'] == "One line." and first.get('is_deep_scan') is None
+    assert 'is_deep_scan' not in first
+    assert dict(first) == {
+        'text': "One line.", 'line_number': 2, 'context_line': 'e "One line."',
+        'character': 'e', 'text_type': first['text_type'], 'context_path': first['context_path'],
+        'processed_text': "One line.", 'placeholder_map': {}, 'file_path': str(script),
+    }
+
+    # Repeated values are shared instead of copied per entry
+    assert first['context_path'] is second['context_path']
+    assert first['file_path'] is second['file_path']
+    assert first['placeholder_map'] is EMPTY_PLACEHOLDER_MAP
+    assert second['placeholder_map'] and second['placeholder_map'] is not EMPTY_PLACEHOLDER_MAP
+
+    first['is_engine_common'] = True
+    first['custom'] = 1
+    assert first == {**dict(first), 'custom': 1}
+    assert pickle.loads(pickle.dumps(first)) == first
+    with pytest.raises(TypeError):
+        first['placeholder_map']['x'] = 'y'
+
+
+def test_text_classifier_is_shared_per_settings(tmp_path):
+    from types import SimpleNamespace
+
+    from src.core.parser import get_text_classifier
+    from src.utils.config import AppSettings, TranslationSettings
+
+    def config(**filters):
+        return SimpleNamespace(
+            translation_settings=TranslationSettings(**filters),
+            app_settings=AppSettings(extraction_cache_enabled=False),
+            never_translate_rules={'exact': ["Secret Door"]},
+        )
+
+    ui_on, ui_off = config(translate_ui=True), config(translate_ui=False)
+    assert get_text_classifier(ui_on) is get_text_classifier(config(translate_ui=True))
+    classifier = get_text_classifier(ui_off)
+    assert classifier is not get_text_classifier(ui_on)
+
+    items = [("Open the map", 'ui', ''), ("Open the map", 'dialogue', ''), ("Secret Door", 'dialogue', ''),
+             ("images/bg.png", 'dialogue', ''), ("Secret Door", 'translatable_string', ''),
+             ("Forest", 'python_string', 'jump("Forest")'), ("Forest", 'python_string', 'x = "Forest"')]
+    # Context rules apply like in should_translate: label names after jump/call are not translated
+    assert classifier.classify_batch(items) == [False, True, False, False, True, False, True]
+    assert classifier.classify_batch(items) == [classifier.should_translate(*item) for item in items]
+    assert classifier.memo_info().currsize >= 5
+
+    # Label names after jump/call are filtered using the entry's context line
+    p = RenPyParser(config(translate_renpy_functions=True))
+    assert not p._should_translate_text("Forest", 'renpy_func', '$ renpy.jump("Forest")')
+    assert p._should_translate_text("Into the forest", 'renpy_func', '$ renpy.jump("Into the forest")')
+
+    script = tmp_path / "script.rpy"
+    script.write_text('label start:\n    e "Hello there, traveller."\n', encoding="utf-8")
+    assert p.extract_text_entries(script)[0]['translatable'] is True
+    assert 'translatable' not in RenPyParser().extract_text_entries(script)[0]
+
+
+def test_placeholders_single_pass_roundtrip():
+    p = RenPyParser()
+    text = "Hi [name], {b}[a]{/b} and [a] %s {#menu} {color=[col]}x{/color} [mood!t]"
+    processed, placeholder_map = p.preserve_placeholders(text)
+    assert '[' not in processed and '{' not in processed and '%s' not in processed
+    # Historical numbering: disambiguation tags first, then variables, tags, formats
+    assert placeholder_map['⟦D000⟧'] == '{#menu}'
+    assert placeholder_map['⟦V001⟧'] == '[name]'
+    assert placeholder_map['⟦VT004⟧'] == '[mood!t]'
+    assert placeholder_map['⟦T006⟧'] == '{/b}'
+    # Tags that contain variables are protected as a whole
+    assert '{color=[col]}' in placeholder_map.values()
+
+    assert p.restore_placeholders(processed, placeholder_map) == text
+    mangled = processed.replace('⟦V001⟧', '⟦ V001 ⟧').replace('⟦D000⟧', '[D000]').replace('⟦F005⟧', '【F005】')
+    assert p.restore_placeholders(mangled, placeholder_map) == text
+
+    batch = p.preserve_placeholders_batch(["Plain text", text])
+    assert batch[0] == ("Plain text", {}) and batch[1] == (processed, placeholder_map)
+    assert p.restore_placeholders_batch([(processed, placeholder_map), ("Hello", {})]) == [text, "Hello"]
+
+
+def test_data_files_are_streamed(tmp_path, monkeypatch):
+    import src.core.parser as parser_module
+
+    # Tiny chunks force every token across a read boundary
+    monkeypatch.setattr(parser_module, "DATA_READ_CHUNK", 3)
+    p = RenPyParser()
+    data = tmp_path / "items.json"
+    data.write_text(
+        '{"items": [{"id": 1, "name": "Old sword", "price": -1.5e3},'
+        ' {"name": "Healing \\"potion\\"", "icon": "a.png"}], "title": "Shop"}',
+        encoding="utf-8",
+    )
+    assert [(e['text'], e['context_line']) for e in p.extract_from_json(data)] == [
+        ("Old sword", "json:items[0].name"),
+        ('Healing "potion"', "json:items[1].name"),
+        ("Shop", "json:title"),
+    ]
+    data.write_text('{"name": "Broken", ', encoding="utf-8")
+    assert p.extract_from_json(data) == []
+
+    quests = tmp_path / "quests.yaml"
+    quests.write_text(
+        "base: &b {title: Find the key, id: 7}\n"
+        "quests:\n  - *b\n  - {<<: *b, desc: 'Open the door'}\n",
+        encoding="utf-8",
+    )
+    assert [e['context_line'] for e in p.extract_from_yaml(quests)] == [
+        "yaml:base.title", "yaml:quests[0].title", "yaml:quests[1].title", "yaml:quests[1].desc",
+    ]
+
+    book = tmp_path / "book.xml"
+    book.write_text("<book><title>Intro<name>Ana</name>After name</title><text>End</text></book>", encoding="utf-8")
+    assert [(e['text'], e['context_line']) for e in p.extract_from_xml(book)] == [
+        ("Intro", "xml:book/title"),
+        ("Ana", "xml:book/title/name"),
+        ("After name", "xml:book/title/name_tail"),
+        ("End", "xml:book/text"),
+    ]
+
+
+def test_data_file_admission(tmp_path):
+    from types import SimpleNamespace
+
+    from src.core.parser import ADMIT_SAMPLE, ADMIT_SKIP
+    from src.utils.config import AppSettings
+
+    game = tmp_path / "game"
+    game.mkdir()
+    (game / "items.json").write_text('{"name": "Iron sword"}', encoding="utf-8")
+    (game / "traceback.txt").write_text("Exception: boom\n", encoding="utf-8")
+    (game / "save_blob.txt").write_bytes(bytes(range(256)) * 8)
+    (game / "stats.csv").write_text("\n".join("1,2,3,4,5,6" for _ in range(100)), encoding="utf-8")
+    (game / "notes.txt").write_text("First note line\n" * 200 + "Last note line\n", encoding="utf-8")
+
+    conf = SimpleNamespace(app_settings=AppSettings(
+        extraction_cache_enabled=False, data_file_max_mb=0.001, data_file_sample_mb=0.0005,
+    ))
+    p = RenPyParser(conf)
+    results = {path.name: entries for path, entries in p.iter_file_entries(game)}
+
+    assert [e['text'] for e in results["items.json"]] == ["Iron sword"]
+    notes = [e['text'] for e in results["notes.txt"]]
+    assert notes and len(notes) < 201 and "Last note line" not in notes
+    report = {path.name: decision for path, decision in p.admission_report}
+    assert set(report) == {"traceback.txt", "save_blob.txt", "stats.csv", "notes.txt"}
+    assert report["notes.txt"].action == ADMIT_SAMPLE
+    assert all(report[name].action == ADMIT_SKIP for name in ("traceback.txt", "save_blob.txt", "stats.csv"))
+    assert "traceback.txt" not in results
+
+
+def test_long_lines_use_quote_guard(tmp_path, monkeypatch):
+    import src.core.parser as parser_module
+
+    lines = [
+        'label start:',
+        '    $ renpy.notify("' + '\\"' * 3000,
+        '    e "Hello there" ' + "# it\\'s " * 400,
+        '    $ items = ["Sword", "Shield"] + ' + '["\\\\"] * 1 + ' * 200,
+    ]
+    script = tmp_path / "long.rpy"
+    script.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    def extract(threshold):
+        monkeypatch.setattr(parser_module, "LONG_LINE_THRESHOLD", threshold)
+        p = RenPyParser()
+        entries = p._extract_text_entries_uncached(script)
+        deep = p._deep_scan_strings_uncached(script, normal_entries=entries)
+        return p, [dict(e) for e in entries], deep
+
+    p, entries, deep = extract(1000)
+    assert p.guarded_line_counts == {str(script): 3}
+    assert "Hello there" in [e['text'] for e in entries]
+    # Guarded matching gives the same results as the plain regexes
+    plain, plain_entries, plain_deep = extract(10 ** 9)
+    assert plain.guarded_line_counts == {}
+    assert (entries, deep) == (plain_entries, plain_deep)
@@ -0,0 +1,78 @@
+from src.core.parser import ProjectFileIndex, RenPyParser, get_file_index
+
+
+def _touch(path, content=""):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+
+
+def test_walker_prunes_tl_and_engine(tmp_path):
+    _touch(tmp_path / "script.rpy")
+    _touch(tmp_path / "sub" / "extra.rpy")
+    _touch(tmp_path / "sub" / "tl" / "nested.rpy")
+    _touch(tmp_path / "script.rpyc")
+    _touch(tmp_path / "data.json", "{}")
+    _touch(tmp_path / "images" / "bg.png")
+    _touch(tmp_path / "tl" / "turkish" / "script.rpy")
+    _touch(tmp_path / "renpy" / "display.rpy")
+    _touch(tmp_path / "renpy" / "common" / "00layout.rpy")
+
+    index = ProjectFileIndex(tmp_path)
+    rel = sorted(p.relative_to(tmp_path).as_posix() for p in index.files(".rpy"))
+    assert rel == ["renpy/common/00layout.rpy", "script.rpy", "sub/extra.rpy", "sub/tl/nested.rpy"]
+    assert [p.name for p in index.files(".rpyc")] == ["script.rpyc"]
+    assert index.has(".json") and not index.has(".png")
+    assert get_file_index(tmp_path, index) is index
+
+    flat = ProjectFileIndex(tmp_path, recursive=False)
+    assert [p.name for p in flat.files(".rpy")] == ["script.rpy"]
+
+
+def test_parse_directory_dispatches_by_suffix(tmp_path):
+    _touch(tmp_path / "script.rpy", 'label start:\n    e "Hello there, traveller."\n')
+    _touch(tmp_path / "items.json", '{"name": "Rusty Sword"}')
+    _touch(tmp_path / "tl" / "turkish" / "script.rpy", 'label start:\n    e "Ignored text here."\n')
+
+    results = RenPyParser().parse_directory(tmp_path)
+    assert sorted(p.name for p in results) == ["items.json", "script.rpy"]
+    texts = {e["text"] for entries in results.values() for e in entries}
+    assert texts == {"Hello there, traveller.", "Rusty Sword"}
+
+
+def _write_rpyc(path, source_bytes, mtime):
+    import hashlib
+    import os
+    import struct
+
+    payload = b"x" * 16
+    header = b"RENPY RPC2" + struct.pack("<III", 1, 34, len(payload)) + struct.pack("<III", 0, 0, 0)
+    path.write_bytes(header + payload + hashlib.md5(source_bytes).digest())
+    os.utime(path, (mtime, mtime))
+
+
+def test_script_source_plan_reads_each_script_once(tmp_path):
+    import os
+
+    from src.core.parser import SOURCE_MODE_BOTH
+
+    for name in ("same", "stale", "edited", "source_only"):
+        _touch(tmp_path / f"{name}.rpy", f'label {name}:\n    e "Text of {name}."\n')
+        os.utime(tmp_path / f"{name}.rpy", (1000, 1000))
+    _write_rpyc(tmp_path / "same.rpyc", (tmp_path / "same.rpy").read_bytes(), 2000)
+    _write_rpyc(tmp_path / "stale.rpyc", b"newer source", 2000)  # .rpy is an older version
+    _write_rpyc(tmp_path / "edited.rpyc", b"older source", 500)  # .rpy edited after compiling
+    _write_rpyc(tmp_path / "compiled_only.rpyc", b"", 2000)
+
+    index = ProjectFileIndex(tmp_path)
+    plan = index.script_sources()
+    assert sorted(p.name for p in plan.skipped) == ["edited.rpyc", "same.rpyc", "stale.rpy"]
+    assert (plan.pairs, plan.compiled) == (3, 1)
+    assert index.script_sources() is plan
+    assert not index.script_sources(SOURCE_MODE_BOTH).skipped
+
+    p = RenPyParser()
+    read = []
+    p.extract_from_rpyc = lambda path: read.append(path.name) or []
+    parsed = [path.name for path, _ in p.iter_file_entries(tmp_path, include_rpyc=True, file_index=index)]
+    assert parsed == ["edited.rpy", "same.rpy", "source_only.rpy"]
+    assert read == ["compiled_only.rpyc", "stale.rpyc"]
@@ -0,0 +1,90 @@
+import os
+import sys
+import types
+from types import SimpleNamespace
+
+from src.core.parser import RenPyParser
+from src.core.project_watcher import ProjectWatcher
+
+
+def _write(path, lines, mtime_ns):
+    path.write_text('label start:\n' + ''.join(f'    e "{line}"\n' for line in lines), encoding='utf-8')
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_watcher_emits_only_changed_texts(tmp_path):
+    _write(tmp_path / 'a.rpy', ['Good morning, Eileen.', 'Shared line of dialogue.'], 10**9)
+    _write(tmp_path / 'b.rpy', ['Shared line of dialogue.', 'Where are we going?'], 10**9)
+    watcher = ProjectWatcher(RenPyParser(), tmp_path, include_deep_scan=False, include_rpyc=False)
+
+    first = watcher.poll()
+    assert sorted(e['text'] for e in first.added) == [
+        'Good morning, Eileen.', 'Shared line of dialogue.', 'Where are we going?',
+    ]
+    assert not watcher.poll()
+
+    # Editing a file: only its new line is added, the line it dropped is still in b.rpy
+    _write(tmp_path / 'a.rpy', ['Good evening, Eileen.'], 2 * 10**9)
+    delta = watcher.poll()
+    assert [e['text'] for e in delta.added] == ['Good evening, Eileen.']
+    assert delta.added[0]['file_path'] == str(tmp_path / 'a.rpy')
+    assert delta.removed == ['Good morning, Eileen.']
+    assert delta.files == [tmp_path / 'a.rpy']
+
+    # Deleting a file removes the texts no other file produces
+    (tmp_path / 'b.rpy').unlink()
+    delta = watcher.poll()
+    assert delta.added == []
+    assert sorted(delta.removed) == ['Shared line of dialogue.', 'Where are we going?']
+    assert watcher.index.texts() == ['Good evening, Eileen.']
+
+
+def _pipeline(monkeypatch):
+    """TranslationPipeline, with a QtCore stand-in when no Qt binding is installed."""
+    try:
+        import PyQt6.QtCore  # noqa: F401
+    except ImportError:
+        try:
+            import PySide6.QtCore  # noqa: F401
+        except ImportError:
+            qtcore = types.ModuleType('PyQt6.QtCore')
+            qtcore.QObject = qtcore.QThread = type('QObject', (), {'__init__': lambda self, *args, **kwargs: None})
+            qtcore.pyqtSignal = lambda *args: SimpleNamespace(emit=lambda *emitted: None)
+            monkeypatch.setitem(sys.modules, 'PyQt6.QtCore', qtcore)
+            monkeypatch.delitem(sys.modules, 'src.core.translation_pipeline', raising=False)
+    from src.core.translation_pipeline import TranslationPipeline
+
+    pipeline = TranslationPipeline(SimpleNamespace(), None)
+    pipeline.target_language = 'turkish'
+    return pipeline
+
+
+def test_append_new_strings_never_defines_a_text_twice(tmp_path, monkeypatch):
+    game = tmp_path / 'game'
+    tl_dir = game / 'tl' / 'turkish'
+    tl_dir.mkdir(parents=True)
+    (tl_dir / 'script.rpy').write_text(
+        'translate turkish strings:\n\n    old "Already translated."\n    new "Zaten çevrildi."\n', encoding='utf-8'
+    )
+    strings_path = tl_dir / 'strings.rpy'
+
+    def entries(*texts):
+        source = str(game / 'script.rpy')
+        return [{'text': text, 'type': 'dialogue', 'file_path': source, 'line_number': 2} for text in texts]
+
+    pipeline = _pipeline(monkeypatch)
+    assert pipeline.append_new_strings(entries('Already translated.', 'Hello.', 'Hello.', 'World.'), str(game)) == 2
+    # Translator edited the file and dropped the final newline
+    strings_path.write_bytes(strings_path.read_bytes().rstrip(b'\n'))
+    assert pipeline.append_new_strings(entries('World.', 'New line.'), str(game)) == 1
+    # A new session reads the texts back from tl/ (BOM included)
+    assert _pipeline(monkeypatch).append_new_strings(entries('Hello.', 'New line.'), str(game)) == 0
+
+    raw = strings_path.read_bytes()
+    assert raw.startswith(b'\xef\xbb\xbf') and raw.count(b'\xef\xbb\xbf') == 1
+    content = raw.decode('utf-8-sig')
+    assert content.count('translate turkish strings:') == 1
+    assert [line.strip() for line in content.splitlines() if line.strip().startswith('old ')] == [
+        'old "Hello."', 'old "World."', 'old "New line."',
+    ]
+    assert '    new ""\n\n    # script.rpy:2\n    old "New line."' in content
@@ -28,3 +28,173 @@ def test_fake_argument_and_parameter_info_setstate():
     pi = rr.FakeParameterInfo()
     pi.__setstate__(({"parameters": [("p", None)]},))
     assert isinstance(pi.parameters, list)
+
+
+def _write_rpyc(path, lines, monkeypatch):
+    import pickle
+    import struct
+    import sys
+    import types
+    import zlib
+
+    renpy = types.ModuleType("renpy")
+    ast = types.ModuleType("renpy.ast")
+    renpy.ast = ast
+    monkeypatch.setitem(sys.modules, "renpy", renpy)
+    monkeypatch.setitem(sys.modules, "renpy.ast", ast)
+    say_cls = type("Say", (), {"__module__": "renpy.ast"})
+    ast.Say = say_cls
+
+    nodes = []
+    for number, line in enumerate(lines, start=2):
+        say = say_cls()
+        say.who, say.what, say.linenumber, say.filename = "e", line, number, "game/script.rpy"
+        nodes.append(say)
+    data = zlib.compress(pickle.dumps(({"version": 5003000}, nodes), protocol=2))
+    header = b"RENPY RPC2" + struct.pack("<III", 1, 46, len(data)) + struct.pack("<III", 0, 0, 0)
+    path.write_bytes(header + b"\0" * (46 - len(header)) + data)
+
+
+def test_parallel_directory_extraction_matches_sequential(tmp_path, monkeypatch):
+    for index in range(3):
+        _write_rpyc(tmp_path / f"script{index}.rpyc", [f"Line {index}.{n} of the story." for n in range(20)], monkeypatch)
+    (tmp_path / "broken.rpyc").write_bytes(b"RENPY RPC2 not really")
+    monkeypatch.setattr(rr, "RPYC_PARALLEL_MIN_BYTES", 0)
+
+    sequential = rr.extract_texts_from_rpyc_directory(tmp_path, workers=1)
+    parallel = rr.extract_texts_from_rpyc_directory(tmp_path, workers=2)
+
+    assert list(parallel) == list(sequential)
+    assert {path: [dict(e) for e in entries] for path, entries in parallel.items()} == {
+        path: [dict(e) for e in entries] for path, entries in sequential.items()
+    }
+    assert parallel[tmp_path / "broken.rpyc"] == []
+    assert [e["text"] for e in parallel[tmp_path / "script1.rpyc"]][:2] == [
+        "Line 1.0 of the story.", "Line 1.1 of the story.",
+    ]
+
+
+def test_read_rpyc_file_streams_and_reports_truncation(tmp_path, monkeypatch):
+    path = tmp_path / "script.rpyc"
+    _write_rpyc(path, [f"Line {n}." for n in range(2000)], monkeypatch)
+    monkeypatch.setattr(rr, "RPYC_INFLATE_INPUT_CHUNK", 256)
+
+    nodes = rr.read_rpyc_file(path)
+    assert [node.what for node in nodes][-1] == "Line 1999."
+
+    data = path.read_bytes()
+    path.write_bytes(data[: len(data) // 2])
+    with pytest.raises(rr.RpycReadError, match="Decompression failed"):
+        rr.read_rpyc_file(path)
+
+
+def test_identical_rpyc_is_decoded_once_across_projects(tmp_path, monkeypatch):
+    from src.core.extraction_cache import ExtractionCache
+
+    first = tmp_path / "one" / "game" / "screens.rpyc"
+    second = tmp_path / "two" / "game" / "screens.rpyc"
+    for path in (first, second):
+        path.parent.mkdir(parents=True)
+        _write_rpyc(path, ["Start the game.", "Quit the game."], monkeypatch)
+
+    cache = ExtractionCache(tmp_path / "cache")
+    expected = rr.extract_texts_from_rpyc(second)
+    rr.extract_texts_from_rpyc(first, cache=cache)
+    monkeypatch.setattr(rr, "_extract_rpyc_records", lambda path: pytest.fail("decoded twice"))
+
+    assert rr.extract_texts_from_rpyc(second, cache=cache) == expected
+    assert expected[0]["source_file"] == str(second)
+    assert cache.shared_hits == 1
+
+
+def test_ast_walker_handles_deep_nesting_in_source_order():
+    def say(text, line):
+        node = rr.FakeSay()
+        node.who, node.what, node.linenumber = "e", text, line
+        return node
+
+    menu = rr.FakeMenu()
+    menu.linenumber = 3
+    menu.items = [("Go left", "True", [say("You went left.", 4)]), ("Go right", "True", [say("You went right.", 6)])]
+    block = [say("Deepest line.", 1), menu]
+    for depth in range(3000):
+        node = rr.FakeIf()
+        node.entries = [("flag", block), ("True", [say(f"Else {depth}.", 2)])] if depth < 2 else [("flag", block)]
+        block = [node]
+
+    label = rr.FakeLabel()
+    label.name, label.block = "start", block
+
+    extractor = rr.ASTTextExtractor()
+    extractor._walk_nodes([label])
+
+    assert [e.text for e in extractor.extracted] == [
+        "Deepest line.", "Go left", "You went left.", "Go right", "You went right.", "Else 0.", "Else 1.",
+    ]
+    assert extractor.nodes_visited == 1 + 3000 + 2 + 2 + 2
+
+
+def test_add_text_replaces_contextless_duplicate_in_place_of_a_new_entry():
+    extractor = rr.ASTTextExtractor()
+    extractor.current_file = "game/screens.rpyc"
+    for text in ("Start", "Load", "Quit"):
+        extractor._add_text(text, 1, "ui")
+    extractor._add_text("Load", 7, "ui", context="label:start")
+    extractor._add_text("Load", 9, "ui", context="label:other")
+
+    assert [(e.text, e.line_number) for e in extractor.extracted] == [("Start", 1), ("Quit", 1), ("Load", 7)]
+    assert extractor.extracted[-1].as_record() == ("Load", 7, "ui", "", ("label:start",), "game/screens.rpyc")
+    assert not hasattr(extractor.extracted[0], "__dict__")
+
+    extractor.extracted = []
+    assert extractor.extracted == []
+
+
+def test_selective_unpickling_keeps_only_extracted_state(monkeypatch):
+    import io
+    import pickle
+    import sys
+    import types
+
+    renpy, ast, store = (types.ModuleType(name) for name in ("renpy", "renpy.ast", "store"))
+    renpy.ast = ast
+    for module in (renpy, ast, store):
+        monkeypatch.setitem(sys.modules, module.__name__, module)
+    classes = {}
+    for module, name in ((ast, "Say"), (ast, "Show"), (store, "QuestItem")):
+        classes[name] = type(name, (), {"__module__": module.__name__})
+        setattr(module, name, classes[name])
+
+    say, show, first_item, second_item = classes["Say"](), classes["Show"](), classes["QuestItem"](), classes["QuestItem"]()
+    say.__dict__.update(who="e", what="Hello there.", linenumber=3, arguments=first_item, name=("script.rpy", 1, 2))
+    show.__dict__.update(imspec=("eileen",), atl=[second_item] * 10, linenumber=4)
+    data = pickle.dumps([say, show, second_item], protocol=2)
+
+    full = rr.RenpyUnpickler(io.BytesIO(data)).load()
+    lean = rr.RenpyUnpickler(io.BytesIO(data), selective=True).load()
+
+    assert isinstance(full[0].arguments, rr.FakeGeneric) and full[1].atl
+    assert isinstance(lean[0], rr.FakeSay)
+    assert vars(lean[0]) == {"who": "e", "what": "Hello there.", "linenumber": 3}
+    assert vars(lean[1]) == {"linenumber": 4}
+    assert lean[2] is rr.FakeDiscarded()
+
+
+def test_recurring_code_blocks_are_collected_once(monkeypatch):
+    rr._CODE_STRINGS_MEMO.clear()
+    calls = []
+    collect = rr.ASTTextExtractor._collect_code_strings
+    monkeypatch.setattr(
+        rr.ASTTextExtractor, "_collect_code_strings",
+        lambda self, code: calls.append(code) or collect(self, code),
+    )
+    code = 'quest_title = "Find the lost sword"\nrenpy.notify("Quest updated")'
+
+    first, second = rr.ASTTextExtractor(), rr.ASTTextExtractor()
+    first._extract_strings_from_code(code, 3)
+    second._extract_strings_from_code(code, 8)
+
+    assert len(calls) == 1
+    assert [e.text for e in second.extracted] == [e.text for e in first.extracted]
+    assert "Find the lost sword" in [e.text for e in first.extracted]
+    assert {e.line_number for e in second.extracted} == {8}
@@ -0,0 +1,46 @@
+import os
+
+from src.core.spill_store import SourceTextCollector, SpillStore
+
+
+def _entries():
+    return [
+        {'text': 'Start', 'file_path': 'game/screens.rpy', 'line_number': 1},
+        {'text': '', 'file_path': 'game/screens.rpy', 'line_number': 2},
+        {'text': 'Load', 'file_path': 'game/screens.rpy', 'line_number': 3},
+        {'text': 'Start', 'file_path': 'game/script.rpy', 'line_number': 4, 'is_deep_scan': True},
+        {'text': 'Quit', 'file_path': 'game/screens.rpy', 'line_number': 5},
+        {'text': 'Load', 'file_path': 'renpy/common/00gui.rpy', 'line_number': 6, 'is_engine_common': True},
+        {'text': 'Load', 'file_path': 'game/script.rpy', 'line_number': 7, 'is_deep_scan': True},
+        {'text': 'Quit', 'file_path': 'game/other.rpy', 'line_number': 8},
+    ]
+
+
+def test_spilled_collector_matches_in_memory_dedup(tmp_path):
+    in_memory = SourceTextCollector()
+    spilled = SourceTextCollector(threshold=1, directory=str(tmp_path))
+    for entry in _entries():
+        in_memory.add(dict(entry))
+        spilled.add(dict(entry))
+
+    assert not in_memory.spilled and spilled.spilled
+    assert list(spilled) == list(in_memory)
+    assert [e['line_number'] for e in spilled] == [4, 7, 5]
+    assert len(spilled) == 3 and spilled.total == in_memory.total == 8
+    assert 'Quit' in spilled and 'Options' not in spilled
+
+    spilled.close()
+    assert os.listdir(tmp_path) == []
+
+
+def test_spill_store_streams_translation_queue(tmp_path):
+    with SpillStore(str(tmp_path)) as store:
+        store.add_pending(['a', 'b', 'a', '', 'c'])
+        assert store.pending_count() == 3
+
+        for chunk in store.iter_pending(2):
+            store.put_translations((text, text.upper()) for text in chunk if text != 'b')
+
+        assert store.translation_count() == 2
+        assert store.lookup_translations(['c', 'b', 'a', 'c']) == {'c': 'C', 'a': 'A'}
+    assert os.listdir(tmp_path) == []
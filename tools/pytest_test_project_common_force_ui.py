@@ -20,6 +20,13 @@ sys.modules['src.core.parser'] = parser_module
 spec.loader.exec_module(parser_module)
 RenPyParser = getattr(parser_module, 'RenPyParser')
 
+# spill_store has no package-relative imports; load it the same way
+SPILL_PATH = project_root / 'src' / 'core' / 'spill_store.py'
+spec_spill = importlib.util.spec_from_file_location('src.core.spill_store', str(SPILL_PATH))
+spill_module = importlib.util.module_from_spec(spec_spill)
+sys.modules['src.core.spill_store'] = spill_module
+spec_spill.loader.exec_module(spill_module)
+
 # Load simple ConfigManager via importlib
 CONFIG_PATH = project_root / 'src' / 'utils' / 'config.py'
 spec2 = importlib.util.spec_from_file_location('src.utils.config', str(CONFIG_PATH))